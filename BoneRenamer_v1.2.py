@@ -1,24 +1,64 @@
-import bpy
+import csv
+import hashlib
+import json
+import mmap
+import os
+import random
+import re
+import sqlite3
+import struct
+import subprocess
+import sys
 import threading
 import time
+from array import array
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from importlib.util import find_spec
+from collections import OrderedDict, deque
+from contextlib import contextmanager, redirect_stdout
 from functools import lru_cache
-from typing import Tuple, List, Dict
-from bpy.types import Panel, Operator, PropertyGroup
-from bpy.props import StringProperty, BoolProperty, EnumProperty, FloatProperty
+from itertools import chain, islice
+from typing import Tuple, List, Dict, Iterable, Iterator, TextIO, Callable
+from unicodedata import normalize
 
 try:
-    from googletrans import Translator
-    GOOGLE_TRANSLATE_AVAILABLE = True
+    import bpy
+    from bpy.types import Panel, Operator, PropertyGroup
+    from bpy.props import StringProperty, BoolProperty, EnumProperty, FloatProperty
+    from bpy.app.handlers import persistent
+    BPY_AVAILABLE = True
 except ImportError:
-    GOOGLE_TRANSLATE_AVAILABLE = False
-    print("GoogleTrans not available. Install using: pip install googletrans==3.1.0a0")
+    # Running outside Blender: the naming engine and command line still work,
+    # the addon classes below are defined but never registered
+    bpy = None
+    Panel = Operator = PropertyGroup = object
+    
+    def _headless_property(*args, **kwargs):
+        return None
+    
+    StringProperty = BoolProperty = EnumProperty = FloatProperty = _headless_property
+    
+    def persistent(func):
+        return func
+    
+    BPY_AVAILABLE = False
+
+# googletrans (and its HTTP stack) is only imported on first online use
+GOOGLE_TRANSLATE_AVAILABLE = find_spec("googletrans") is not None
+if not GOOGLE_TRANSLATE_AVAILABLE:
+    print("GoogleTrans not available. Install using: pip install googletrans==3.1.0a0", file=sys.stderr)
+
+# Maximum number of online translation requests in flight at once
+MAX_TRANSLATION_WORKERS = 8
 
 # Type definitions for better code clarity
 BoneMapping = Tuple[str, ...]
 BoneMappingList = List[BoneMapping]
 
 # Bone name mappings for different formats
-# Format order: [MMD English, XNALara, DAZ/Poser, Blender Rigify, Sims 2, Motion Builder, 3ds Max, Unknown, BEPu, MMD Japanese, MMD Japanese LR]
+# Format order: [MMD English, XNALara, DAZ/Poser, Blender Rigify, Sims 2, Motion Builder, 3ds Max, Type X, BEPu, MMD Japanese, MMD Japanese LR]
+# Every row must have one entry per format; use "" where a format has no such bone
 BONE_NAMES: BoneMappingList = [
     ("root", "root ground", "", "root", "auskel", "", "", "", "", "全ての親", "全ての親"), 
       
@@ -46,42 +86,42 @@ BONE_NAMES: BoneMappingList = [
     ("ankle_R", "leg right ankle", "rFoot", "foot.R", "r_foot", "RightFoot", "RightAnkle", "Right Foot", 'foot.R', "右足首", "足首.R"),
 
     ("toe_L", "leg left toes", "lToe", "toe.L", "l_toe", 'LeftToeBase', "LeftToe", "Left Toe", 'toe1-1.L', "左つま先", "つま先.L"),
-    ("toe_R", "leg right toes", "rToe", "toe.R", "r_toe", 'RightToeBase', "RightToe", 'toe1-1.R',"Right Toe", "右つま先", "つま先.R"),
+    ("toe_R", "leg right toes", "rToe", "toe.R", "r_toe", 'RightToeBase', "RightToe", "Right Toe", 'toe1-1.R', "右つま先", "つま先.R"),
     ("eye_L", "head eyeball left", "leftEye", "eye.L", "l_eye", "LeftEye", "LeftEye", "Left Eye", 'eye.L', "左目", "目.L"),
     ("eye_R", "head eyeball right", "rightEye", "eye.R", "r_eye", "RightEye", "RightEye", "Right Eye", 'eye.R', "右目", "目.R"),
 ]
 
 FINGER_BONES: BoneMappingList = [
-    ("thumb1_L", "arm left finger 1b", "lThumb2", "thumb.02.L", "l_thumb1", 'LeftHandThumb2', 'LeftFinger01', 'finger1-3.L', "左親指１", "親指１.L"),
-    ("thumb2_L", "arm left finger 1c", "lThumb3", "thumb.03.L", "l_thumb2", 'LeftHandThumb3', 'LeftFinger02', 'finger1-4.L', "左親指２", "親指２.L"),
-    ("fore1_L", "arm left finger 2a", "lIndex1", "f_index.01.L", "l_index0", 'LeftHandIndex1', 'LeftFinger1', 'finger2-2.L', "左人指１", "人指１.L"),
-    ("fore2_L", "arm left finger 2b", "lIndex2", "f_index.02.L", "l_index1", 'LeftHandIndex2', 'LeftFinger11', 'finger2-3.L', "左人指２", "人指２.L"),
-    ("fore3_L", "arm left finger 2c", "lIndex3", "f_index.03.L", "l_index2", 'LeftHandIndex3', 'LeftFinger12', 'finger2-4.L', "左人指３", "人指３.L"),
-    ("middle1_L", "arm left finger 3a", "lMid1", "f_middle.01.L", "l_mid0", 'LeftHandMiddle1', 'LeftFinger2', 'finger3-2.L', "左中指１", "中指１.L"),
-    ("middle2_L", "arm left finger 3b", "lMid2", "f_middle.02.L", "l_mid1", 'LeftHandMiddle2', 'LeftFinger21', 'finger3-3.L', "左中指２", "中指２.L"),
-    ("middle3_L", "arm left finger 3c", "lMid3", "f_middle.03.L", "l_mid2", 'LeftHandMiddle3', 'LeftFinger22', 'finger3-4.L', "左中指３", "中指３.L"),
-    ("third1_L", "arm left finger 4a", "lRing1", "f_ring.01.L", "l_ring0", 'LeftHandRing1', 'LeftFinger3', 'finger4-2.L', "左薬指１", "薬指１.L"),
-    ("third2_L", "arm left finger 4b", "lRing2", "f_ring.02.L", "l_ring1", 'LeftHandRing2', 'LeftFinger31', 'finger4-3.L', "左薬指２", "薬指２.L"),
-    ("third3_L", "arm left finger 4c", "lRing3", "f_ring.03.L", "l_ring2", 'LeftHandRing3', 'LeftFinger32', 'finger4-4.L', "左薬指３", "薬指３.L"),
-    ("little1_L", "arm left finger 5a", "lPinky1", "f_pinky.01.L", "l_pinky0", 'LeftHandPinky1', 'LeftFinger4', 'finger5-2.L', "左小指１", "小指１.L"),
-    ("little2_L", "arm left finger 5b", "lPinky2", "f_pinky.02.L", "l_pinky1", 'LeftHandPinky2', 'LeftFinger41', 'finger5-3.L', "左小指２", "小指２.L"),
-    ("little3_L", "arm left finger 5c", "lPinky3", "f_pinky.03.L", "l_pinky2", 'LeftHandPinky3', 'LeftFinger42', 'finger5-4.L', "左小指３", "小指３.L"),
-    ("thumb1_R", "arm right finger 1b", "rThumb2", "thumb.02.R", "r_thumb1", 'RightHandThumb2', 'RightFinger01', 'finger1-3.R', "右親指１", "親指１.R"),
-    ("thumb2_R", "arm right finger 1c", "rThumb3", "thumb.03.R", "r_thumb2", 'RightHandThumb3', 'RightFinger02', 'finger1-4.R', "右親指２", "親指２.R"),
-    ("fore1_R", "arm right finger 2a", "rIndex1", "f_index.01.R", "r_index0", 'RightHandIndex1', 'RightFinger1', 'finger2-2.R', "右人指１", "人指１.R"),
-    ("fore2_R", "arm right finger 2b", "rIndex2", "f_index.02.R", "r_index1", 'RightHandIndex2', 'RightFinger11', 'finger2-3.R', "右人指２", "人指２.R"),
-    ("fore3_R", "arm right finger 2c", "rIndex3", "f_index.03.R", "r_index2", 'RightHandIndex3', 'RightFinger12', 'finger2-4.R', "右人指３", "人指３.R"),
-    ("middle1_R", "arm right finger 3a", "rMid1", "f_middle.01.R", "r_mid0", 'RightHandMiddle1', 'RightFinger2', 'finger3-2.R', "右中指１", "中指１.R"),
-    ("middle2_R", "arm right finger 3b", "rMid2", "f_middle.02.R", "r_mid1", 'RightHandMiddle2', 'RightFinger21', 'finger3-3.R', "右中指２", "中指２.R"),
-    ("middle3_R", "arm right finger 3c", "rMid3", "f_middle.03.R", "r_mid2", 'RightHandMiddle3', 'RightFinger22', 'finger3-4.R', "右中指３", "中指３.R"),
-    ("third1_R", "arm right finger 4a", "rRing1", "f_ring.01.R", "r_ring0", 'RightHandRing1', 'RightFinger3', 'finger4-2.R', "右薬指１", "薬指１.R"),
-    ("third2_R", "arm right finger 4b", "rRing2", "f_ring.02.R", "r_ring1", 'RightHandRing2', 'RightFinger31', 'finger4-3.R', "右薬指２", "薬指２.R"),
-    ("third3_R", "arm right finger 4c", "rRing3", "f_ring.03.R", "r_ring2", 'RightHandRing3', 'RightFinger32', 'finger4-4.R', "右薬指３", "薬指３.R"),
-    ("little1_R", "arm right finger 5a", "rPinky1", "f_pinky.01.R", "r_pinky0", 'RightHandPinky1', 'RightFinger4', 'finger5-2.R', "右小指１", "小指１.R"),
-    ("little2_R", "arm right finger 5b", "rPinky2", "f_pinky.02.R", "r_pinky1", 'RightHandPinky2', 'RightFinger41', 'finger5-3.R', "右小指２", "小指２.R"),
-    ("little3_R", "arm right finger 5c", "rPinky3", "f_pinky.03.R", "r_pinky2", 'RightHandPinky3', 'RightFinger42', 'finger5-4.R', "右小指３", "小指３.R"),
-    ("thumb0_L", "arm left finger 1a", "lThumb1", "thumb.01.L", "l_thumb0", 'LeftHandThumb1', 'LeftFinger0', 'finger1-2.L', "左親指0", "親指0.L"),
-    ("thumb0_R", "arm right finger 1a", "rThumb1", "thumb.01.R", "r_thumb0", 'RightHandThumb1', 'RightFinger0', 'finger1-2.R', "右親指0", "親指0.R"),
+    ("thumb1_L", "arm left finger 1b", "lThumb2", "thumb.02.L", "l_thumb1", 'LeftHandThumb2', 'LeftFinger01', "", 'finger1-3.L', "左親指１", "親指１.L"),
+    ("thumb2_L", "arm left finger 1c", "lThumb3", "thumb.03.L", "l_thumb2", 'LeftHandThumb3', 'LeftFinger02', "", 'finger1-4.L', "左親指２", "親指２.L"),
+    ("fore1_L", "arm left finger 2a", "lIndex1", "f_index.01.L", "l_index0", 'LeftHandIndex1', 'LeftFinger1', "", 'finger2-2.L', "左人指１", "人指１.L"),
+    ("fore2_L", "arm left finger 2b", "lIndex2", "f_index.02.L", "l_index1", 'LeftHandIndex2', 'LeftFinger11', "", 'finger2-3.L', "左人指２", "人指２.L"),
+    ("fore3_L", "arm left finger 2c", "lIndex3", "f_index.03.L", "l_index2", 'LeftHandIndex3', 'LeftFinger12', "", 'finger2-4.L', "左人指３", "人指３.L"),
+    ("middle1_L", "arm left finger 3a", "lMid1", "f_middle.01.L", "l_mid0", 'LeftHandMiddle1', 'LeftFinger2', "", 'finger3-2.L', "左中指１", "中指１.L"),
+    ("middle2_L", "arm left finger 3b", "lMid2", "f_middle.02.L", "l_mid1", 'LeftHandMiddle2', 'LeftFinger21', "", 'finger3-3.L', "左中指２", "中指２.L"),
+    ("middle3_L", "arm left finger 3c", "lMid3", "f_middle.03.L", "l_mid2", 'LeftHandMiddle3', 'LeftFinger22', "", 'finger3-4.L', "左中指３", "中指３.L"),
+    ("third1_L", "arm left finger 4a", "lRing1", "f_ring.01.L", "l_ring0", 'LeftHandRing1', 'LeftFinger3', "", 'finger4-2.L', "左薬指１", "薬指１.L"),
+    ("third2_L", "arm left finger 4b", "lRing2", "f_ring.02.L", "l_ring1", 'LeftHandRing2', 'LeftFinger31', "", 'finger4-3.L', "左薬指２", "薬指２.L"),
+    ("third3_L", "arm left finger 4c", "lRing3", "f_ring.03.L", "l_ring2", 'LeftHandRing3', 'LeftFinger32', "", 'finger4-4.L', "左薬指３", "薬指３.L"),
+    ("little1_L", "arm left finger 5a", "lPinky1", "f_pinky.01.L", "l_pinky0", 'LeftHandPinky1', 'LeftFinger4', "", 'finger5-2.L', "左小指１", "小指１.L"),
+    ("little2_L", "arm left finger 5b", "lPinky2", "f_pinky.02.L", "l_pinky1", 'LeftHandPinky2', 'LeftFinger41', "", 'finger5-3.L', "左小指２", "小指２.L"),
+    ("little3_L", "arm left finger 5c", "lPinky3", "f_pinky.03.L", "l_pinky2", 'LeftHandPinky3', 'LeftFinger42', "", 'finger5-4.L', "左小指３", "小指３.L"),
+    ("thumb1_R", "arm right finger 1b", "rThumb2", "thumb.02.R", "r_thumb1", 'RightHandThumb2', 'RightFinger01', "", 'finger1-3.R', "右親指１", "親指１.R"),
+    ("thumb2_R", "arm right finger 1c", "rThumb3", "thumb.03.R", "r_thumb2", 'RightHandThumb3', 'RightFinger02', "", 'finger1-4.R', "右親指２", "親指２.R"),
+    ("fore1_R", "arm right finger 2a", "rIndex1", "f_index.01.R", "r_index0", 'RightHandIndex1', 'RightFinger1', "", 'finger2-2.R', "右人指１", "人指１.R"),
+    ("fore2_R", "arm right finger 2b", "rIndex2", "f_index.02.R", "r_index1", 'RightHandIndex2', 'RightFinger11', "", 'finger2-3.R', "右人指２", "人指２.R"),
+    ("fore3_R", "arm right finger 2c", "rIndex3", "f_index.03.R", "r_index2", 'RightHandIndex3', 'RightFinger12', "", 'finger2-4.R', "右人指３", "人指３.R"),
+    ("middle1_R", "arm right finger 3a", "rMid1", "f_middle.01.R", "r_mid0", 'RightHandMiddle1', 'RightFinger2', "", 'finger3-2.R', "右中指１", "中指１.R"),
+    ("middle2_R", "arm right finger 3b", "rMid2", "f_middle.02.R", "r_mid1", 'RightHandMiddle2', 'RightFinger21', "", 'finger3-3.R', "右中指２", "中指２.R"),
+    ("middle3_R", "arm right finger 3c", "rMid3", "f_middle.03.R", "r_mid2", 'RightHandMiddle3', 'RightFinger22', "", 'finger3-4.R', "右中指３", "中指３.R"),
+    ("third1_R", "arm right finger 4a", "rRing1", "f_ring.01.R", "r_ring0", 'RightHandRing1', 'RightFinger3', "", 'finger4-2.R', "右薬指１", "薬指１.R"),
+    ("third2_R", "arm right finger 4b", "rRing2", "f_ring.02.R", "r_ring1", 'RightHandRing2', 'RightFinger31', "", 'finger4-3.R', "右薬指２", "薬指２.R"),
+    ("third3_R", "arm right finger 4c", "rRing3", "f_ring.03.R", "r_ring2", 'RightHandRing3', 'RightFinger32', "", 'finger4-4.R', "右薬指３", "薬指３.R"),
+    ("little1_R", "arm right finger 5a", "rPinky1", "f_pinky.01.R", "r_pinky0", 'RightHandPinky1', 'RightFinger4', "", 'finger5-2.R', "右小指１", "小指１.R"),
+    ("little2_R", "arm right finger 5b", "rPinky2", "f_pinky.02.R", "r_pinky1", 'RightHandPinky2', 'RightFinger41', "", 'finger5-3.R', "右小指２", "小指２.R"),
+    ("little3_R", "arm right finger 5c", "rPinky3", "f_pinky.03.R", "r_pinky2", 'RightHandPinky3', 'RightFinger42', "", 'finger5-4.R', "右小指３", "小指３.R"),
+    ("thumb0_L", "arm left finger 1a", "lThumb1", "thumb.01.L", "l_thumb0", 'LeftHandThumb1', 'LeftFinger0', "", 'finger1-2.L', "左親指0", "親指0.L"),
+    ("thumb0_R", "arm right finger 1a", "rThumb1", "thumb.01.R", "r_thumb0", 'RightHandThumb1', 'RightFinger0', "", 'finger1-2.R', "右親指0", "親指0.R"),
 ]
 
 JP_TO_EN_MAPPING = [
@@ -221,10 +261,79 @@ BONE_MAPS = [
     ('unknown', 'Unknown', 'Unknown bone format')
 ]
 
-def show_message(message: str, title: str = "Message", icon: str = 'INFO'):
-    def draw(self, context):
-        self.layout.label(text=message)
-    bpy.context.window_manager.popup_menu(draw, title=title, icon=icon)
+# Column of each concrete format in BONE_NAMES and FINGER_BONES ('unknown' has none)
+FORMAT_COLUMNS = {key: index for index, (key, _, _) in enumerate(BONE_MAPS) if key != 'unknown'}
+
+_MIRROR_PATTERN = re.compile(r'左|右|Left|Right|left|right|LEFT|RIGHT|[._][LRlr]$|^[lr](?=[A-Z_])')
+_MIRROR_SWAPS = {
+    '左': '右', '右': '左',
+    'Left': 'Right', 'Right': 'Left', 'left': 'right', 'right': 'left', 'LEFT': 'RIGHT', 'RIGHT': 'LEFT',
+    'L': 'R', 'R': 'L', 'l': 'r', 'r': 'l',
+}
+
+def mirror_bone_name(name: str) -> str:
+    """Swap the side markers in a bone name, e.g. 左腕 -> 右腕, lCollar -> rCollar, hand.L -> hand.R"""
+    def swap(match):
+        token = match.group()
+        return token[:-1] + _MIRROR_SWAPS[token[-1]] if len(token) <= 2 else _MIRROR_SWAPS[token]
+    return _MIRROR_PATTERN.sub(swap, name)
+
+def validate_bone_table(rows: BoneMappingList, table: str) -> List[str]:
+    """
+    Check a bone table for rows that would silently misindex
+    
+    Every row must have one column per format, a name may appear only once
+    per column, and the left and right rows of a mirrored pair must mirror
+    each other in every column, which catches cells swapped between columns.
+    
+    Returns:
+        List[str]: Descriptions of the problems found
+    """
+    problems = []
+    width = len(FORMAT_COLUMNS)
+    columns = {index: key for key, index in FORMAT_COLUMNS.items()}
+    
+    for row in rows:
+        if len(row) != width:
+            problems.append(f"{table} row {row[0]!r} has {len(row)} columns, expected {width}")
+    rows = [row for row in rows if len(row) == width]
+    
+    for index, key in columns.items():
+        seen = set()
+        for row in rows:
+            if row[index] and row[index] in seen:
+                problems.append(f"{table} column {key!r} lists {row[index]!r} more than once")
+            seen.add(row[index])
+    
+    by_name = {row[0]: row for row in rows}
+    for row in rows:
+        mirrored = by_name.get(mirror_bone_name(row[0]))
+        if mirrored is None or mirrored is row or not row[0].endswith('_L'):
+            continue
+        for index, key in columns.items():
+            if mirror_bone_name(row[index]) != mirrored[index]:
+                problems.append(
+                    f"{table} rows {row[0]!r}/{mirrored[0]!r} do not mirror in column {key!r}: "
+                    f"{row[index]!r} vs {mirrored[index]!r}"
+                )
+    return problems
+
+def convert_bone_names(bone_names: Iterable[str], source_format: str, target_format: str,
+                       include_fingers: bool = True) -> Dict[str, str]:
+    """
+    Map bone names from one naming format to another
+    
+    Returns:
+        Dict[str, str]: Target name for every input name found in the tables
+        
+    Raises:
+        ValueError: If either format has no name table
+    """
+    if source_format == target_format:
+        return {}
+    if source_format not in FORMAT_COLUMNS or target_format not in FORMAT_COLUMNS:
+        raise ValueError(f"Cannot convert from {source_format!r} to {target_format!r}: no bone table for that format")
+    return get_vocabulary().convert(bone_names, source_format, target_format, include_fingers)
 
 JP_BONE_MAPPING = {
     # Basic body parts
@@ -308,329 +417,3250 @@ JP_BONE_MAPPING = {
     "エクステ": "extension",
 }
 
-class TranslationCache:
-    """Thread-safe translation cache"""
-    def __init__(self):
-        self._cache = {}
-        self._lock = threading.Lock()
+def compile_trie(entries: Iterable[Tuple[str, str]], value_id: Callable[[str], int]) -> Tuple[array, array, array, array]:
+    """
+    Flatten dictionary entries into a character trie of four uint32 arrays
     
-    def get(self, key):
-        with self._lock:
-            return self._cache.get(key)
+    Node 0 is the root. The edges of node n are edge_chars[edge_start[n]:
+    edge_start[n + 1]], sorted by code point, leading to the nodes in
+    edge_targets, and node_values[n] is value_id() of the replacement of
+    the key ending at n, or 0 if none does. Later entries with the same key
+    are ignored.
     
-    def set(self, key, value):
-        with self._lock:
-            self._cache[key] = value
-
-# Global translation cache
-translation_cache = TranslationCache()
+    Returns:
+        Tuple[array, array, array, array]: edge_start, edge_chars, edge_targets, node_values
+    """
+    children = [{}]
+    values = [0]
+    for key, value in entries:
+        if not key:
+            continue
+        node = 0
+        for char in key:
+            child = children[node].get(char)
+            if child is None:
+                child = children[node][char] = len(children)
+                children.append({})
+                values.append(0)
+            node = child
+        if not values[node]:
+            values[node] = value_id(value)
+    
+    edge_start = array('I', [0])
+    edge_chars = array('I')
+    edge_targets = array('I')
+    for edges in children:
+        for char in sorted(edges):
+            edge_chars.append(ord(char))
+            edge_targets.append(edges[char])
+        edge_start.append(len(edge_chars))
+    return edge_start, edge_chars, edge_targets, array('I', values)
 
-class AsyncTranslator:
-    """Handles asynchronous translation requests"""
-    def __init__(self):
-        self.translator = Translator()
-        self.timeout = 2.0  # Translation timeout in seconds
+class DictionaryMatcher:
+    """
+    Dictionary compiled into a character trie
+    
+    translate() walks the text once, replacing the longest entry that starts
+    at each position and copying unmatched characters through. Replacements
+    are never rescanned, so a short key cannot match inside text that a
+    longer key has already translated. The trie is the flat arrays of
+    compile_trie(), so a Vocabulary can serve it straight from its file.
+    """
+    def __init__(self, mapping: Dict[str, str] = None):
+        replacements = [""]
         
-    @lru_cache(maxsize=1000)
-    def translate_text(self, text: str, src='ja', dest='en') -> str:
-        """Translate text with caching and timeout"""
+        def value_id(value):
+            replacements.append(value)
+            return len(replacements) - 1
+        
+        self.edge_start, self.edge_chars, self.edge_targets, self.node_values = \
+            compile_trie((mapping or {}).items(), value_id)
+        self.string = replacements.__getitem__
+    
+    @classmethod
+    def from_arrays(cls, edge_start, edge_chars, edge_targets, node_values,
+                    string: Callable[[int], str]) -> 'DictionaryMatcher':
+        """Matcher over a trie compiled before, e.g. mapped from a vocabulary file"""
+        matcher = cls.__new__(cls)
+        matcher.edge_start, matcher.edge_chars, matcher.edge_targets, matcher.node_values = \
+            edge_start, edge_chars, edge_targets, node_values
+        matcher.string = string
+        return matcher
+    
+    def translate(self, text: str) -> str:
+        """Replace dictionary entries in text, leftmost-longest first"""
+        edge_start, edge_chars, edge_targets, node_values = \
+            self.edge_start, self.edge_chars, self.edge_targets, self.node_values
+        codes = [ord(char) for char in text]
+        parts = []
+        i = 0
+        length = len(codes)
+        while i < length:
+            node = 0
+            end = value = 0
+            j = i
+            while j < length:
+                low, high = edge_start[node], edge_start[node + 1]
+                code = codes[j]
+                edge = bisect_left(edge_chars, code, low, high)
+                if edge == high or edge_chars[edge] != code:
+                    break
+                node = edge_targets[edge]
+                j += 1
+                if node_values[node]:
+                    end, value = j, node_values[node]
+            if value:
+                parts.append(self.string(value))
+                i = end
+            else:
+                parts.append(text[i])
+                i += 1
+        return "".join(parts)
+
+def normalize_text(text: str) -> str:
+    """NFKC-normalize text so half-width katakana and full-width digits match one form"""
+    return normalize('NFKC', text)
+
+def build_dictionary(layers: Iterable[Iterable[Tuple[str, str]]]) -> Dict[str, str]:
+    """
+    Merge dictionary layers into one normalized index
+    
+    Layers are given highest priority first. Keys are NFKC-normalized, and
+    a key keeps the translation from the first layer (and first entry
+    within that layer) that defines it.
+    """
+    merged = {}
+    for layer in layers:
+        for jp, en in layer:
+            key = normalize_text(jp)
+            if key and en and key not in merged:
+                merged[key] = en
+    return merged
+
+def load_dictionary_overlays(directory: str) -> List[Dict[str, str]]:
+    """
+    Load user dictionary overlays from the JSON files in directory
+    
+    Each file holds a {"japanese": "english"} object. Files are applied in
+    name order, so a later file overrides an earlier one.
+    
+    Returns:
+        List[Dict[str, str]]: Overlays, highest priority first
+    """
+    overlays = []
+    if not os.path.isdir(directory):
+        return overlays
+    for filename in sorted(os.listdir(directory)):
+        if not filename.endswith('.json'):
+            continue
         try:
-            # Check cache first
-            cached = translation_cache.get(text)
-            if cached:
-                return cached
-            
-            # Attempt translation
-            translation = self.translator.translate(text, src=src, dest=dest)
-            result = translation.text.lower()  # Convert to lowercase for consistency
-            
-            # Cache the result
-            translation_cache.set(text, result)
-            
-            return result
-        except Exception as e:
-            print(f"Translation error: {str(e)}")
-            return None
+            with open(os.path.join(directory, filename), encoding='utf-8') as f:
+                entries = json.load(f)
+            overlays.append({str(jp): str(en) for jp, en in entries.items()})
+        except (OSError, ValueError, AttributeError) as e:
+            print(f"Skipping dictionary overlay {filename}: {str(e)}")
+    overlays.reverse()
+    return overlays
 
-class BoneRenamerProperties(PropertyGroup):
-    source_object: StringProperty(
-        name="Source Object",
-        description="Armature to rename bones from",
-        default=""
-    )
-    source_format: EnumProperty(
-        items=BONE_MAPS,
-        name="Source Format",
-        description="Current bone naming format",
-        default='mmd_japanese'
-    )
-    target_format: EnumProperty(
-        items=BONE_MAPS,
-        name="Target Format",
-        description="Desired bone naming format",
-        default='mmd_english'
-    )
-    include_fingers: BoolProperty(
-        name="Include Fingers",
-        description="Also rename finger bones",
-        default=True
-    )
-    use_online_translation: BoolProperty(
-        name="Use Online Translation",
-        description="Use Google Translate for unknown Japanese terms (requires internet)",
-        default=True
-    )
-    translation_timeout: FloatProperty(
-        name="Translation Timeout",
-        description="Seconds to wait for online translation before falling back to static dictionary",
-        default=2.0,
-        min=0.1,
-        max=10.0
+def build_jp_dictionary(overlays: List[Dict[str, str]] = ()) -> Dict[str, str]:
+    """
+    Build the Japanese to English dictionary used by the static fallback
+    
+    Priority, highest first: user overlays, JP_BONE_MAPPING, then
+    JP_TO_EN_MAPPING. JP_TO_EN_MAPPING translations are lowercased to match
+    the style of the other sources.
+    """
+    return build_dictionary(
+        [overlay.items() for overlay in overlays] +
+        [JP_BONE_MAPPING.items(), ((jp, en.lower()) for jp, en in JP_TO_EN_MAPPING)]
     )
 
-def clean_bone_name(name: str) -> str:
-    """Clean up bone names to be more Blender-friendly"""
-    # Remove illegal characters and spaces
-    cleaned = "".join(c for c in name if c.isalnum() or c in "._-")
-    # Ensure name starts with a letter
-    if cleaned and not cleaned[0].isalpha():
-        cleaned = "bone_" + cleaned
-    return cleaned
+def get_config_dir() -> str:
+    """Bone Renamer folder in Blender's user config dir, or the platform config dir outside Blender"""
+    if BPY_AVAILABLE:
+        return bpy.utils.user_resource('CONFIG', path="bone_renamer", create=True)
+    base = os.environ.get('APPDATA') or os.environ.get('XDG_CONFIG_HOME') or os.path.join(os.path.expanduser('~'), '.config')
+    path = os.path.join(base, "bone_renamer")
+    os.makedirs(path, exist_ok=True)
+    return path
 
-def extract_lr_suffix(name: str) -> Tuple[str, str]:
-    """Extract left/right suffix from bone name"""
-    for suffix in ['.L', '.R', '_L', '_R', '.l', '.r', '_l', '_r']:
-        if name.endswith(suffix):
-            return name[:-len(suffix)], suffix
-    return name, ""
+def get_dictionary_dir() -> str:
+    """Folder for user dictionary overlays"""
+    return os.path.join(get_config_dir(), "dictionaries")
 
-class ARMATURE_OT_rename_bones(Operator):
-    bl_idname = "armature.rename_bones"
-    bl_label = "Rename Bones"
-    bl_description = "Rename bones from source format to target format"
+def get_vocabulary_path() -> str:
+    """Location of the compiled vocabulary file"""
+    return os.path.join(get_config_dir(), "vocabulary.bin")
+
+VOCABULARY_MAGIC = b"BRVOCAB\0"
+VOCABULARY_VERSION = 2
+# Written in native byte order; a file from a machine with the other byte order reads back swapped and is rebuilt
+_VOCABULARY_BYTE_ORDER = 0x01020304
+# magic, version, byte order, digest, strings, pool bytes, formats, rows, first finger row, dictionary entries,
+# trie nodes, trie edges
+_VOCABULARY_HEADER = struct.Struct('=8sII32s8I')
+
+class Vocabulary:
+    """
+    Bone tables and static dictionary in a compact columnar layout
     
-    def execute(self, context):
-        props = context.scene.bone_renamer
-        
-        # Get the armature
-        armature = bpy.data.objects.get(props.source_object)
-        if not armature:
-            self.report({'ERROR'}, "Please select a valid armature!")
-            return {'CANCELLED'}
+    Every distinct string is stored once, UTF-8 encoded, in a string pool and
+    referred to by its id (id 0 is the empty string). Each format is one
+    column of string ids with a row per bone, body rows first and finger
+    rows from finger_start on, plus its rows sorted by name for binary
+    search. The dictionary is two columns of key and translation ids and
+    the same entries compiled into a trie (see compile_trie). save() writes
+    all of it as one versioned file of aligned uint32 arrays followed by the
+    pool, which load() maps read-only. Lookups, conversion and dictionary
+    translation all read those arrays in place, so worker processes opening
+    the same file share its pages instead of each building the tables.
+    """
+    def __init__(self, formats: List[str], offsets, pool, columns, orders, finger_start: int,
+                 dictionary_keys, dictionary_values, trie, digest: bytes, mapping=None):
+        self.formats = formats
+        self.offsets = offsets
+        self.pool = pool
+        self.columns = dict(zip(formats, columns))
+        self.orders = dict(zip(formats, orders))
+        self.finger_start = finger_start
+        self.dictionary_keys = dictionary_keys
+        self.dictionary_values = dictionary_values
+        self.trie = trie
+        self.digest = digest
+        self._mapping = mapping
+        self._matchers = {}
+    
+    @classmethod
+    def build(cls, tables: Dict[str, BoneMappingList], dictionary: Dict[str, str], digest: bytes = b"") -> 'Vocabulary':
+        """
+        Intern the 'body' and 'fingers' bone tables and a dictionary
         
-        if props.source_format == 'mmd_japanese' and props.target_format == 'mmd_english':
-            # Use the Japanese to English translation
-            bpy.ops.armature.translate_jp_bones()
-            return {'FINISHED'}
+        Raises:
+            ValueError: If a table has malformed rows
+        """
+        problems = [problem for table, rows in tables.items() for problem in validate_bone_table(rows, table)]
+        if problems:
+            raise ValueError("Malformed bone tables:\n" + "\n".join(problems))
         
-        # Otherwise use the original bone mapping logic
-        try:
-            renamed_count = self.rename_bones(
-                armature, 
-                props.source_format, 
-                props.target_format, 
-                props.include_fingers
-            )
-            self.report({'INFO'}, f"Successfully renamed {renamed_count} bones")
-            return {'FINISHED'}
-        except Exception as e:
-            self.report({'ERROR'}, str(e))
-            return {'CANCELLED'}
-    
-    def rename_bones(self, armature, source_format: str, target_format: str, include_fingers: bool) -> int:
-        # Find the indices in the original format lists
-        format_mapping = {
-            'mmd_english': 0,
-            'xna_lara': 1,
-            'daz_poser': 2,
-            'blender_rigify': 3,
-            'sims_2': 4,
-            'motion_builder': 5,
-            '3ds_max': 6,
-            'type_x': 7,
-            'bepu': 8,
-            'mmd_japanese': 9,
-            'mmd_japaneseLR': 10,
-            'unknown': 11
-        }
+        ids = {"": 0}
+        encoded = [b""]
         
-        source_idx = format_mapping[source_format]
-        target_idx = format_mapping[target_format]
+        def intern(text):
+            string_id = ids.get(text)
+            if string_id is None:
+                string_id = ids[text] = len(encoded)
+                encoded.append(text.encode('utf-8'))
+            return string_id
         
-        bones = armature.data.bones
-        renamed_count = 0
+        formats = list(FORMAT_COLUMNS)
+        for key in formats:
+            intern(key)  # A saved file names its own columns
+        rows = tables['body'] + tables['fingers']
+        columns = [array('I', (intern(row[FORMAT_COLUMNS[key]]) for row in rows)) for key in formats]
+        orders = []
+        for key in formats:
+            # The first row of each name, in UTF-8 byte order (which is code point order)
+            first = {}
+            for row_index, row in enumerate(rows):
+                first.setdefault(row[FORMAT_COLUMNS[key]], row_index)
+            first.pop("", None)
+            orders.append(array('I', (first[name] for name in sorted(first))))
+        dictionary_keys = array('I', (intern(jp) for jp in dictionary))
+        dictionary_values = array('I', (intern(en) for en in dictionary.values()))
+        trie = compile_trie(dictionary.items(), intern)
         
-        # Perform the renaming
-        mappings = [(BONE_NAMES, False), (FINGER_BONES, True)]
-        for mapping_list, is_finger in mappings:
-            if is_finger and not include_fingers:
-                continue
-                
-            for mapping in mapping_list:
-                source_name = mapping[source_idx]
-                target_name = mapping[target_idx]
-                
-                if source_name and target_name and source_name in bones:
-                    bones[source_name].name = target_name
-                    renamed_count += 1
-                    
-        return renamed_count
-
-class PICK_OT_armature(Operator):
-    bl_idname = "armature.pick_source"
-    bl_label = "Pick Armature"
-    bl_description = "Pick the armature from the 3D viewport"
+        offsets = array('I', [0])
+        for data in encoded:
+            offsets.append(offsets[-1] + len(data))
+        return cls(formats, offsets, b"".join(encoded), columns, orders, len(tables['body']),
+                   dictionary_keys, dictionary_values, trie, digest)
     
-    def execute(self, context):
-        if not context.active_object:
-            show_message("No active object selected!", "Error", 'ERROR')
-            return {'CANCELLED'}
+    @classmethod
+    def load(cls, path: str) -> 'Vocabulary':
+        """
+        Map a vocabulary file written by save()
+        
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If it is not a vocabulary file, or was written by another version or byte order
+        """
+        with open(path, 'rb') as f:
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if len(mapping) < _VOCABULARY_HEADER.size:
+                raise ValueError(f"{path} is not a vocabulary file")
+            magic, version, byte_order, digest, strings, pool_size, format_count, rows, finger_start, entries, \
+                nodes, edges = _VOCABULARY_HEADER.unpack_from(mapping)
+            if magic != VOCABULARY_MAGIC:
+                raise ValueError(f"{path} is not a vocabulary file")
+            if version != VOCABULARY_VERSION:
+                raise ValueError(f"{path} has vocabulary version {version}, expected {VOCABULARY_VERSION}")
+            if byte_order != _VOCABULARY_BYTE_ORDER:
+                raise ValueError(f"{path} was written with another byte order")
             
-        if context.active_object.type != 'ARMATURE':
-            show_message("Selected object is not an armature!", "Error", 'ERROR')
-            return {'CANCELLED'}
+            words = memoryview(mapping)[_VOCABULARY_HEADER.size:]
+            if len(words) < 8 * format_count:
+                raise ValueError(f"{path} is truncated")
+            order_sizes = words[4 * format_count:8 * format_count].cast('I').tolist()
+            word_count = 2 * format_count + strings + 1 + format_count * rows + sum(order_sizes) + 2 * entries + \
+                2 * nodes + 1 + 2 * edges
+            if len(words) != word_count * 4 + pool_size:
+                raise ValueError(f"{path} is truncated")
+            pool = words[word_count * 4:]
+            words = words[:word_count * 4].cast('I')
             
-        context.scene.bone_renamer.source_object = context.active_object.name
-        show_message(f"Selected armature: {context.active_object.name}", "Success", 'INFO')
-        return {'FINISHED'}
-
-class ARMATURE_OT_toggle_names(Operator):
-    bl_idname = "armature.toggle_names"
-    bl_label = "Toggle Names Display"
-    bl_description = "Toggle visibility of bone names in viewport"
+            def take(count):
+                nonlocal words
+                section, words = words[:count], words[count:]
+                return section
+            
+            format_ids = take(format_count)
+            take(format_count)  # Order sizes, read above
+            offsets = take(strings + 1)
+            columns = [take(rows) for _ in range(format_count)]
+            orders = [take(size) for size in order_sizes]
+            dictionary_keys = take(entries)
+            dictionary_values = take(entries)
+            trie = (take(nodes + 1), take(edges), take(edges), take(nodes))
+            formats = [bytes(pool[offsets[i]:offsets[i + 1]]).decode('utf-8') for i in format_ids]
+        except Exception:
+            # The mapping cannot be closed while views into it are alive
+            words = pool = format_ids = offsets = columns = orders = dictionary_keys = dictionary_values = trie = None
+            mapping.close()
+            raise
+        return cls(formats, offsets, pool, columns, orders, finger_start, dictionary_keys, dictionary_values, trie,
+                   digest, mapping)
     
-    def execute(self, context):
-        show_names = None  # To track the first armature's state
-        toggled_count = 0
-        
-        for obj in context.scene.objects:
-            if obj.type == 'ARMATURE':
-                if show_names is None:
-                    # Use first armature's state to determine what to do
-                    show_names = not obj.data.show_names
-                
-                obj.data.show_names = show_names
-                toggled_count += 1
+    def save(self, path: str):
+        """Write the vocabulary file, replacing any previous one atomically"""
+        ids = {self.string(string_id): string_id for string_id in range(len(self.offsets) - 1)}
+        rows = len(self.columns[self.formats[0]]) if self.formats else 0
+        edge_start, edge_chars, _, node_values = self.trie
+        header = _VOCABULARY_HEADER.pack(
+            VOCABULARY_MAGIC, VOCABULARY_VERSION, _VOCABULARY_BYTE_ORDER, self.digest.ljust(32, b"\0")[:32],
+            len(self.offsets) - 1, len(self.pool), len(self.formats), rows, self.finger_start, len(self.dictionary_keys),
+            len(node_values), len(edge_chars)
+        )
+        words = array('I', (ids[key] for key in self.formats))
+        words.extend(len(self.orders[key]) for key in self.formats)
+        for section in [self.offsets] + [self.columns[key] for key in self.formats] + \
+                [self.orders[key] for key in self.formats] + \
+                [self.dictionary_keys, self.dictionary_values] + list(self.trie):
+            words.extend(section)
         
-        if toggled_count > 0:
-            state = "on" if show_names else "off"
-            show_message(f"Turned bone names display {state} for {toggled_count} armatures", "Success", 'INFO')
-        else:
-            show_message("No armatures found in scene", "Info", 'INFO')
-            
-        return {'FINISHED'}
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, 'wb') as f:
+                f.write(header)
+                f.write(words.tobytes())
+                f.write(self.pool)
+            os.replace(temp_path, path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+    
+    def string(self, string_id: int) -> str:
+        """Decode an interned string"""
+        return bytes(self.pool[self.offsets[string_id]:self.offsets[string_id + 1]]).decode('utf-8')
+    
+    def find(self, format_key: str, name: str) -> int:
+        """First row of a name in a format's column, or -1, by binary search over the sorted rows"""
+        order = self.orders[format_key]
+        column = self.columns[format_key]
+        pool, offsets = self.pool, self.offsets
+        wanted = name.encode('utf-8')
+        low, high = 0, len(order)
+        while low < high:
+            middle = (low + high) // 2
+            row = order[middle]
+            string_id = column[row]
+            found = bytes(pool[offsets[string_id]:offsets[string_id + 1]])
+            if found < wanted:
+                low = middle + 1
+            elif found > wanted:
+                high = middle
+            else:
+                return row
+        return -1
+    
+    def lookup(self, name: str, source_format: str, target_format: str, include_fingers: bool = True) -> str:
+        """Name of a bone in target_format, or "" if the tables do not list it"""
+        row = self.find(source_format, name)
+        if row < 0 or (row >= self.finger_start and not include_fingers):
+            return ""
+        return self.string(self.columns[target_format][row])
+    
+    def convert(self, bone_names: Iterable[str], source_format: str, target_format: str,
+                include_fingers: bool = True) -> Dict[str, str]:
+        """Target name for every name found in the source format's column"""
+        column = self.columns[target_format]
+        row_limit = len(column) if include_fingers else self.finger_start
+        renames = {}
+        for name in bone_names:
+            row = self.find(source_format, name)
+            if 0 <= row < row_limit and column[row]:
+                renames[name] = self.string(column[row])
+        return renames
+    
+    def rows(self, format_key: str) -> Dict[str, int]:
+        """First row of every name in a format's column"""
+        column = self.columns[format_key]
+        return {self.string(column[row]): row for row in self.orders[format_key]}
+    
+    def matcher(self, format_key: str) -> 'BoneNameMatcher':
+        """Tolerant matcher over a format's column, built on first use"""
+        matcher = self._matchers.get(format_key)
+        if matcher is None:
+            matcher = self._matchers[format_key] = BoneNameMatcher(self.rows(format_key))
+        return matcher
+    
+    def dictionary_matcher(self) -> DictionaryMatcher:
+        """Matcher translating with the compiled dictionary in place"""
+        return DictionaryMatcher.from_arrays(*self.trie, self.string)
+    
+    def dictionary_items(self) -> Iterator[Tuple[str, str]]:
+        """Dictionary entries, in priority order"""
+        string = self.string
+        for key_id, value_id in zip(self.dictionary_keys, self.dictionary_values):
+            yield string(key_id), string(value_id)
+    
+    def __len__(self) -> int:
+        return len(self.dictionary_keys)
 
-def translate_japanese_name(bone_name: str, use_online: bool = True, timeout: float = 2.0) -> str:
+def vocabulary_digest(overlay_dir: str = None) -> bytes:
+    """Fingerprint of the built-in tables and the overlay files a vocabulary is built from"""
+    digest = hashlib.sha256(json.dumps(
+        [VOCABULARY_VERSION, FORMAT_COLUMNS, BONE_NAMES, FINGER_BONES, JP_BONE_MAPPING, JP_TO_EN_MAPPING],
+        ensure_ascii=False
+    ).encode('utf-8'))
+    if overlay_dir and os.path.isdir(overlay_dir):
+        for filename in sorted(os.listdir(overlay_dir)):
+            if filename.endswith('.json'):
+                stat = os.stat(os.path.join(overlay_dir, filename))
+                digest.update(f"\0{filename}\0{stat.st_size}\0{stat.st_mtime_ns}".encode('utf-8'))
+    return digest.digest()
+
+def open_vocabulary(overlay_dir: str = None, path: str = None) -> Vocabulary:
     """
-    Translate Japanese bone name to English using multiple methods
+    Load the vocabulary file at path, rebuilding it if it is missing or out of date
     
-    Args:
-        bone_name (str): The bone name to translate
-        use_online (bool): Whether to attempt online translation
-        timeout (float): Maximum time to wait for online translation
-        
-    Returns:
-        str: The translated bone name
+    Without a path the vocabulary is only built in memory.
     """
-    base_name, suffix = extract_lr_suffix(bone_name)
-    translated_name = base_name
-    
-    # Try online translation first if enabled
-    if use_online and GOOGLE_TRANSLATE_AVAILABLE:
+    digest = vocabulary_digest(overlay_dir)
+    if path and os.path.exists(path):
         try:
-            translator = AsyncTranslator()
-            translator.timeout = timeout
-            online_translation = translator.translate_text(base_name)
-            if online_translation:
-                translated_name = online_translation
-        except Exception as e:
-            print(f"Online translation failed: {str(e)}")
-    
-    # Fallback to static dictionary if needed
-    if translated_name == base_name:
-        for jp, en in sorted(JP_BONE_MAPPING.items(), key=lambda x: len(x[0]), reverse=True):
-            if jp in translated_name:
-                translated_name = translated_name.replace(jp, en)
+            vocabulary = Vocabulary.load(path)
+            if vocabulary.digest == digest:
+                return vocabulary
+        except (OSError, ValueError) as e:
+            print(f"Rebuilding vocabulary: {str(e)}")
     
-    # Clean up the translation
-    translated_name = clean_bone_name(translated_name)
-    
-    # Reattach suffix if it existed
-    if suffix:
-        translated_name += suffix
+    overlays = load_dictionary_overlays(overlay_dir) if overlay_dir else []
+    vocabulary = Vocabulary.build({'body': BONE_NAMES, 'fingers': FINGER_BONES}, build_jp_dictionary(overlays), digest)
+    if path:
+        try:
+            vocabulary.save(path)
+        except OSError as e:
+            print(f"Could not save vocabulary: {str(e)}")
+    return vocabulary
+
+def reload_dictionaries(overlay_dir: str = None, vocabulary_path: str = None) -> int:
+    """Reload the vocabulary and rebuild the static dictionary matcher, including overlays from overlay_dir"""
+    global vocabulary, jp_matcher
+    loaded = open_vocabulary(overlay_dir, vocabulary_path)
+    matcher = loaded.dictionary_matcher()
+    vocabulary, jp_matcher = loaded, matcher
+    return len(loaded)
+
+def _load_default_vocabulary():
+    # Only one thread loads; the others wait and use its result
+    with _vocabulary_load_lock:
+        if vocabulary is not None and jp_matcher is not None:
+            return
+        if BPY_AVAILABLE:
+            reload_dictionaries(get_dictionary_dir(), get_vocabulary_path())
+        else:
+            reload_dictionaries()
+
+def get_vocabulary() -> Vocabulary:
+    """The bone tables and dictionary, loaded on first use (from the vocabulary file in Blender)"""
+    if vocabulary is None:
+        _load_default_vocabulary()
+    return vocabulary
+
+def get_jp_matcher() -> DictionaryMatcher:
+    """The compiled static dictionary, built on first use (with the user's overlays in Blender)"""
+    if jp_matcher is None:
+        _load_default_vocabulary()
+    return jp_matcher
+
+# Loaded vocabulary and the compiled matcher of its dictionary, set by reload_dictionaries()
+vocabulary = None
+jp_matcher = None
+_vocabulary_load_lock = threading.Lock()
+
+# Tolerant bone name matching
+
+# Fuzzy matches scoring below this (1 - edit distance / length of the longer key) are not used
+FUZZY_MATCH_THRESHOLD = 0.8
+# Table names sharing the most trigrams with a name that are compared by edit distance
+FUZZY_CANDIDATES = 16
+
+_MATCH_SEPARATORS = re.compile(r'[\s_\-.]+')
+# Words of a bone name: numbers, ALLCAPS, Capitalized or lowercase words, and runs of other letters (kana, kanji)
+_MATCH_TOKENS = re.compile(r'[0-9]+|[A-Z]+(?![a-z])|[A-Z]?[a-z]+|[^\W\d_A-Za-z]+')
+_DUPLICATE_SUFFIX = re.compile(r'\.[0-9]{3,}\Z')
+
+def bone_match_key(name: str) -> str:
+    """
+    Normalized form of a bone name for tolerant matching
     
-    return translated_name
+    Full-width and half-width forms are unified, a Blender ".001"-style
+    duplicate suffix is dropped, case is folded and separators are removed,
+    so 左腕.001, Left_Shoulder and ｌｅｆｔ-shoulder match 左腕 and LeftShoulder.
+    """
+    return _MATCH_SEPARATORS.sub('', _DUPLICATE_SUFFIX.sub('', normalize('NFKC', name)).casefold())
 
-class ARMATURE_OT_translate_jp_bones(Operator):
-    bl_idname = "armature.translate_jp_bones"
-    bl_label = "Translate Japanese Names"
-    bl_description = "Translate Japanese bone names to English"
+def bone_match_tokens(name: str) -> Tuple[str, ...]:
+    """Case-folded words of a bone name, e.g. ('shoulder', 'p', 'l') for shoulderP_L"""
+    return tuple(token.casefold() for token in _MATCH_TOKENS.findall(_DUPLICATE_SUFFIX.sub('', normalize('NFKC', name))))
+
+def _adds_whole_tokens(longer: Tuple[str, ...], shorter: Tuple[str, ...]) -> bool:
+    """Whether longer is shorter with whole words inserted, like shoulderP_L is shoulder_L plus P"""
+    if len(longer) <= len(shorter):
+        return False
+    remaining = iter(longer)
+    return all(token in remaining for token in shorter)
+
+def bone_side(name: str) -> str:
+    """'L' or 'R' for the first side marker in a bone name (左/右, Left/Right, .L/.R, lCollar), or an empty string"""
+    match = _MIRROR_PATTERN.search(name)
+    if match is None:
+        return ""
+    side = match.group().lstrip('._')[0].upper()
+    return {'左': 'L', '右': 'R'}.get(side, side)
+
+def bounded_edit_distance(a: str, b: str, bound: int) -> int:
+    """Levenshtein distance between a and b, or bound + 1 as soon as it is known to be larger than bound"""
+    if abs(len(a) - len(b)) > bound:
+        return bound + 1
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b)))
+        if min(current) > bound:
+            return bound + 1
+        previous = current
+    return min(previous[-1], bound + 1)
+
+def _trigrams(key: str) -> set:
+    padded = f"\0{key}\0"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+class BoneNameMatcher:
+    """
+    Tolerant lookup of bone names in one column of the bone tables
     
-    def execute(self, context):
-        props = context.scene.bone_renamer
+    A name is looked up exactly, then by its bone_match_key() in a
+    precomputed key index. Only names missing from both go to the fuzzy
+    stage: the table names sharing the most trigrams with it are compared
+    by bounded edit distance. A fuzzy candidate must be on the same side,
+    must not contradict the name's numbers (finger3-1 never matches
+    finger3-2) and must not differ from it by whole words: shoulderP_L,
+    leg D_L or upper body3 are helper bones in their own right, not
+    misspellings of shoulder_L, leg_L or upper body. A best score shared by
+    two rows is not used.
+    """
+    def __init__(self, rows: Dict[str, int]):
+        self.rows = rows
+        self.keys = {}
+        for name, row in rows.items():
+            key = bone_match_key(name)
+            if key:
+                # A key shared by two rows is ambiguous and matches neither
+                self.keys[key] = row if self.keys.get(key, row) == row else -1
         
-        # Get the armature
-        armature = bpy.data.objects.get(props.source_object)
-        if not armature or armature.type != 'ARMATURE':
-            self.report({'ERROR'}, "Please select a valid armature!")
-            return {'CANCELLED'}
+        self.candidates = {}
+        self.grams = {}
+        for name, row in rows.items():
+            key = bone_match_key(name)
+            if self.keys.get(key, -1) != row or key in self.candidates:
+                continue
+            self.candidates[key] = (row, bone_side(name), ''.join(filter(str.isdigit, key)), bone_match_tokens(name))
+            for gram in _trigrams(key):
+                self.grams.setdefault(gram, []).append(key)
+    
+    def match(self, name: str, row_limit: int, threshold: float = None,
+              taken_rows: Iterable[int] = ()) -> Tuple[int, str, float]:
+        """
+        Find the table row of a bone name
         
-        # Ensure we're in object mode
-        if context.active_object and context.active_object.mode != 'OBJECT':
-            bpy.ops.object.mode_set(mode='OBJECT')
+        Args:
+            row_limit (int): Rows from here on are not matched
+            threshold (float): Minimum fuzzy score, or None to skip the fuzzy stage
+            taken_rows: Rows the fuzzy stage may not return, e.g. those
+                other bones of the rig already matched exactly
         
-        # Perform the translation
-        bones = armature.data.bones
-        translated_count = 0
-        skipped_count = 0
-        online_count = 0
-        fallback_count = 0
+        Returns:
+            Tuple[int, str, float]: Row (-1 if none), how it was found ('exact', 'normalized' or
+            'fuzzy') and the confidence
+        """
+        row = self.rows.get(name, -1)
+        if 0 <= row < row_limit:
+            return row, 'exact', 1.0
+        key = bone_match_key(name)
+        row = self.keys.get(key, -1)
+        if 0 <= row < row_limit:
+            return row, 'normalized', 1.0
+        if threshold is None or row >= 0 or not key:
+            return -1, "", 0.0
         
-        # Create a list of bones to rename
-        bones_to_rename = []
-        for bone in bones:
-            try:
-                # Try online translation first if enabled
-                new_name = translate_japanese_name(
-                    bone.name,
-                    use_online=props.use_online_translation,
-                    timeout=props.translation_timeout
-                )
-                
-                if new_name != bone.name:
-                    bones_to_rename.append((bone, new_name))
-                    if new_name != clean_bone_name(bone.name):  # If actual translation occurred
-                        if props.use_online_translation and GOOGLE_TRANSLATE_AVAILABLE:
-                            online_count += 1
-                        else:
-                            fallback_count += 1
-                else:
-                    skipped_count += 1
-                    
+        shared = {}
+        for gram in _trigrams(key):
+            for candidate in self.grams.get(gram, ()):
+                shared[candidate] = shared.get(candidate, 0) + 1
+        side = bone_side(_DUPLICATE_SUFFIX.sub('', name))
+        digits = ''.join(filter(str.isdigit, key))
+        tokens = bone_match_tokens(name)
+        best_row, best_score = -1, 0.0
+        for candidate in sorted(shared, key=lambda candidate: (-shared[candidate], candidate))[:FUZZY_CANDIDATES]:
+            row, candidate_side, candidate_digits, candidate_tokens = self.candidates[candidate]
+            if row >= row_limit or row in taken_rows or candidate_side != side or \
+                    (candidate_digits and candidate_digits != digits) or \
+                    _adds_whole_tokens(tokens, candidate_tokens) or _adds_whole_tokens(candidate_tokens, tokens):
+                continue
+            length = max(len(key), len(candidate))
+            bound = int((1.0 - threshold) * length + 1e-9)
+            score = 1.0 - bounded_edit_distance(key, candidate, bound) / length
+            if score < threshold:
+                continue
+            if score > best_score:
+                best_row, best_score = row, score
+            elif score == best_score and row != best_row:
+                best_row = -2
+        if best_row < 0:
+            return -1, "", 0.0
+        return best_row, 'fuzzy', best_score
+
+class BoneNameMatches:
+    """
+    Result of match_bone_names
+    
+    `renames` maps every matched bone name to its target name, `matches`
+    records how each was found as (table name, method, confidence) with
+    method 'exact', 'normalized' or 'fuzzy', and `unmatched` lists the
+    names that matched nothing.
+    """
+    def __init__(self, renames: Dict[str, str], matches: Dict[str, Tuple[str, str, float]], unmatched: List[str]):
+        self.renames = renames
+        self.matches = matches
+        self.unmatched = unmatched
+    
+    def count(self, method: str) -> int:
+        return sum(1 for _, found_by, _ in self.matches.values() if found_by == method)
+    
+    def subset(self, names: Iterable[str]) -> 'BoneNameMatches':
+        """The matches of the given names only, e.g. of one armature out of a group"""
+        names = set(names)
+        return BoneNameMatches(
+            {name: new for name, new in self.renames.items() if name in names},
+            {name: match for name, match in self.matches.items() if name in names},
+            [name for name in self.unmatched if name in names],
+        )
+    
+    def report(self) -> str:
+        """Readable listing of the non-exact matches and the unmatched names"""
+        lines = [f"{len(self.matches)} bones matched: {self.count('exact')} exact, "
+                 f"{self.count('normalized')} normalized, {self.count('fuzzy')} fuzzy; {len(self.unmatched)} unmatched"]
+        for name, (table_name, method, confidence) in self.matches.items():
+            if method != 'exact':
+                lines.append(f"{name} ~ {table_name} -> {self.renames[name]} ({method}, {confidence:.2f})")
+        if self.unmatched:
+            lines.append("")
+            lines.append("Unmatched:")
+            lines += self.unmatched
+        return "\n".join(lines)
+
+def match_bone_names(bone_names: Iterable[str], source_format: str, target_format: str,
+                     include_fingers: bool = True, fuzzy_threshold: float = None) -> BoneNameMatches:
+    """
+    Map bone names from one naming format to another, tolerating variants
+    
+    Like convert_bone_names, but names that differ from a table entry only
+    by case, separators, character width or a ".001" suffix are matched
+    too, and with a fuzzy_threshold so are near misses scoring at least
+    that much. Converting a format to itself tidies such variants into
+    the table's spelling. Fuzzy matching runs only after every name has
+    been looked up exactly and by key: it never takes a row another bone
+    already matched that way, and a row two bones match approximately is
+    left to neither. Each name is looked up at most twice, so the cost
+    stays linear in the number of bones.
+    
+    Raises:
+        ValueError: If either format has no name table
+    """
+    if source_format not in FORMAT_COLUMNS or target_format not in FORMAT_COLUMNS:
+        raise ValueError(f"Cannot convert from {source_format!r} to {target_format!r}: no bone table for that format")
+    vocabulary = get_vocabulary()
+    matcher = vocabulary.matcher(source_format)
+    source_column = vocabulary.columns[source_format]
+    target_column = vocabulary.columns[target_format]
+    row_limit = len(target_column) if include_fingers else vocabulary.finger_start
+    
+    found = {}
+    misses = []
+    for name in dict.fromkeys(bone_names):
+        row, method, confidence = matcher.match(name, row_limit)
+        if row < 0:
+            misses.append(name)
+        else:
+            found[name] = (row, method, confidence)
+    
+    if fuzzy_threshold is not None and misses:
+        taken = {row for row, _, _ in found.values()}
+        fuzzy = {}
+        for name in misses:
+            row, method, confidence = matcher.match(name, row_limit, fuzzy_threshold, taken)
+            if row >= 0:
+                fuzzy[name] = (row, method, confidence)
+        claims = {}
+        for row, _, _ in fuzzy.values():
+            claims[row] = claims.get(row, 0) + 1
+        found.update((name, match) for name, match in fuzzy.items() if claims[match[0]] == 1)
+    
+    renames, matches, unmatched = {}, {}, []
+    for name in dict.fromkeys(bone_names):
+        row, method, confidence = found.get(name, (-1, "", 0.0))
+        if row < 0 or not target_column[row]:
+            unmatched.append(name)
+            continue
+        matches[name] = (vocabulary.string(source_column[row]), method, confidence)
+        renames[name] = vocabulary.string(target_column[row])
+    return BoneNameMatches(renames, matches, unmatched)
+
+# Translation cache keys are (translator, source language, target language, text)
+CacheKey = Tuple[str, str, str, str]
+
+def translation_key(text: str, src: str = 'ja', dest: str = 'en', translator: str = 'googletrans') -> CacheKey:
+    """Build the cache key for a translation"""
+    return (translator, src, dest, text)
+
+class TranslationCache:
+    """Thread-safe translation cache"""
+    def __init__(self):
+        self._cache = {}
+        self._lock = threading.Lock()
+    
+    def get(self, key):
+        with self._lock:
+            return self._cache.get(key)
+    
+    def set(self, key, value):
+        with self._lock:
+            self._cache[key] = value
+    
+    def close(self):
+        pass
+
+class PersistentTranslationCache(TranslationCache):
+    """
+    Translation cache backed by an SQLite file
+    
+    Lookups are served from memory and fall through to the database, so
+    entries written by another Blender instance are picked up. SQLite's WAL
+    mode and busy timeout make it safe for several processes to share one
+    file. Entries older than `max_age_days` are dropped, and once the file
+    holds more than `max_entries` the oldest ones are evicted.
+    """
+    def __init__(self, path: str, max_entries: int = 200000, max_age_days: float = 180.0):
+        super().__init__()
+        self.path = path
+        self.max_entries = max_entries
+        self.max_age = max_age_days * 86400.0
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._db = sqlite3.connect(path, timeout=10.0, check_same_thread=False)
+        with self._lock, self._db:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS translations ("
+                "translator TEXT NOT NULL, src TEXT NOT NULL, dest TEXT NOT NULL, "
+                "text TEXT NOT NULL, result TEXT NOT NULL, created REAL NOT NULL, "
+                "PRIMARY KEY (translator, src, dest, text))"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS translations_created ON translations (created)")
+    
+    def get(self, key):
+        with self._lock:
+            value = self._cache.get(key)
+            if value is not None or self._db is None:
+                return value
+            try:
+                row = self._db.execute(
+                    "SELECT result FROM translations WHERE translator=? AND src=? AND dest=? AND text=? AND created>=?",
+                    key + (time.time() - self.max_age,)
+                ).fetchone()
+            except sqlite3.Error as e:
+                print(f"Translation cache read failed: {str(e)}")
+                return None
+            if row:
+                self._cache[key] = row[0]
+                return row[0]
+            return None
+    
+    def set(self, key, value):
+        with self._lock:
+            self._cache[key] = value
+            if self._db is None:
+                return
+            try:
+                with self._db:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO translations VALUES (?, ?, ?, ?, ?, ?)",
+                        key + (value, time.time())
+                    )
+            except sqlite3.Error as e:
+                print(f"Translation cache write failed: {str(e)}")
+    
+    def load(self) -> int:
+        """Evict stale entries and warm the in-memory cache from disk"""
+        with self._lock:
+            try:
+                with self._db:
+                    self._db.execute("DELETE FROM translations WHERE created<?", (time.time() - self.max_age,))
+                    self._db.execute(
+                        "DELETE FROM translations WHERE rowid IN ("
+                        "SELECT rowid FROM translations ORDER BY created DESC LIMIT -1 OFFSET ?)",
+                        (self.max_entries,)
+                    )
+                rows = self._db.execute("SELECT translator, src, dest, text, result FROM translations").fetchall()
+            except sqlite3.Error as e:
+                print(f"Translation cache load failed: {str(e)}")
+                return 0
+            for translator, src, dest, text, result in rows:
+                self._cache[(translator, src, dest, text)] = result
+            return len(rows)
+    
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+def get_cache_path() -> str:
+    """Location of the persistent translation cache"""
+    return os.path.join(get_config_dir(), "translations.sqlite3")
+
+# Global translation cache; in Blender the persistent one is opened on first use
+translation_cache = TranslationCache()
+# Path of the persistent cache still to be opened, set by register()
+_pending_cache_path = None
+_cache_lock = threading.Lock()
+
+def get_translation_cache() -> TranslationCache:
+    """The global translation cache, opening and warming the persistent one on first use"""
+    global translation_cache, _pending_cache_path
+    with _cache_lock:
+        if _pending_cache_path:
+            path, _pending_cache_path = _pending_cache_path, None
+            try:
+                cache = PersistentTranslationCache(path)
+                print(f"Loaded {cache.load()} cached translations")
+                translation_cache = cache
+            except (OSError, sqlite3.Error) as e:
+                print(f"Persistent translation cache unavailable: {str(e)}")
+        return translation_cache
+
+class TranslationMetrics:
+    """
+    Timings and counters for one translation run
+    
+    Stages record wall time and the number of times they ran, counters
+    record cache hits and misses, and every online request records its
+    latency and the UTF-8 size of the text it translated. `sources` tells
+    where each bone name's translation came from: 'online', 'cache' (an
+    earlier online translation), 'dictionary', 'cleaned' or 'unchanged'.
+    """
+    def __init__(self):
+        self.stages = {}  # stage -> [seconds, calls]
+        self.counters = {}
+        self.latencies = []
+        self.text_bytes = 0
+        self.sources = {}
+        self._lock = threading.Lock()
+    
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+    
+    @contextmanager
+    def stage(self, name: str):
+        """Time the body of a with block as one run of a stage"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                totals = self.stages.setdefault(name, [0.0, 0])
+                totals[0] += elapsed
+                totals[1] += 1
+    
+    def count(self, name: str, amount: int = 1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+    
+    def record_request(self, seconds: float, text_bytes: int):
+        """Record one online request and the size of the text it translated"""
+        with self._lock:
+            self.latencies.append(seconds)
+            self.text_bytes += text_bytes
+    
+    def merge(self, other: 'TranslationMetrics'):
+        """Add the measurements of another run, e.g. from a CLI worker process"""
+        with self._lock:
+            for name, (seconds, calls) in other.stages.items():
+                totals = self.stages.setdefault(name, [0.0, 0])
+                totals[0] += seconds
+                totals[1] += calls
+            for name, amount in other.counters.items():
+                self.counters[name] = self.counters.get(name, 0) + amount
+            self.latencies.extend(other.latencies)
+            self.text_bytes += other.text_bytes
+            self.sources.update(other.sources)
+    
+    def report(self) -> Dict:
+        """The measurements as a JSON-serializable dict"""
+        with self._lock:
+            latencies = sorted(self.latencies)
+            
+            def percentile(fraction):
+                if not latencies:
+                    return None
+                index = min(len(latencies) - 1, max(0, int(round(fraction * len(latencies))) - 1))
+                return round(latencies[index] * 1000, 3)
+            
+            sources = {}
+            for source in self.sources.values():
+                sources[source] = sources.get(source, 0) + 1
+            return {
+                "stages": {name: {"seconds": round(seconds, 6), "calls": calls}
+                           for name, (seconds, calls) in self.stages.items()},
+                "counters": dict(self.counters),
+                "network": {
+                    "requests": len(latencies),
+                    "text_bytes": self.text_bytes,
+                    "latency_ms": {"p50": percentile(0.5), "p90": percentile(0.9),
+                                   "p99": percentile(0.99), "max": percentile(1.0)},
+                },
+                "sources": sources,
+            }
+    
+    def export(self, path: str, log_path: str = None) -> Dict:
+        """
+        Write the report as JSON to path, and append it as one line to log_path
+        
+        Either path may be empty to skip it.
+        """
+        report = self.report()
+        if path:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2)
+        if log_path:
+            entry = dict(report, time=time.strftime('%Y-%m-%dT%H:%M:%S'))
+            with open(log_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry) + "\n")
+        return report
+
+class TranslatorBackend:
+    """
+    Interface for online translation backends
+    
+    translate() returns the raw translation, or None when there is none,
+    and may raise on network errors. Backends are pooled by
+    TranslationService, which calls each instance from one thread at a time.
+    """
+    name = "backend"  # Identity used in translation cache keys
+    
+    def translate(self, text: str, src: str = 'ja', dest: str = 'en') -> str:
+        raise NotImplementedError
+    
+    def close(self):
+        pass
+
+class GoogleTranslateBackend(TranslatorBackend):
+    """Google Translate through googletrans, reusing one keep-alive HTTP client"""
+    name = "googletrans"
+    
+    def __init__(self, timeout: float = 2.0):
+        from googletrans import Translator
+        self.translator = Translator(timeout=timeout)
+    
+    def translate(self, text: str, src: str = 'ja', dest: str = 'en') -> str:
+        return self.translator.translate(text, src=src, dest=dest).text
+    
+    def close(self):
+        client = getattr(self.translator, 'client', None)
+        if client is not None:
+            client.close()
+
+class StubTranslator(TranslatorBackend):
+    """Offline stand-in for Google Translate, answering from a fixed table"""
+    name = "stub"
+    
+    def __init__(self, translations: Dict[str, str] = None, delay: float = 0.0):
+        self.translations = dict(translations or {})
+        self.delay = delay  # Simulated network latency in seconds
+        self.calls = 0
+        self._lock = threading.Lock()
+    
+    def translate(self, text: str, src: str = 'ja', dest: str = 'en') -> str:
+        """Return the table entry for text, or None like an unknown term"""
+        with self._lock:
+            self.calls += 1
+        if self.delay:
+            time.sleep(self.delay)
+        return self.translations.get(text)
+
+class TranslationService:
+    """
+    Shared online translator with a pool of backend clients and an LRU of results
+    
+    Backends are created on demand, at most `pool_size` of them, and kept
+    for reuse so each request goes over an already open connection. Results
+    are kept in a bounded LRU that counts hits and misses.
+    
+    Failures are handled so a dead or rate-limited connection costs seconds,
+    not minutes: a request that raises is retried with exponential backoff
+    and jitter, texts that could not be translated are remembered for
+    `negative_ttl` seconds, at most `maxsize` of them, and after
+    `failure_threshold` consecutive errors the circuit opens and every
+    request fails immediately for `cooldown` seconds. After that a single
+    trial request decides whether it closes.
+    
+    Args:
+        backend_factory: Called with the request timeout to create a backend
+        name (str): Translator identity for cache keys, defaults to the
+            backend class name attribute
+    """
+    def __init__(self, backend_factory: Callable[[float], TranslatorBackend] = None,
+                 name: str = None, pool_size: int = MAX_TRANSLATION_WORKERS, maxsize: int = 4096,
+                 negative_ttl: float = 300.0, failure_threshold: int = 5, cooldown: float = 30.0,
+                 max_retries: int = 2, backoff: float = 0.25):
+        self.backend_factory = backend_factory or GoogleTranslateBackend
+        self.name = name or getattr(self.backend_factory, 'name', TranslatorBackend.name)
+        self.pool_size = pool_size
+        self.maxsize = maxsize
+        self.negative_ttl = negative_ttl
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.timeout = 2.0
+        self.hits = 0
+        self.misses = 0
+        self.negative_hits = 0
+        self.failed_calls = 0
+        self.failed_seconds = 0.0
+        self.short_circuited = 0
+        self.consecutive_failures = 0
+        self._open_until = 0.0
+        self._trial_running = False
+        self._failed = OrderedDict()  # (src, dest, text) -> time.monotonic() when the entry expires, oldest first
+        self._results = OrderedDict()
+        self._idle = []  # (backend, timeout it was created with)
+        self._created = 0
+        self._lock = threading.Lock()
+        self._available = threading.Condition(self._lock)
+    
+    @classmethod
+    def for_backend(cls, backend: TranslatorBackend) -> 'TranslationService':
+        """Service that shares a single, thread-safe backend instance, e.g. a StubTranslator"""
+        return cls(lambda timeout: backend, name=backend.name, pool_size=1 << 16)
+    
+    def set_timeout(self, timeout: float):
+        """
+        Change the request timeout; pooled clients are recreated with it
+        
+        Idle clients are closed now, clients in use when they are released.
+        """
+        with self._lock:
+            if timeout == self.timeout:
+                return
+            self.timeout = timeout
+        self.close()
+    
+    def _acquire(self) -> Tuple[TranslatorBackend, float]:
+        with self._available:
+            while not self._idle and self._created >= self.pool_size:
+                self._available.wait()
+            if self._idle:
+                return self._idle.pop()
+            self._created += 1
+            timeout = self.timeout
+        try:
+            return self.backend_factory(timeout), timeout
+        except Exception:
+            with self._available:
+                self._created -= 1
+                self._available.notify()
+            raise
+    
+    def _release(self, backend: TranslatorBackend, timeout: float):
+        with self._available:
+            stale = timeout != self.timeout
+            if stale:
+                self._created -= 1
+            else:
+                self._idle.append((backend, timeout))
+            self._available.notify()
+        if stale:
+            self._close_backends([backend])
+    
+    @property
+    def circuit_open(self) -> bool:
+        """Whether requests are currently being failed without trying the network"""
+        with self._lock:
+            return self._open_until > time.monotonic()
+    
+    def _allow_request(self) -> bool:
+        # Called with the lock held
+        if self.consecutive_failures < self.failure_threshold:
+            return True
+        if self._open_until > time.monotonic() or self._trial_running:
+            return False
+        self._trial_running = True  # Half-open: let one request through
+        return True
+    
+    def _record_failure(self, seconds: float):
+        with self._lock:
+            self.failed_calls += 1
+            self.failed_seconds += seconds
+            self.consecutive_failures += 1
+            self._trial_running = False
+            if self.consecutive_failures >= self.failure_threshold:
+                if self._open_until <= time.monotonic():
+                    print(f"Online translation failed {self.consecutive_failures} times in a row, "
+                          f"using the static dictionary for {self.cooldown:.0f}s")
+                self._open_until = time.monotonic() + self.cooldown
+    
+    def _record_success(self):
+        with self._lock:
+            self.consecutive_failures = 0
+            self._trial_running = False
+            self._open_until = 0.0
+    
+    def translate_text(self, text: str, src: str = 'ja', dest: str = 'en',
+                       metrics: TranslationMetrics = None) -> str:
+        """
+        Translate text, lowercased for consistency, or return None on failure
+        
+        Requests that reach the backend are recorded in metrics, if given.
+        """
+        key = (src, dest, text)
+        with self._lock:
+            if key in self._results:
+                self._results.move_to_end(key)
+                self.hits += 1
+                if metrics is not None:
+                    metrics.count('service_hits')
+                return self._results[key]
+            expires = self._failed.get(key)
+            if expires is not None:
+                if expires > time.monotonic():
+                    self.negative_hits += 1
+                    if metrics is not None:
+                        metrics.count('negative_hits')
+                    return None
+                del self._failed[key]
+            self.misses += 1
+        
+        result = None
+        for attempt in range(self.max_retries + 1):
+            with self._lock:
+                if not self._allow_request():
+                    self.short_circuited += 1
+                    if metrics is not None:
+                        metrics.count('short_circuited')
+                    return None
+            started = time.monotonic()
+            try:
+                backend, backend_timeout = self._acquire()
+                try:
+                    result = backend.translate(text, src=src, dest=dest)
+                finally:
+                    self._release(backend, backend_timeout)
+                    if metrics is not None:
+                        metrics.record_request(time.monotonic() - started, len(text.encode('utf-8')))
             except Exception as e:
-                self.report({'WARNING'}, f"Failed to process {bone.name}: {str(e)}")
-                skipped_count += 1
+                if metrics is not None:
+                    metrics.count('request_errors')
+                print(f"Translation error: {str(e)}")
+                # Only the request counts as failed time, not the backoff below
+                self._record_failure(time.monotonic() - started)
+                if attempt < self.max_retries:
+                    # Exponential backoff with full jitter
+                    time.sleep(random.uniform(0, self.backoff * (2 ** attempt)))
+                continue
+            self._record_success()
+            break
+        
+        result = result.lower() if result else None  # Convert to lowercase for consistency
+        with self._lock:
+            if result:
+                self._results[key] = result
+                if len(self._results) > self.maxsize:
+                    self._results.popitem(last=False)
+            else:
+                now = time.monotonic()
+                # Every entry lives as long, so expired ones are always at the front
+                while self._failed and next(iter(self._failed.values())) <= now:
+                    self._failed.popitem(last=False)
+                self._failed[key] = now + self.negative_ttl
+                self._failed.move_to_end(key)
+                if len(self._failed) > self.maxsize:
+                    self._failed.popitem(last=False)
+        return result
+    
+    def stats(self) -> Dict[str, float]:
+        """Counters since the service was created; diff two snapshots for a single run"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._results),
+                "clients": self._created,
+                "negative_hits": self.negative_hits,
+                "failed_calls": self.failed_calls,
+                "failed_seconds": self.failed_seconds,
+                "short_circuited": self.short_circuited,
+            }
+    
+    def close(self):
+        """Close the pooled clients; new ones are created on the next request"""
+        with self._available:
+            idle, self._idle = self._idle, []
+            self._created -= len(idle)
+            self._available.notify_all()
+        self._close_backends([backend for backend, _ in idle])
+    
+    @staticmethod
+    def _close_backends(backends: List[TranslatorBackend]):
+        for backend in backends:
+            try:
+                backend.close()
+            except Exception as e:
+                print(f"Closing translator failed: {str(e)}")
+
+# Global translation service, recreated in register() and closed in unregister()
+translation_service = TranslationService()
+
+# Characters not allowed in cleaned names: \w is exactly str.isalnum() plus "_"
+_ILLEGAL_NAME_CHARS = re.compile(r'[^\w.\-]')
+# Bone name parts: stem, trailing chain index (e.g. the "1_2" of 髪1_2.L) and L/R suffix
+_NAME_PARTS_PATTERN = re.compile(r'(.*?)([_\-.]?[0-9０-９]+(?:[_\-.][0-9０-９]+)*)?([._][LRlr])?\Z', re.DOTALL)
+# Memoized normalizations, bounded so a long session does not grow without limit
+NAME_MEMO_SIZE = 1 << 17
+
+@lru_cache(maxsize=NAME_MEMO_SIZE)
+def _clean(name: str) -> str:
+    cleaned = _ILLEGAL_NAME_CHARS.sub('', name)
+    if cleaned and not cleaned[0].isalpha():
+        cleaned = "bone_" + cleaned
+    return cleaned
+
+@lru_cache(maxsize=NAME_MEMO_SIZE)
+def _split(name: str) -> Tuple[str, str, str]:
+    stem, number, suffix = _NAME_PARTS_PATTERN.match(name).groups('')
+    if not stem:
+        # A bare number is the name itself, not a chain index
+        stem, number = number, ''
+    return stem, number, suffix
+
+def clean_bone_names(names: Iterable[str]) -> List[str]:
+    """
+    Clean up many bone names to be more Blender-friendly
+    
+    Characters other than letters, digits and "._-" are removed, and names
+    not starting with a letter get a "bone_" prefix.
+    """
+    return [_clean(name) for name in names]
+
+def tokenize_bone_names(names: Iterable[str]) -> Dict[str, Tuple[str, str, str]]:
+    """
+    Split bone names into lexical stem, chain number and L/R suffix in one pass
+    
+    The number is returned NFKC-normalized, so full-width digits come back
+    as ASCII. Bones of one physics chain share a stem, e.g. 髪1_1 and
+    髪1_12 both give 髪.
+    
+    Returns:
+        Dict[str, Tuple[str, str, str]]: (stem, number, suffix) for each
+            unique name, e.g. ('髪先', '2', '.L') for 髪先２.L
+    """
+    tokens = {}
+    for name in names:
+        if name not in tokens:
+            stem, number, suffix = _split(name)
+            tokens[name] = (stem, normalize_text(number) if number else number, suffix)
+    return tokens
+
+def clean_bone_name(name: str) -> str:
+    """Clean up bone names to be more Blender-friendly"""
+    return _clean(name)
+
+def extract_lr_suffix(name: str) -> Tuple[str, str]:
+    """Extract left/right suffix from bone name"""
+    stem, number, suffix = _split(name)
+    return stem + number, suffix
+
+def tokenize_bone_name(name: str) -> Tuple[str, str, str]:
+    """
+    Split a bone name into its lexical stem, chain number and L/R suffix
+    
+    Returns:
+        Tuple[str, str, str]: (stem, number, suffix), see tokenize_bone_names
+    """
+    return tokenize_bone_names((name,))[name]
+
+# Kana, CJK ideographs and punctuation, and full/half-width forms
+_JAPANESE_PATTERN = re.compile('[\u3000-\u30ff\u31f0-\u31ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff\uff00-\uffef]')
+
+def contains_japanese(text: str) -> bool:
+    """Whether text has any Japanese characters, i.e. anything worth translating"""
+    return _JAPANESE_PATTERN.search(text) is not None
+
+def translate_static(text: str) -> str:
+    """Translate text using only the static dictionary"""
+    return get_jp_matcher().translate(normalize_text(text))
+
+def fetch_online_translations(texts: List[str], translator=None, timeout: float = 2.0,
+                              max_workers: int = MAX_TRANSLATION_WORKERS,
+                              cache: TranslationCache = None,
+                              cancel: threading.Event = None,
+                              progress: Callable[[int, int], None] = None,
+                              metrics: TranslationMetrics = None,
+                              cached: set = None) -> Dict[str, str]:
+    """
+    Translate unique texts online through a bounded worker pool
+    
+    Texts found in the translation cache are answered locally and new
+    results are written back to it; the rest are sent concurrently. Each
+    request gets `timeout` seconds, so the whole stage waits at most one
+    timeout per wave of `max_workers` requests. Requests still running after
+    that are abandoned and their texts are left for the dictionary fallback.
+    Setting `cancel`, or the translator's circuit breaker opening, abandons
+    all outstanding requests the same way, and `progress` is called with
+    (finished, total) as requests complete. Cache lookups and the network
+    stage are timed in metrics, if given, and the texts answered by the
+    cache are added to `cached`, if given.
+    
+    Returns:
+        Dict[str, str]: Translations for the texts that succeeded
+    """
+    if metrics is None:
+        metrics = TranslationMetrics()
+    if cache is None:
+        cache = get_translation_cache()
+    if translator is None:
+        translator = translation_service
+    elif isinstance(translator, TranslatorBackend):
+        translator = TranslationService.for_backend(translator)
+    translator.set_timeout(timeout)
+    translator_name = translator.name
+    
+    results = {}
+    pending = []
+    with metrics.stage('cache_lookup'):
+        for text in dict.fromkeys(texts):
+            hit = cache.get(translation_key(text, translator=translator_name))
+            if hit:
+                results[text] = hit
+            else:
+                pending.append(text)
+    if cached is not None:
+        cached.update(results)
+    metrics.count('cache_hits', len(results))
+    metrics.count('cache_misses', len(pending))
+    
+    if not pending:
+        return results
+    if translator.circuit_open:
+        print(f"Online translation is unavailable, {len(pending)} names left to the static dictionary")
+        return results
+    
+    workers = max(1, min(max_workers, len(pending)))
+    waves = -(-len(pending) // workers)
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        with metrics.stage('network'):
+            futures = {executor.submit(translator.translate_text, text, metrics=metrics): text for text in pending}
+            deadline = time.monotonic() + timeout * waves
+            not_done = set(futures)
+            while not_done:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or (cancel is not None and cancel.is_set()) or translator.circuit_open:
+                    break
+                _, not_done = wait(not_done, timeout=min(remaining, 0.1))
+                if progress is not None:
+                    progress(len(futures) - len(not_done), len(futures))
+            for future in not_done:
+                future.cancel()
+        if not_done:
+            metrics.count('abandoned', len(not_done))
+            print(f"Online translation abandoned for {len(not_done)} names")
+        
+        for future in futures:
+            if future in not_done:
+                continue
+            try:
+                translation = future.result()
+            except Exception as e:
+                print(f"Online translation failed: {str(e)}")
+                continue
+            if translation:
+                text = futures[future]
+                results[text] = translation
+                cache.set(translation_key(text, translator=translator_name), translation)
+    finally:
+        executor.shutdown(wait=False)
+    
+    return results
+
+# Japanese side prefixes of MMD bone names, e.g. the 左 of 左腕
+_SIDE_PREFIXES = {'左': 'L', '右': 'R'}
+
+# Side markers that are safe to swap in translated text: 左/右, left/right at the start or as a whole
+# word, and a separated trailing L/R. left/right inside a word (bright, leftover) is left alone.
+_SIDE_TOKEN_PATTERN = re.compile(r'左|右|\A(?:left|right)|(?<![^\W_])(?:left|right)(?![^\W_])|(?<=[._\s-])[lr]\Z',
+                                 re.IGNORECASE)
+_SIDE_TOKEN_SWAPS = {'左': '右', '右': '左', 'left': 'right', 'right': 'left', 'l': 'r', 'r': 'l'}
+
+def mirror_translation(text: str) -> str:
+    """
+    Swap the side markers of a translated name, e.g. Left eye -> Right eye
+    
+    Returns:
+        str: The mirrored text, or an empty string if it has no side marker
+            that can be swapped safely
+    """
+    def swap(match):
+        token = match.group()
+        swapped = _SIDE_TOKEN_SWAPS[token.lower()]
+        if token.isupper():
+            return swapped.upper()
+        return swapped.capitalize() if token[0].isupper() else swapped
+    mirrored = _SIDE_TOKEN_PATTERN.sub(swap, text)
+    return mirrored if mirrored != text else ""
+
+def mirror_pairs(stems: Iterable[str]) -> Dict[str, str]:
+    """
+    Pair up the left and right versions of bone name stems
+    
+    A stem is paired when its mirror_bone_name() is among the stems too,
+    e.g. 左腕 and 右腕, or 左スカート前 and 右スカート前.
+    
+    Returns:
+        Dict[str, str]: The left stem of every paired right stem
+    """
+    stems = list(stems)
+    present = set(stems)
+    pairs = {}
+    for stem in stems:
+        mirrored = mirror_bone_name(stem)
+        if mirrored != stem and mirrored in present and bone_side(stem) == 'R' and mirror_bone_name(mirrored) == stem:
+            pairs[stem] = mirrored
+    return pairs
+
+def blender_side_tokens(stem: str, number: str, suffix: str) -> Tuple[str, str, str]:
+    """
+    Move the side of a tokenized bone name into a Blender .L/.R suffix
+    
+    A 左/右 prefix is dropped from the stem, so 左腕 gives ('腕', '', '.L'),
+    and _L/.l style suffixes become .L/.R.
+    """
+    side = suffix[-1:].upper()
+    if not side and len(stem) > 1 and stem[0] in _SIDE_PREFIXES:
+        side = _SIDE_PREFIXES[stem[0]]
+        stem = stem[1:]
+    return stem, number, f".{side}" if side else ""
+
+def _translate_stems(stems: List[str], use_online: bool, timeout: float, translator, max_workers: int,
+                     cancel: threading.Event, progress: Callable[[int, int], None],
+                     metrics: TranslationMetrics) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """Translate stems online and through the static dictionary; returns the translations and their sources"""
+    online = {}
+    cached = set()
+    if use_online and (translator is not None or GOOGLE_TRANSLATE_AVAILABLE):
+        # Names without Japanese have nothing for the online translator to do
+        japanese_stems = [stem for stem in stems if contains_japanese(stem)]
+        metrics.count('non_japanese_stems', len(stems) - len(japanese_stems))
+        online = fetch_online_translations(japanese_stems, translator, timeout, max_workers,
+                                           cancel=cancel, progress=progress, metrics=metrics, cached=cached)
+    
+    translated_stems = {}
+    stem_sources = {}
+    with metrics.stage('dictionary_match'):
+        for stem in stems:
+            translated_name = online.get(stem, stem)
+            if translated_name != stem:
+                stem_sources[stem] = 'cache' if stem in cached else 'online'
+            else:
+                # Fallback to static dictionary if needed
+                translated_name = translate_static(translated_name)
+                if translated_name != stem:
+                    stem_sources[stem] = 'dictionary'
+            translated_stems[stem] = translated_name
+    return translated_stems, stem_sources
+
+def translate_bone_names(bone_names: List[str], use_online: bool = True, timeout: float = 2.0,
+                         translator=None, max_workers: int = MAX_TRANSLATION_WORKERS,
+                         cancel: threading.Event = None,
+                         progress: Callable[[int, int], None] = None,
+                         metrics: TranslationMetrics = None,
+                         side_suffixes: bool = False) -> Dict[str, str]:
+    """
+    Translate many bone names at once
+    
+    Names are split into stem, chain number and L/R suffix first, so each
+    unique stem is looked up only once however many chain bones share it.
+    Of a left/right pair of stems (左腕 and 右腕) only the left one is
+    translated, and the right one is its mirror_bone_name(), which halves
+    the lookups on a typical rig and keeps both sides symmetric.
+    Only stems containing Japanese are sent online; those lookups are
+    batched through a worker pool, the static dictionary
+    fills in whatever the online stage did not answer, and the names are
+    then rebuilt from the translated stems.
+    
+    Args:
+        bone_names (List[str]): The bone names to translate
+        use_online (bool): Whether to attempt online translation
+        timeout (float): Maximum time to wait for each online request
+        translator: TranslationService, or a TranslatorBackend such as
+            StubTranslator for offline use. Defaults to the shared
+            translation_service.
+        max_workers (int): Maximum number of concurrent online requests
+        cancel (threading.Event): Set to stop waiting for online requests
+        progress: Called with (finished, total) online requests
+        metrics (TranslationMetrics): Receives stage timings, counters and
+            the source of every translation
+        side_suffixes (bool): Write the side of every name as a Blender
+            .L/.R suffix, e.g. 左腕 -> arm.L, see blender_side_tokens
+        
+    Returns:
+        Dict[str, str]: Mapping of each input name to its translation
+    """
+    if metrics is None:
+        metrics = TranslationMetrics()
+    with metrics.stage('suffix_extraction'):
+        tokens = tokenize_bone_names(bone_names)
+        if side_suffixes:
+            tokens = {name: blender_side_tokens(*parts) for name, parts in tokens.items()}
+        stems = list(dict.fromkeys(stem for stem, _, _ in tokens.values()))
+        pairs = mirror_pairs(stems)
+    metrics.count('names', len(tokens))
+    metrics.count('stems', len(stems))
+    metrics.count('mirrored_stems', len(pairs))
+    
+    options = (use_online, timeout, translator, max_workers, cancel, progress, metrics)
+    translated_stems, stem_sources = _translate_stems([stem for stem in stems if stem not in pairs], *options)
+    
+    # Derive the right side of each pair from the left. A translation without
+    # a side marker that can be swapped safely is not mirrored, so those
+    # right stems are translated too.
+    unmirrored = []
+    with metrics.stage('mirroring'):
+        for right, left in pairs.items():
+            translated = translated_stems[left]
+            mirrored = mirror_translation(translated)
+            if mirrored and mirror_translation(mirrored) == translated:
+                translated_stems[right] = mirrored
+                if left in stem_sources:
+                    stem_sources[right] = stem_sources[left]
+            else:
+                unmirrored.append(right)
+    if unmirrored:
+        more_stems, more_sources = _translate_stems(unmirrored, *options)
+        translated_stems.update(more_stems)
+        stem_sources.update(more_sources)
+    
+    # Rebuild the names, clean them up and reattach suffixes
+    with metrics.stage('cleaning'):
+        cleaned = clean_bone_names(translated_stems[stem] + number for stem, number, _ in tokens.values())
+        translations = {
+            name: clean + suffix for (name, (_, _, suffix)), clean in zip(tokens.items(), cleaned)
+        }
+    for name, (stem, _, _) in tokens.items():
+        source = stem_sources.get(stem)
+        if source is None:
+            source = 'cleaned' if translations[name] != name else 'unchanged'
+        metrics.sources[name] = source
+    return translations
+
+def translate_japanese_name(bone_name: str, use_online: bool = True, timeout: float = 2.0,
+                            side_suffixes: bool = False) -> str:
+    """
+    Translate Japanese bone name to English using multiple methods
+    
+    Args:
+        bone_name (str): The bone name to translate
+        use_online (bool): Whether to attempt online translation
+        timeout (float): Maximum time to wait for online translation
+        side_suffixes (bool): Write the side as a Blender .L/.R suffix
+        
+    Returns:
+        str: The translated bone name
+    """
+    return translate_bone_names([bone_name], use_online, timeout, side_suffixes=side_suffixes)[bone_name]
+
+class RenamePlan:
+    """
+    Collision-free plan for renaming a set of bones
+    
+    `renames` is the resolved old -> new map. `steps` is the order in which
+    to assign names so that no assignment ever hits a name that is still
+    taken; bones caught in a swap or rename cycle pass through a temporary
+    name. `conflicts` lists the targets that had to be made unique, and
+    `matches` says how the names were matched when the plan is a format
+    conversion.
+    """
+    def __init__(self, renames: Dict[str, str], steps: List[Tuple[str, str]], conflicts: List[Tuple[str, str, str]]):
+        self.renames = renames
+        self.steps = steps
+        self.conflicts = conflicts
+        self.matches = None
+    
+    def report(self) -> str:
+        """Readable dry-run listing of the plan"""
+        lines = [f"{len(self.renames)} bones to rename in {len(self.steps)} steps"]
+        lines += [f"{old} -> {new}" for old, new in self.renames.items()]
+        if self.conflicts:
+            lines.append("")
+            lines.append(f"{len(self.conflicts)} name collisions resolved:")
+            lines += [f"{old}: wanted {wanted}, using {used}" for old, wanted, used in self.conflicts]
+        if self.matches is not None:
+            lines.append("")
+            lines.append(self.matches.report())
+        return "\n".join(lines)
+    
+    def apply(self, bones, start: int = 0, stop: int = None) -> int:
+        """
+        Apply steps[start:stop] to a bone collection indexable by name
+        
+        If any assignment fails or Blender does not keep the exact name, the
+        steps applied by this call are undone before the error is raised.
+        
+        Returns:
+            int: Index of the next step to apply
+        """
+        stop = len(self.steps) if stop is None else min(stop, len(self.steps))
+        index = start
+        try:
+            while index < stop:
+                old, new = self.steps[index]
+                bone = bones[old]
+                bone.name = new
+                if bone.name != new:
+                    used = bone.name
+                    bone.name = old
+                    raise RuntimeError(f"Could not rename {old!r} to {new!r}, Blender used {used!r}")
+                index += 1
+        except Exception:
+            self.rollback(bones, index, start)
+            raise
+        return index
+    
+    def rollback(self, bones, applied: int, start: int = 0):
+        """Undo steps[start:applied], newest first"""
+        for old, new in reversed(self.steps[start:applied]):
+            bone = bones.get(new) if hasattr(bones, 'get') else bones[new]
+            if bone is not None:
+                bone.name = old
+
+# Blender stores bone names in 64 bytes including the terminating NUL
+MAX_BONE_NAME_BYTES = 63
+
+def truncate_bone_name(name: str, max_bytes: int = MAX_BONE_NAME_BYTES) -> str:
+    """Cut name to at most max_bytes of UTF-8, at a character boundary"""
+    encoded = name.encode('utf-8')
+    if len(encoded) <= max_bytes:
+        return name
+    return encoded[:max_bytes].decode('utf-8', errors='ignore')
+
+def plan_renames(existing_names: Iterable[str], requested: Dict[str, str],
+                 temp_prefix: str = "__bone_renamer_tmp_") -> RenamePlan:
+    """
+    Plan renames for a set of bones without collisions
+    
+    Targets are made unique in the order of existing_names: a target that
+    is kept by a bone not being renamed, or claimed by an earlier bone,
+    gets the first free ".001"-style suffix, so the result does not depend
+    on Blender's own auto-suffixing. Targets are cut to the
+    MAX_BONE_NAME_BYTES Blender keeps, with room left for that suffix, so
+    Blender never shortens a name behind the plan's back. The steps are
+    then ordered so names are freed before they are reused.
+    
+    Args:
+        existing_names (Iterable[str]): All bone names in the armature, in order
+        requested (Dict[str, str]): Desired old -> new names
+    """
+    existing = list(existing_names)
+    requested = {name: truncate_bone_name(new) for name, new in requested.items()}
+    renaming = {name for name in existing if requested.get(name, name) != name}
+    taken = {name for name in existing if name not in renaming}
+    
+    renames = {}
+    conflicts = []
+    for name in existing:
+        if name not in renaming or name in renames:
+            continue
+        wanted = requested[name]
+        target = wanted
+        number = 0
+        while target in taken:
+            number += 1
+            suffix = f".{number:03d}"
+            target = truncate_bone_name(wanted, MAX_BONE_NAME_BYTES - len(suffix)) + suffix
+        if target != wanted:
+            conflicts.append((name, wanted, target))
+        taken.add(target)
+        if target != name:
+            renames[name] = target
+    
+    # Rename whatever has a free target, and let each rename free the bone
+    # waiting for the old name. Whatever remains is a cycle, broken by moving
+    # one bone out of the way through a temporary name.
+    current = set(existing)
+    pending = dict(renames)
+    waiting = {}
+    ready = deque()
+    for old, new in pending.items():
+        if new in current:
+            waiting[new] = old
+        else:
+            ready.append(old)
+    
+    steps = []
+    temp_count = 0
+    while ready or waiting:
+        while ready:
+            old = ready.popleft()
+            new = pending.pop(old)
+            steps.append((old, new))
+            current.discard(old)
+            current.add(new)
+            if old in waiting:
+                ready.append(waiting.pop(old))
+        if waiting:
+            blocked_target, old = next(iter(waiting.items()))
+            temp = f"{temp_prefix}{temp_count}"
+            while temp in current:
+                temp_count += 1
+                temp = f"{temp_prefix}{temp_count}"
+            temp_count += 1
+            steps.append((old, temp))
+            current.discard(old)
+            current.add(temp)
+            pending[temp] = pending.pop(old)
+            waiting[blocked_target] = temp
+            if old in waiting:
+                ready.append(waiting.pop(old))
+    
+    return RenamePlan(renames, steps, conflicts)
+
+# Parent of each table row in a standard MMD skeleton, by MMD English name.
+# Rigs often insert helper bones (groove, waist, twist), so detection accepts
+# the expected parent anywhere among the nearest few ancestors.
+BONE_PARENTS = {
+    "center": "root",
+    "upper body": "center",
+    "lower body": "center",
+    "upper body 2": "upper body",
+    "neck": "upper body 2",
+    "head": "neck",
+}
+for _side in ("L", "R"):
+    BONE_PARENTS.update({
+        f"eye_{_side}": "head",
+        f"shoulder_{_side}": "upper body 2",
+        f"arm_{_side}": f"shoulder_{_side}",
+        f"elbow_{_side}": f"arm_{_side}",
+        f"wrist_{_side}": f"elbow_{_side}",
+        f"leg_{_side}": "lower body",
+        f"knee_{_side}": f"leg_{_side}",
+        f"ankle_{_side}": f"knee_{_side}",
+        f"toe_{_side}": f"ankle_{_side}",
+        f"thumb0_{_side}": f"wrist_{_side}",
+        f"thumb1_{_side}": f"thumb0_{_side}",
+        f"thumb2_{_side}": f"thumb1_{_side}",
+    })
+    for _finger in ("fore", "middle", "third", "little"):
+        BONE_PARENTS.update({
+            f"{_finger}1_{_side}": f"wrist_{_side}",
+            f"{_finger}2_{_side}": f"{_finger}1_{_side}",
+            f"{_finger}3_{_side}": f"{_finger}2_{_side}",
+        })
+
+# How many ancestors up the expected parent may be
+PARENT_SEARCH_DEPTH = 4
+
+class FormatDetection:
+    """
+    Result of detect_bone_format
+    
+    `format` is the best matching format key ('unknown' if nothing
+    matched), `scores` the score of every candidate format, and
+    `confidence` maps each bone recognised in that format to a value in
+    [0, 1]: how specific its name is to the format, averaged with whether
+    its parent agrees with the standard skeleton when that could be checked.
+    """
+    def __init__(self, format_key: str, scores: Dict[str, float], confidence: Dict[str, float],
+                 used_topology: bool):
+        self.format = format_key
+        self.scores = scores
+        self.confidence = confidence
+        self.used_topology = used_topology
+    
+    @property
+    def score(self) -> float:
+        return self.scores.get(self.format, 0.0)
+
+def detect_bone_format(bones: Iterable[Tuple[str, str]], margin: float = 0.9) -> FormatDetection:
+    """
+    Detect which naming format an armature uses
+    
+    Every bone name is looked up in each format's column of the vocabulary,
+    and each format it belongs to scores 1/n, where n is the number of formats sharing that name. If
+    the runner-up scores within `margin` of the best, the candidates are
+    also scored by how many of their matched bones sit below the expected
+    parent, which separates formats that share many names. Runs in time
+    linear in the number of bones.
+    
+    Args:
+        bones (Iterable[Tuple[str, str]]): (name, parent name or None) pairs
+    """
+    tables = get_vocabulary()
+    parents = {}
+    matches = {}
+    scores = {}
+    for name, parent in bones:
+        parents[name] = parent
+        entries = []
+        for format_key in tables.formats:
+            row_index = tables.find(format_key, name)
+            if row_index >= 0:
+                entries.append((format_key, row_index))
+        if not entries:
+            continue
+        matches[name] = entries
+        weight = 1.0 / len({format_key for format_key, _ in entries})
+        for format_key in {format_key for format_key, _ in entries}:
+            scores[format_key] = scores.get(format_key, 0.0) + weight
+    
+    if not scores:
+        return FormatDetection('unknown', {}, {}, False)
+    
+    ranked = sorted(scores, key=lambda key: (-scores[key], key))
+    candidates = [key for key in ranked if scores[key] >= scores[ranked[0]] * margin]
+    
+    def parent_agrees(name, format_key, row_index):
+        expected = BONE_PARENTS.get(tables.string(tables.columns['mmd_english'][row_index]))
+        if expected is None:
+            return None
+        expected_name = tables.string(tables.columns[format_key][tables.find('mmd_english', expected)])
+        if not expected_name or expected_name not in parents:
+            return None
+        ancestor = parents.get(name)
+        for _ in range(PARENT_SEARCH_DEPTH):
+            if ancestor is None:
+                return False
+            if ancestor == expected_name:
+                return True
+            ancestor = parents.get(ancestor)
+        return False
+    
+    def bone_confidence(format_key):
+        confidence = {}
+        agreeing = 0
+        for name, entries in matches.items():
+            rows = [row_index for key, row_index in entries if key == format_key]
+            if not rows:
+                continue
+            specificity = 1.0 / len({key for key, _ in entries})
+            agrees = parent_agrees(name, format_key, rows[0])
+            if agrees is None:
+                confidence[name] = specificity
+            else:
+                confidence[name] = (specificity + agrees) / 2
+                agreeing += agrees
+        return confidence, agreeing
+    
+    used_topology = len(candidates) > 1
+    if used_topology:
+        results = {key: bone_confidence(key) for key in candidates}
+        best = max(candidates, key=lambda key: (results[key][1], scores[key], key == ranked[0]))
+        confidence = results[best][0]
+    else:
+        best = ranked[0]
+        confidence = bone_confidence(best)[0]
+    return FormatDetection(best, scores, confidence, used_topology)
+
+# Bone references inside animation data paths, e.g. pose.bones["左腕"].rotation_quaternion
+_BONE_PATH_PATTERN = re.compile(r'(bones\[")((?:[^"\\]|\\.)*)("\])')
+_PATH_UNESCAPE_PATTERN = re.compile(r'\\(.)')
+
+def rename_data_path(path: str, renames: Dict[str, str]) -> str:
+    """Rewrite the bone names in an RNA data path according to renames"""
+    def replace(match):
+        new = renames.get(_PATH_UNESCAPE_PATTERN.sub(r'\1', match.group(2)))
+        if new is None:
+            return match.group(0)
+        return match.group(1) + new.replace('\\', '\\\\').replace('"', '\\"') + match.group(3)
+    return _BONE_PATH_PATTERN.sub(replace, path) if 'bones["' in path else path
+
+def data_path_bone_names(path: str) -> List[str]:
+    """The bone names referenced by an RNA data path"""
+    if 'bones["' not in path:
+        return []
+    return [_PATH_UNESCAPE_PATTERN.sub(r'\1', match.group(2)) for match in _BONE_PATH_PATTERN.finditer(path)]
+
+# Rename maps: resolved old -> new bone names saved for reuse on motions and other models
+
+RENAME_MAP_FORMAT = "bone_renamer_map"
+RENAME_MAP_VERSION = 1
+
+def compose_renames(first: Dict[str, str], second: Dict[str, str]) -> Dict[str, str]:
+    """Two renames applied one after the other, as one mapping from the original names"""
+    composed = {old: second.get(new, new) for old, new in first.items()}
+    produced = set(first.values())
+    for old, new in second.items():
+        if old not in produced:
+            composed.setdefault(old, new)
+    return {old: new for old, new in composed.items() if old != new}
+
+def write_rename_map(path: str, renames: Dict[str, str], **info):
+    """
+    Save a rename map as JSON, or as CSV when the path ends in .csv
+    
+    Extra keyword arguments, such as the armature name, are stored in the
+    JSON file for reference; CSV files only hold the names.
+    """
+    if path.lower().endswith('.csv'):
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow([f"#{RENAME_MAP_FORMAT}", RENAME_MAP_VERSION])
+            writer.writerow(['old_name', 'new_name'])
+            writer.writerows(renames.items())
+    else:
+        data = {"format": RENAME_MAP_FORMAT, "version": RENAME_MAP_VERSION}
+        data.update(info)
+        data["renames"] = renames
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+def read_rename_map(path: str) -> Dict[str, str]:
+    """
+    Load a rename map written by write_rename_map
+    
+    Raises:
+        ValueError: If the file is not a rename map, or from a newer version
+    """
+    with open(path, encoding='utf-8-sig', newline='') as f:
+        if path.lower().endswith('.csv'):
+            rows = list(csv.reader(f))
+            if not rows or rows[0][:1] != [f"#{RENAME_MAP_FORMAT}"] or len(rows[0]) < 2:
+                raise ValueError(f"{path} is not a bone rename map")
+            version, rows = rows[0][1], rows[2:]
+            renames = {row[0]: row[1] for row in rows if len(row) >= 2}
+        else:
+            data = json.load(f)
+            if not isinstance(data, dict) or data.get("format") != RENAME_MAP_FORMAT:
+                raise ValueError(f"{path} is not a bone rename map")
+            version, renames = data.get("version"), data.get("renames", {})
+            if not isinstance(renames, dict) or not all(isinstance(new, str) for new in renames.values()):
+                raise ValueError(f"{path} has no valid renames, expected an object of old to new names")
+    try:
+        version = int(version)
+    except (TypeError, ValueError):
+        raise ValueError(f"{path} has an invalid rename map version: {version!r}")
+    if version > RENAME_MAP_VERSION:
+        raise ValueError(f"{path} is a version {version} rename map, this Bone Renamer reads up to version {RENAME_MAP_VERSION}")
+    return {str(old): str(new) for old, new in renames.items()}
+
+# Command line interface, used when the script runs outside Blender
+
+# Number of names handed to a worker process at a time
+CLI_CHUNK_SIZE = 500
+
+def read_bone_names(stream: TextIO, input_format: str) -> Iterator[str]:
+    """
+    Read bone names from a stream
+    
+    Args:
+        stream (TextIO): Open text stream
+        input_format (str): 'lines' for one name per line, 'json' for a list
+            of names (or of objects with a "name" key), 'csv' for names in
+            the first column with an optional header row
+    """
+    if input_format == 'json':
+        data = json.load(stream)
+        if isinstance(data, dict):
+            data = data.get('bones', [])
+        for item in data:
+            name = item.get('name') if isinstance(item, dict) else item
+            if name:
+                yield str(name)
+    elif input_format == 'csv':
+        for index, row in enumerate(csv.reader(stream)):
+            if not row or not row[0].strip():
+                continue
+            if index == 0 and row[0].strip().lower() in ('name', 'bone', 'bone_name'):
+                continue
+            yield row[0].strip()
+    else:
+        for line in stream:
+            name = line.strip()
+            if name:
+                yield name
+
+def _chunked(names: Iterable[str], size: int) -> Iterator[List[str]]:
+    chunk = []
+    for name in names:
+        chunk.append(name)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def _map_streaming(executor, func: Callable, items: Iterable, window: int) -> Iterator:
+    """
+    Like executor.map, in order, but reading items only as results are consumed
+    
+    Executor.map submits the whole iterable up front; this keeps at most
+    window items in flight, so a large input is never held in memory.
+    """
+    pending = deque()
+    for item in items:
+        if len(pending) >= window:
+            yield pending.popleft().result()
+        pending.append(executor.submit(func, item))
+    while pending:
+        yield pending.popleft().result()
+
+def _init_cli_worker(cache_path: str, overlay_dir: str, vocabulary_path: str = None):
+    """Set up the dictionary and translation cache in a CLI worker process"""
+    global translation_cache
+    # stdout carries the results, so messages about the vocabulary or cache go to stderr
+    with redirect_stdout(sys.stderr):
+        # main() has loaded it already when running in-process, and forked workers inherit it
+        if vocabulary is None or vocabulary.digest != vocabulary_digest(overlay_dir):
+            reload_dictionaries(overlay_dir, vocabulary_path)
+        if cache_path:
+            # Not warmed: main() did that once, lookups read through to the file
+            try:
+                translation_cache = PersistentTranslationCache(cache_path)
+            except (OSError, sqlite3.Error) as e:
+                print(f"Persistent translation cache unavailable: {str(e)}")
+
+def _translate_chunk(args: Tuple[List[str], bool, float, bool]) -> Tuple[List[Tuple[str, str]], TranslationMetrics]:
+    names, use_online, timeout, side_suffixes = args
+    metrics = TranslationMetrics()
+    with redirect_stdout(sys.stderr):
+        translations = translate_bone_names(names, use_online, timeout, metrics=metrics, side_suffixes=side_suffixes)
+    return [(name, translations[name]) for name in names], metrics
+
+# Batch renaming of many asset files
+
+# Files handled by the naming engine directly, and files that need a Blender process
+BATCH_NAME_LIST_EXTENSIONS = ('.txt', '.json', '.csv')
+BATCH_BLENDER_EXTENSIONS = ('.blend', '.pmx', '.pmd')
+# Inputs given by name that list the files to process instead of being processed
+BATCH_MANIFEST_EXTENSIONS = ('.txt', '.json')
+
+def collect_batch_files(sources: List[str], output_dir: str = None) -> List[str]:
+    """
+    Expand directories and manifests into the list of files to process
+    
+    A directory is searched recursively for supported files, skipping
+    output_dir so a rerun does not pick up its own reports and journal.
+    Any .txt or .json file given directly is a manifest: a .txt file whose
+    lines are paths (relative to the manifest), or a .json file holding a
+    list of paths. Other supported files given directly are processed
+    themselves.
+    
+    Raises:
+        OSError: If a manifest cannot be read
+        ValueError: If a manifest is malformed, or an input or manifest entry is not a supported file type
+    """
+    supported = BATCH_NAME_LIST_EXTENSIONS + BATCH_BLENDER_EXTENSIONS
+    excluded = os.path.realpath(output_dir) if output_dir else None
+    
+    def check(path):
+        if not path.lower().endswith(supported):
+            raise ValueError(f"{path} is not a supported file, expected one of {', '.join(supported)}")
+        return path
+    
+    files = []
+    for source in sources:
+        if os.path.isdir(source):
+            for root, dirs, filenames in os.walk(source):
+                if excluded and os.path.realpath(root) == excluded:
+                    dirs[:] = []
+                    continue
+                dirs.sort()
+                files.extend(os.path.join(root, f) for f in sorted(filenames) if f.lower().endswith(supported))
+            continue
+        if not source.lower().endswith(BATCH_MANIFEST_EXTENSIONS):
+            files.append(check(source))
+            continue
+        base = os.path.dirname(source)
+        with open(source, encoding='utf-8-sig') as f:
+            if source.lower().endswith('.json'):
+                entries = json.load(f)
+                if not isinstance(entries, list) or not all(isinstance(entry, str) for entry in entries):
+                    raise ValueError(f"{source} is not a JSON list of paths")
+            else:
+                entries = [line.strip() for line in f if line.strip() and not line.startswith('#')]
+        files.extend(check(os.path.join(base, entry)) for entry in entries)
+    return [os.path.abspath(f) for f in dict.fromkeys(files)]
+
+def batch_output_path(path: str, root: str, output_dir: str) -> str:
+    """
+    Where run_batch saves the result of path, mirroring its folder below root
+    
+    The source extension stays in the name (model.pmx -> model.pmx.blend),
+    so model.pmx and model.blend in one folder never share an output.
+    """
+    return os.path.join(output_dir, os.path.relpath(path, root) + '.blend')
+
+def _process_batch_file(path: str, output_path: str, options: Dict) -> Dict:
+    """Rename the bones of one file, saving Blender files to output_path, and return its report entry"""
+    started = time.time()
+    report = {"file": path, "status": "ok", "armatures": {}}
+    extension = os.path.splitext(path)[1].lower()
+    try:
+        if extension in BATCH_NAME_LIST_EXTENSIONS:
+            with open(path, encoding='utf-8-sig', newline='') as f:
+                names = list(read_bone_names(f, {'.json': 'json', '.csv': 'csv'}.get(extension, 'lines')))
+            if options['mode'] == 'convert':
+                source_format = options['source_format']
+                if source_format == 'unknown':
+                    source_format = detect_bone_format((name, None) for name in names).format
+                renames = match_bone_names(names, source_format, options['target_format'],
+                                           options['include_fingers']).renames
+            else:
+                with redirect_stdout(sys.stderr):
+                    renames = translate_bone_names(names, options['use_online'], options['timeout'],
+                                                   side_suffixes=options['side_suffixes'])
+            report["armatures"][os.path.basename(path)] = {
+                name: new for name, new in renames.items() if new != name
+            }
+        else:
+            result_path = output_path + ".result.json"
+            os.makedirs(os.path.dirname(result_path), exist_ok=True)
+            command = [options['blender'], '--background']
+            if extension == '.blend':
+                command.append(path)
+            command += ['--python', os.path.abspath(__file__), '--', '--blend-worker',
+                        '--mode', options['mode'],
+                        '--source-format', options['source_format'],
+                        '--target-format', options['target_format'],
+                        '--timeout', str(options['timeout']),
+                        '--save-as', output_path,
+                        '--result', result_path]
+            if extension != '.blend':
+                command += ['--import', path]
+            if not options['include_fingers']:
+                command.append('--no-fingers')
+            if not options['use_online']:
+                command.append('--offline')
+            if options['side_suffixes']:
+                command.append('--lr-suffixes')
+            # Blender uses the cache and dictionaries of this run, not those of its own config folder
+            if options['cache_path']:
+                command += ['--cache', options['cache_path']]
+            else:
+                command.append('--no-cache')
+            if options['overlay_dir']:
+                command += ['--dictionary-dir', options['overlay_dir']]
+            if options['vocabulary_path']:
+                command += ['--vocabulary', options['vocabulary_path']]
+            completed = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                       encoding='utf-8', errors='replace')
+            if completed.returncode != 0 or not os.path.exists(result_path):
+                raise RuntimeError(f"Blender exited with code {completed.returncode}: "
+                                   f"{completed.stdout[-2000:]}")
+            with open(result_path, encoding='utf-8') as f:
+                report["armatures"] = json.load(f)["armatures"]
+    except Exception as e:
+        report["status"] = "error"
+        report["error"] = str(e)
+    report["renamed"] = sum(len(renames) for renames in report["armatures"].values())
+    report["seconds"] = round(time.time() - started, 3)
+    return report
+
+def run_batch(files: List[str], output_dir: str, options: Dict, jobs: int) -> Dict:
+    """
+    Rename bones in many files across worker processes
+    
+    Finished files are appended to a journal in output_dir as they complete,
+    so an interrupted run can be restarted and skips files already done.
+    Name list files are translated or converted by the naming engine in the worker;
+    .blend, .pmx and .pmd files are handed to Blender in background mode
+    (PMX/PMD import needs mmd_tools) and saved as .blend into output_dir,
+    see batch_output_path. All workers, Blender included, share the
+    persistent translation cache and dictionary overlays.
+    
+    Returns:
+        Dict: Aggregated report of every file in the journal
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    journal_path = os.path.join(output_dir, "batch_journal.jsonl")
+    
+    finished = {}
+    if os.path.exists(journal_path):
+        with open(journal_path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # Partial line from an interrupted run
+                finished[entry["file"]] = entry
+    
+    todo = [path for path in files if finished.get(path, {}).get("status") != "ok"]
+    root = os.path.commonpath([os.path.dirname(path) for path in files]) if files else output_dir
+    print(f"{len(files) - len(todo)} files already done, {len(todo)} to process", file=sys.stderr)
+    
+    # Imported here: multiprocessing is only needed by the command line, not by the addon
+    from concurrent.futures import ProcessPoolExecutor
+    with open(journal_path, 'a', encoding='utf-8') as journal, \
+            ProcessPoolExecutor(max_workers=max(1, jobs), initializer=_init_cli_worker,
+                                initargs=(options['cache_path'], options['overlay_dir'],
+                                          options['vocabulary_path'])) as executor:
+        futures = [executor.submit(_process_batch_file, path, batch_output_path(path, root, output_dir), options) for path in todo]
+        for done_count, future in enumerate(as_completed(futures), 1):
+            entry = future.result()
+            finished[entry["file"]] = entry
+            journal.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            journal.flush()
+            os.fsync(journal.fileno())
+            print(f"[{done_count}/{len(todo)}] {entry['status']}: {entry['file']}", file=sys.stderr)
+    
+    entries = [finished[path] for path in files if path in finished]
+    report = {
+        "files": entries,
+        "total_files": len(entries),
+        "failed_files": sum(entry["status"] != "ok" for entry in entries),
+        "renamed_bones": sum(entry["renamed"] for entry in entries),
+    }
+    with open(os.path.join(output_dir, "batch_report.json"), 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    return report
+
+def main(argv: List[str] = None) -> int:
+    """Translate bone names from files or stdin and stream the results to stdout"""
+    # Command line only modules are imported here to keep the addon's startup fast
+    import argparse
+    from concurrent.futures import ProcessPoolExecutor
+    
+    parser = argparse.ArgumentParser(
+        description="Translate Japanese MMD bone names without Blender. "
+                    "Writes one 'original<TAB>translation' line per name."
+    )
+    parser.add_argument('inputs', nargs='*', help="Files with bone names (default: stdin)")
+    parser.add_argument('--input-format', choices=('auto', 'lines', 'json', 'csv'), default='auto',
+                        help="Input format; 'auto' picks by file extension")
+    parser.add_argument('--output-format', choices=('tsv', 'jsonl'), default='tsv')
+    parser.add_argument('--offline', action='store_true', help="Use only the static dictionary")
+    parser.add_argument('--lr-suffixes', action='store_true', help="Write sides as Blender .L/.R suffixes (左腕 -> arm.L)")
+    parser.add_argument('--timeout', type=float, default=2.0, help="Seconds per online request")
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1, help="Worker processes")
+    parser.add_argument('--no-cache', action='store_true', help="Do not use the persistent translation cache")
+    parser.add_argument('--dictionary-dir', default=None, help="Folder of dictionary overlay JSON files")
+    parser.add_argument('--apply-map', default=None,
+                        help="Rename with a saved rename map (JSON or CSV) instead of translating")
+    parser.add_argument('--metrics', default=None, help="Write per-stage timings and counters as JSON to this file")
+    parser.add_argument('--metrics-log', default=None, help="Append the timing report as one JSON line to this file")
+    batch = parser.add_argument_group(
+        "batch mode",
+        "Rename the bones of many files; inputs are directories, manifests or single files. A .txt or "
+        ".json input is always read as a manifest (one path per line, or a JSON list of paths), never "
+        "as a name list. .csv name lists and .blend, .pmx and .pmd models are processed directly. "
+        "Directories are searched recursively, skipping the output folder"
+    )
+    batch.add_argument('--batch', action='store_true', help="Run in batch mode")
+    batch.add_argument('--output-dir', default='bone_renamer_batch', help="Folder for results, journal and report")
+    batch.add_argument('--blender', default='blender', help="Blender executable for .blend/.pmx/.pmd files")
+    batch.add_argument('--mode', choices=('translate', 'convert'), default='translate',
+                       help="Translate Japanese names, or convert between formats")
+    batch.add_argument('--source-format', choices=[item[0] for item in BONE_MAPS], default='mmd_japanese',
+                       help="Naming format to convert from; 'unknown' detects it per file")
+    batch.add_argument('--target-format', choices=[item[0] for item in BONE_MAPS], default='mmd_english')
+    batch.add_argument('--no-fingers', action='store_true', help="Do not rename finger bones")
+    args = parser.parse_args(argv)
+    
+    out = sys.stdout
+    overlay_dir = args.dictionary_dir or get_dictionary_dir()
+    cache_path = None if args.no_cache else get_cache_path()
+    vocabulary_path = get_vocabulary_path()
+    
+    def names():
+        for path in args.inputs or ['-']:
+            input_format = args.input_format
+            if input_format == 'auto':
+                input_format = {'.json': 'json', '.csv': 'csv'}.get(os.path.splitext(path)[1].lower(), 'lines')
+            if path == '-':
+                yield from read_bone_names(sys.stdin, input_format)
+            else:
+                with open(path, encoding='utf-8-sig', newline='') as f:
+                    yield from read_bone_names(f, input_format)
+    
+    def write(name, translation):
+        if args.output_format == 'jsonl':
+            out.write(json.dumps({"name": name, "translation": translation}, ensure_ascii=False) + "\n")
+        else:
+            out.write(f"{name}\t{translation}\n")
+    
+    if args.apply_map:
+        # A saved map needs no dictionary, cache or network
+        try:
+            renames = read_rename_map(args.apply_map)
+        except (OSError, ValueError) as e:
+            print(f"Could not read rename map: {str(e)}", file=sys.stderr)
+            return 1
+        for name in names():
+            write(name, renames.get(name, name))
+        return 0
+    
+    with redirect_stdout(sys.stderr):
+        # Rebuild the vocabulary file once if needed; workers map it instead of building their own
+        reload_dictionaries(overlay_dir, vocabulary_path)
+        if cache_path:
+            # Evict stale entries once up front; workers open the file without warming their memory from it
+            cache = PersistentTranslationCache(cache_path)
+            cache.load()
+            cache.close()
+    
+    if args.batch:
+        options = {
+            'mode': args.mode,
+            'source_format': args.source_format,
+            'target_format': args.target_format,
+            'include_fingers': not args.no_fingers,
+            'use_online': not args.offline,
+            'timeout': args.timeout,
+            'side_suffixes': args.lr_suffixes,
+            'blender': args.blender,
+            'cache_path': cache_path,
+            'overlay_dir': overlay_dir,
+            'vocabulary_path': vocabulary_path,
+        }
+        try:
+            files = collect_batch_files(args.inputs, args.output_dir)
+        except (OSError, ValueError) as e:
+            print(f"Could not collect the batch inputs: {str(e)}", file=sys.stderr)
+            return 1
+        report = run_batch(files, args.output_dir, options, args.jobs)
+        print(f"Renamed {report['renamed_bones']} bones in {report['total_files']} files, "
+              f"{report['failed_files']} failed", file=sys.stderr)
+        return 1 if report['failed_files'] else 0
+    
+    # Names are read a chunk at a time as results are written. Only the first
+    # two chunks are read ahead, to skip the process pool for small inputs.
+    chunks = _chunked(names(), CLI_CHUNK_SIZE)
+    head = list(islice(chunks, 2))
+    jobs = ((chunk, not args.offline, args.timeout, args.lr_suffixes) for chunk in chain(head, chunks))
+    if args.jobs > 1 and len(head) > 1:
+        executor = ProcessPoolExecutor(max_workers=args.jobs, initializer=_init_cli_worker,
+                                       initargs=(cache_path, overlay_dir, vocabulary_path))
+        results = _map_streaming(executor, _translate_chunk, jobs, 2 * args.jobs)
+    else:
+        executor = None
+        _init_cli_worker(cache_path, overlay_dir, vocabulary_path)
+        results = map(_translate_chunk, jobs)
+    
+    metrics = TranslationMetrics()
+    try:
+        for translated, chunk_metrics in results:
+            metrics.merge(chunk_metrics)
+            for name, translation in translated:
+                write(name, translation)
+            out.flush()
+    finally:
+        if executor:
+            executor.shutdown()
+    if args.metrics or args.metrics_log:
+        metrics.export(args.metrics, args.metrics_log)
+    return 0
+
+# Blender addon
+
+def show_message(message: str, title: str = "Message", icon: str = 'INFO'):
+    def draw(self, context):
+        self.layout.label(text=message)
+    bpy.context.window_manager.popup_menu(draw, title=title, icon=icon)
+
+class BoneRenamerProperties(PropertyGroup):
+    source_object: StringProperty(
+        name="Source Object",
+        description="Armature to rename bones from",
+        default=""
+    )
+    scope: EnumProperty(
+        items=[
+            ('ACTIVE', "Picked Armature", "Rename the bones of the picked armature"),
+            ('SELECTED', "Selected Armatures", "Rename the bones of every selected armature"),
+            ('ALL', "All Armatures", "Rename the bones of every armature in the scene"),
+        ],
+        name="Scope",
+        description="Armatures to rename; names shared between them are translated only once",
+        default='ACTIVE'
+    )
+    source_format: EnumProperty(
+        items=BONE_MAPS,
+        name="Source Format",
+        description="Current bone naming format",
+        default='mmd_japanese'
+    )
+    target_format: EnumProperty(
+        items=BONE_MAPS,
+        name="Target Format",
+        description="Desired bone naming format",
+        default='mmd_english'
+    )
+    include_fingers: BoolProperty(
+        name="Include Fingers",
+        description="Also rename finger bones",
+        default=True
+    )
+    fuzzy_matching: BoolProperty(
+        name="Fuzzy Matching",
+        description="Also match bone names that are close to a known name but not spelled the same, "
+                    "e.g. misspellings such as LeftShouldr. Case, separators, full-width characters and .001 "
+                    "suffixes are always tolerated",
+        default=False
+    )
+    match_threshold: FloatProperty(
+        name="Match Threshold",
+        description="How similar a bone name must be to a known name to be matched approximately",
+        default=FUZZY_MATCH_THRESHOLD,
+        min=0.5,
+        max=1.0
+    )
+    auto_translate_imports: BoolProperty(
+        name="Translate Imported Models",
+        description="Translate the Japanese bone names of newly imported armatures automatically, in the background",
+        default=False,
+        update=lambda self, context: import_translation_queue.reset()
+    )
+    use_online_translation: BoolProperty(
+        name="Use Online Translation",
+        description="Use Google Translate for unknown Japanese terms (requires internet)",
+        default=True
+    )
+    translation_timeout: FloatProperty(
+        name="Translation Timeout",
+        description="Seconds to wait for online translation before falling back to static dictionary",
+        default=2.0,
+        min=0.1,
+        max=10.0
+    )
+    update_references: BoolProperty(
+        name="Update Animation References",
+        description="Also rename the bones in actions, drivers, constraints and vertex groups",
+        default=True
+    )
+    dry_run: BoolProperty(
+        name="Preview Only",
+        description="Write the planned renames to a text block instead of renaming",
+        default=False
+    )
+    side_suffixes: BoolProperty(
+        name="Blender L/R Suffixes",
+        description="Write the side of translated names as .L/.R suffixes (左腕 becomes arm.L), "
+                    "so Blender's mirror tools pair the bones",
+        default=False
+    )
+    incremental: BoolProperty(
+        name="Only New Bones",
+        description="Skip bones translated by an earlier run, unless they were renamed since",
+        default=True
+    )
+    write_metrics: BoolProperty(
+        name="Write Timing Report",
+        description="Write per-stage timings and counters of each translation to a JSON text block",
+        default=False
+    )
+    metrics_log: StringProperty(
+        name="Timing Log",
+        description="Also append the timing report of each translation to this file (optional)",
+        default="",
+        subtype='FILE_PATH'
+    )
+
+def scene_armatures(context, scope: str) -> List:
+    """
+    Armature objects to rename for a scope: 'ACTIVE', 'SELECTED' or 'ALL'
+    
+    Objects sharing armature data (linked duplicates of one rig) have the
+    same bones, so only the first of them is returned.
+    """
+    if scope == 'ACTIVE':
+        obj = bpy.data.objects.get(context.scene.bone_renamer.source_object)
+        objects = [obj] if obj else []
+    elif scope == 'SELECTED':
+        objects = context.selected_objects
+    else:
+        objects = context.scene.objects
+    
+    armatures = {}
+    for obj in objects:
+        if obj.type == 'ARMATURE' and obj.data not in armatures:
+            armatures[obj.data] = obj
+    return list(armatures.values())
+
+def bone_hierarchy(armature) -> List[Tuple[str, str]]:
+    """(name, parent name or None) for every bone of an armature object"""
+    return [(bone.name, bone.parent.name if bone.parent else None) for bone in armature.data.bones]
+
+# Custom properties on each translated bone: the name it was translated from, and the result
+TRANSLATED_FROM_PROP = "bone_renamer_source"
+TRANSLATED_TO_PROP = "bone_renamer_result"
+
+def untranslated_bone_names(bones) -> List[str]:
+    """Names of the bones not translated yet, or renamed since they were"""
+    return [bone.name for bone in bones if bone.get(TRANSLATED_TO_PROP) != bone.name]
+
+def record_translations(bones, names: Iterable[str], renames: Dict[str, str]) -> int:
+    """
+    Mark bones as translated after a run, so incremental runs skip them
+    
+    Bones whose new name still contains Japanese, e.g. because the online
+    lookup failed, are left unmarked and retried next time.
+    
+    Returns:
+        int: Number of bones marked
+    """
+    marked = 0
+    for name in names:
+        bone = bones.get(renames.get(name, name))
+        if bone is None or contains_japanese(bone.name):
+            continue
+        bone[TRANSLATED_FROM_PROP] = name
+        bone[TRANSLATED_TO_PROP] = bone.name
+        marked += 1
+    return marked
+
+# Custom property on the armature data: JSON map from the original bone names to the current ones
+RENAME_MAP_PROP = "bone_renamer_map"
+
+def stored_rename_map(armature) -> Dict[str, str]:
+    """The renames applied to an armature so far, from the original names"""
+    try:
+        return json.loads(armature.data.get(RENAME_MAP_PROP, "{}"))
+    except ValueError:
+        return {}
+
+def remember_rename_map(armature, renames: Dict[str, str]):
+    """Add renames just applied to the armature's stored rename map"""
+    if renames:
+        combined = compose_renames(stored_rename_map(armature), renames)
+        armature.data[RENAME_MAP_PROP] = json.dumps(combined, ensure_ascii=False)
+
+def rename_action_bones(action, renames: Dict[str, str]) -> int:
+    """
+    Rename the bone channels of a single action, e.g. a motion imported without its model
+    
+    Returns:
+        int: Number of updated F-curves and groups
+    """
+    count = 0
+    for fcurve in _action_fcurves(action):
+        new_path = rename_data_path(fcurve.data_path, renames)
+        if new_path != fcurve.data_path:
+            fcurve.data_path = new_path
+            count += 1
+    groups = [(group, renames[group.name]) for group in _action_groups(action) if group.name in renames]
+    # Move the groups out of the way first so swapped names never collide
+    for index, (group, _) in enumerate(groups):
+        group.name = f"__bone_renamer_ref_{index}"
+    for group, name in groups:
+        group.name = name
+    return count + len(groups)
+
+def show_metrics_report(metrics: TranslationMetrics, label: str, props) -> str:
+    """
+    Export a run's metrics as the user asked in the panel
+    
+    Returns:
+        str: Name of the text block the JSON report was written to, or an empty string
+    """
+    report = metrics.export(None, bpy.path.abspath(props.metrics_log) if props.metrics_log else None)
+    if not props.write_metrics:
+        return ""
+    name = f"Bone Renamer Metrics - {label}"
+    text = bpy.data.texts.get(name) or bpy.data.texts.new(name)
+    text.clear()
+    text.write(json.dumps(report, indent=2))
+    return text.name
+
+def show_plan_report(plan: RenamePlan, armature) -> str:
+    """Write a rename plan into a text block for review and return the block's name"""
+    name = f"Bone Renamer Plan - {armature.name}"
+    text = bpy.data.texts.get(name) or bpy.data.texts.new(name)
+    text.clear()
+    text.write(plan.report())
+    return text.name
+
+def _action_fcurves(action):
+    """F-curves of an action, including the channelbags of layered actions (Blender 4.4+)"""
+    for layer in getattr(action, 'layers', ()):
+        for strip in layer.strips:
+            for channelbag in getattr(strip, 'channelbags', ()):
+                yield from channelbag.fcurves
+    if hasattr(action, 'fcurves'):
+        yield from action.fcurves
+
+def _action_groups(action):
+    for layer in getattr(action, 'layers', ()):
+        for strip in layer.strips:
+            for channelbag in getattr(strip, 'channelbags', ()):
+                yield from channelbag.groups
+    if hasattr(action, 'groups'):
+        yield from action.groups
+
+class BoneReferenceSweep:
+    """
+    Every reference to an armature's bones outside the bones themselves
+    
+    Built before the bones are renamed: one pass over actions, drivers,
+    constraints and vertex groups records each reference to a renamed bone
+    together with its new value, computed from the names as they were.
+    apply() then writes them all after the renames. Blender already fixes up
+    some of these while renaming; writing precomputed values keeps the
+    result right even for swapped names, and also reaches data Blender
+    skips, such as imported motions not assigned to the armature. An
+    unassigned action is only swept when every bone it animates is one of
+    this armature's bones, so motions of unrelated rigs are left alone.
+    """
+    def __init__(self, armature, renames: Dict[str, str]):
+        self.armature = armature
+        self.renames = renames
+        self.values = []  # (struct, attribute, new value)
+        self.names = []   # Named items (action groups, vertex groups), renamed in two phases
+        if renames:
+            self._collect()
+    
+    def _collect(self):
+        armature = self.armature
+        renames = self.renames
+        armature_ids = {armature, armature.data}
+        shared = [obj for obj in bpy.data.objects if obj.type == 'ARMATURE' and obj.data == armature.data]
+        
+        # Actions animating other rigs keep their names, even if the bone names overlap
+        foreign_actions = set()
+        for obj in bpy.data.objects:
+            if obj.type != 'ARMATURE' or obj in shared or not obj.animation_data:
+                continue
+            foreign_actions.add(obj.animation_data.action)
+            for track in obj.animation_data.nla_tracks:
+                foreign_actions.update(strip.action for strip in track.strips)
+        
+        bone_names = {bone.name for bone in armature.data.bones}
+        for action in bpy.data.actions:
+            if action in foreign_actions or getattr(action, 'id_root', 'OBJECT') not in ('OBJECT', ''):
+                continue
+            fcurves = list(_action_fcurves(action))
+            animated = {name for fcurve in fcurves for name in data_path_bone_names(fcurve.data_path)}
+            if not animated or not animated <= bone_names:
+                continue
+            for fcurve in fcurves:
+                self._add_path(fcurve)
+            for group in _action_groups(action):
+                if group.name in renames:
+                    self.names.append((group, renames[group.name]))
+        
+        for collection in (bpy.data.objects, bpy.data.armatures, bpy.data.meshes, bpy.data.shape_keys):
+            for owner in collection:
+                animation_data = getattr(owner, 'animation_data', None)
+                if not animation_data:
+                    continue
+                for fcurve in animation_data.drivers:
+                    if owner in armature_ids:
+                        self._add_path(fcurve)
+                    for variable in fcurve.driver.variables:
+                        for target in variable.targets:
+                            if target.id not in armature_ids:
+                                continue
+                            if target.bone_target in renames:
+                                self.values.append((target, 'bone_target', renames[target.bone_target]))
+                            self._add_path(target)
+        
+        for obj in bpy.data.objects:
+            constraints = list(obj.constraints)
+            if obj.pose:
+                for pose_bone in obj.pose.bones:
+                    constraints.extend(pose_bone.constraints)
+            for constraint in constraints:
+                targets = [constraint] + list(getattr(constraint, 'targets', ()))
+                for target in targets:
+                    if getattr(target, 'target', None) in shared and getattr(target, 'subtarget', '') in renames:
+                        self.values.append((target, 'subtarget', renames[target.subtarget]))
+                if getattr(constraint, 'pole_target', None) in shared and constraint.pole_subtarget in renames:
+                    self.values.append((constraint, 'pole_subtarget', renames[constraint.pole_subtarget]))
+            
+            if obj.type == 'MESH' and (
+                (obj.parent in shared and obj.parent_type == 'ARMATURE') or
+                any(modifier.type == 'ARMATURE' and modifier.object in shared for modifier in obj.modifiers)
+            ):
+                for group in obj.vertex_groups:
+                    if group.name in renames:
+                        self.names.append((group, renames[group.name]))
+    
+    def _add_path(self, struct):
+        path = struct.data_path
+        new_path = rename_data_path(path, self.renames)
+        if new_path != path:
+            self.values.append((struct, 'data_path', new_path))
+    
+    def __len__(self):
+        return len(self.values) + len(self.names)
+    
+    def apply(self) -> int:
+        """
+        Write the new references; returns the number updated
+        
+        If any write fails, the ones already made are undone before the
+        error is raised.
+        """
+        self._previous = []
+        self._previous_names = [(item, item.name) for item, _ in self.names]
+        try:
+            for struct, attribute, value in self.values:
+                self._previous.append((struct, attribute, getattr(struct, attribute)))
+                setattr(struct, attribute, value)
+            self._rename_items(self.names)
+        except Exception:
+            self.undo()
+            raise
+        return len(self)
+    
+    def undo(self):
+        """Restore the references as they were before apply()"""
+        for struct, attribute, value in reversed(getattr(self, '_previous', ())):
+            setattr(struct, attribute, value)
+        self._rename_items(getattr(self, '_previous_names', ()))
+        self._previous = self._previous_names = []
+    
+    @staticmethod
+    def _rename_items(names: List[Tuple[object, str]]):
+        # Move named items out of the way first so swapped names never collide
+        for index, (item, _) in enumerate(names):
+            item.name = f"__bone_renamer_ref_{index}"
+        for item, name in names:
+            item.name = name
+
+def apply_rename_plans(armatures, plans: Dict[str, RenamePlan], update_references: bool = True,
+                       metrics: TranslationMetrics = None) -> int:
+    """
+    Rename the bones of several armatures, and optionally everything that refers to them, as one transaction
+    
+    References are collected for every armature before any bone is renamed.
+    If renaming the bones or updating the references of any armature
+    fails, every armature renamed so far is restored, references included,
+    before the error is raised.
+    
+    Args:
+        plans (Dict[str, RenamePlan]): The plan for each armature object name
+    
+    Returns:
+        int: Number of updated references
+    """
+    if metrics is None:
+        metrics = TranslationMetrics()
+    with metrics.stage('reference_update'):
+        sweeps = [BoneReferenceSweep(armature, plans[armature.name].renames if update_references else {})
+                  for armature in armatures]
+    
+    applied = []
+    updated = 0
+    try:
+        for armature, sweep in zip(armatures, sweeps):
+            plan = plans[armature.name]
+            with metrics.stage('rename_apply'):
+                plan.apply(armature.data.bones)
+            applied.append((armature, plan, sweep))
+            with metrics.stage('reference_update'):
+                updated += sweep.apply()
+    except Exception:
+        # The failed apply() already undid its own changes
+        for armature, plan, sweep in reversed(applied):
+            sweep.undo()
+            plan.rollback(armature.data.bones, len(plan.steps))
+        raise
+    
+    for armature in armatures:
+        remember_rename_map(armature, plans[armature.name].renames)
+    return updated
+
+def apply_rename_plan(armature, plan: RenamePlan, update_references: bool = True,
+                      metrics: TranslationMetrics = None) -> int:
+    """
+    Rename an armature's bones and, optionally, everything that refers to them
+    
+    Returns:
+        int: Number of updated references
+    """
+    return apply_rename_plans([armature], {armature.name: plan}, update_references, metrics)
+
+class ARMATURE_OT_rename_bones(Operator):
+    bl_idname = "armature.rename_bones"
+    bl_label = "Rename Bones"
+    bl_description = "Rename bones from source format to target format"
+    
+    def execute(self, context):
+        props = context.scene.bone_renamer
+        
+        # Get the armatures
+        armatures = scene_armatures(context, props.scope)
+        if not armatures:
+            self.report({'ERROR'}, "Please select a valid armature!" if props.scope == 'ACTIVE' else "No armatures to rename")
+            return {'CANCELLED'}
+        
+        if props.source_format == 'mmd_japanese' and props.target_format == 'mmd_english':
+            # Use the Japanese to English translation
+            bpy.ops.armature.translate_jp_bones()
+            return {'FINISHED'}
+        
+        # Otherwise use the original bone mapping logic
+        try:
+            plans = self.rename_armatures(
+                armatures,
+                props.source_format, 
+                props.target_format, 
+                props.include_fingers,
+                dry_run=props.dry_run,
+                update_references=props.update_references,
+                fuzzy_threshold=props.match_threshold if props.fuzzy_matching else None
+            )
+            renamed = sum(len(plan.renames) for plan in plans.values())
+            if props.dry_run:
+                blocks = [show_plan_report(plan, bpy.data.objects[name]) for name, plan in plans.items()]
+                self.report({'INFO'}, f"Planned {renamed} renames, see text blocks: {', '.join(blocks)}")
+            else:
+                # Approximate matches are worth a look, so their plans are kept for review
+                blocks = [show_plan_report(plan, bpy.data.objects[name]) for name, plan in plans.items()
+                          if plan.matches.count('fuzzy')]
+                fuzzy = sum(plan.matches.count('fuzzy') for plan in plans.values())
+                message = f"Successfully renamed {renamed} bones in {len(plans)} armatures"
+                if fuzzy:
+                    message += f", {fuzzy} matched approximately, see text blocks: {', '.join(blocks)}"
+                self.report({'INFO'}, message)
+            return {'FINISHED'}
+        except Exception as e:
+            self.report({'ERROR'}, str(e))
+            return {'CANCELLED'}
+    
+    @staticmethod
+    def rename_bones(armature, source_format: str, target_format: str, include_fingers: bool,
+                     dry_run: bool = False, update_references: bool = True, fuzzy_threshold: float = None) -> RenamePlan:
+        return ARMATURE_OT_rename_bones.rename_armatures(
+            [armature], source_format, target_format, include_fingers, dry_run, update_references, fuzzy_threshold
+        )[armature.name]
+    
+    @staticmethod
+    def rename_armatures(armatures, source_format: str, target_format: str, include_fingers: bool,
+                         dry_run: bool = False, update_references: bool = True,
+                         fuzzy_threshold: float = None) -> Dict[str, RenamePlan]:
+        """
+        Convert the bone names of several armatures
+        
+        The names of all armatures in one source format are matched in a
+        single pass (see match_bone_names); each armature then gets its own
+        plan, so collisions are resolved per armature.
+        
+        Returns:
+            Dict[str, RenamePlan]: The plan for each armature object name
+        """
+        by_format = {}
+        for armature in armatures:
+            armature_format = source_format
+            if armature_format == 'unknown':
+                armature_format = detect_bone_format(bone_hierarchy(armature)).format
+                if armature_format == 'unknown':
+                    raise ValueError(f"Could not detect the source bone format of {armature.name}")
+            by_format.setdefault(armature_format, []).append(armature)
+        
+        plans = {}
+        for armature_format, group in by_format.items():
+            names = dict.fromkeys(bone.name for armature in group for bone in armature.data.bones)
+            matches = match_bone_names(names, armature_format, target_format, include_fingers, fuzzy_threshold)
+            for armature in group:
+                bone_names = [bone.name for bone in armature.data.bones]
+                plan = plans[armature.name] = plan_renames(bone_names, matches.renames)
+                plan.matches = matches.subset(bone_names) if len(group) > 1 else matches
         
         # Perform the renaming
-        for bone, new_name in bones_to_rename:
+        if not dry_run:
+            try:
+                apply_rename_plans(armatures, plans, update_references)
+            except Exception as e:
+                raise RuntimeError(f"Renaming failed, all changes were undone: {str(e)}") from e
+        return plans
+
+class ARMATURE_OT_detect_format(Operator):
+    bl_idname = "armature.detect_format"
+    bl_label = "Detect Format"
+    bl_description = "Detect the naming format of the armature's bones and use it as the source format"
+    
+    def execute(self, context):
+        props = context.scene.bone_renamer
+        armature = bpy.data.objects.get(props.source_object)
+        if not armature or armature.type != 'ARMATURE':
+            self.report({'ERROR'}, "Please select a valid armature!")
+            return {'CANCELLED'}
+        
+        detection = detect_bone_format(bone_hierarchy(armature))
+        if detection.format == 'unknown':
+            self.report({'WARNING'}, "No known bone names found")
+            return {'CANCELLED'}
+        
+        props.source_format = detection.format
+        confidence = sum(detection.confidence.values()) / len(detection.confidence)
+        label = next(label for key, label, _ in BONE_MAPS if key == detection.format)
+        self.report({'INFO'}, f"Detected {label}: {len(detection.confidence)} bones recognised, "
+                              f"average confidence {confidence:.0%}")
+        return {'FINISHED'}
+
+class ARMATURE_OT_export_rename_map(Operator):
+    bl_idname = "armature.export_rename_map"
+    bl_label = "Export Rename Map"
+    bl_description = "Save the renames applied to the picked armature as a JSON or CSV rename map"
+    
+    filepath: StringProperty(subtype='FILE_PATH')
+    filter_glob: StringProperty(default="*.json;*.csv", options={'HIDDEN'})
+    
+    def invoke(self, context, event):
+        armature = bpy.data.objects.get(context.scene.bone_renamer.source_object)
+        if not self.filepath and armature:
+            self.filepath = f"{bpy.path.clean_name(armature.name)}_rename_map.json"
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+    
+    def execute(self, context):
+        armature = bpy.data.objects.get(context.scene.bone_renamer.source_object)
+        if not armature or armature.type != 'ARMATURE':
+            self.report({'ERROR'}, "Please select a valid armature!")
+            return {'CANCELLED'}
+        renames = stored_rename_map(armature)
+        if not renames:
+            self.report({'ERROR'}, f"No renames recorded for {armature.name}")
+            return {'CANCELLED'}
+        
+        path = bpy.path.abspath(self.filepath)
+        try:
+            write_rename_map(path, renames, armature=armature.name, blender=bpy.app.version_string)
+        except OSError as e:
+            self.report({'ERROR'}, f"Could not write {path}: {str(e)}")
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"Saved {len(renames)} renames to {path}")
+        return {'FINISHED'}
+
+class ARMATURE_OT_apply_rename_map(Operator):
+    bl_idname = "armature.apply_rename_map"
+    bl_label = "Apply Rename Map"
+    bl_description = "Rename bones from a saved rename map, without dictionary or online lookups"
+    
+    filepath: StringProperty(subtype='FILE_PATH')
+    filter_glob: StringProperty(default="*.json;*.csv", options={'HIDDEN'})
+    target: EnumProperty(
+        items=[
+            ('ARMATURES', "Armatures", "Rename the bones of the armatures in scope, with their animation and references"),
+            ('ACTIONS', "All Actions", "Rename the bone channels of every action, e.g. motions imported without their model"),
+        ],
+        name="Apply To",
+        default='ARMATURES'
+    )
+    
+    def invoke(self, context, event):
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+    
+    def execute(self, context):
+        props = context.scene.bone_renamer
+        path = bpy.path.abspath(self.filepath)
+        try:
+            renames = read_rename_map(path)
+        except (OSError, ValueError) as e:
+            self.report({'ERROR'}, f"Could not read rename map: {str(e)}")
+            return {'CANCELLED'}
+        
+        if self.target == 'ACTIONS':
+            count = sum(rename_action_bones(action, renames) for action in bpy.data.actions)
+            self.report({'INFO'}, f"Updated {count} channels in {len(bpy.data.actions)} actions")
+            return {'FINISHED'}
+        
+        armatures = scene_armatures(context, props.scope)
+        if not armatures:
+            self.report({'ERROR'}, "Please select a valid armature!" if props.scope == 'ACTIVE' else "No armatures to rename")
+            return {'CANCELLED'}
+        
+        plans = {armature.name: plan_renames([bone.name for bone in armature.data.bones], renames)
+                 for armature in armatures}
+        if props.dry_run:
+            for armature in armatures:
+                plan = plans[armature.name]
+                self.report({'INFO'}, f"Planned {len(plan.renames)} renames, see text block '{show_plan_report(plan, armature)}'")
+            return {'FINISHED'}
+        try:
+            apply_rename_plans(armatures, plans, props.update_references)
+        except Exception as e:
+            self.report({'ERROR'}, f"Renaming failed, all changes were undone: {str(e)}")
+            return {'CANCELLED'}
+        renamed = sum(len(plan.renames) for plan in plans.values())
+        self.report({'INFO'}, f"Renamed {renamed} bones in {len(armatures)} armatures")
+        return {'FINISHED'}
+
+class PICK_OT_armature(Operator):
+    bl_idname = "armature.pick_source"
+    bl_label = "Pick Armature"
+    bl_description = "Pick the armature from the 3D viewport"
+    
+    def execute(self, context):
+        if not context.active_object:
+            show_message("No active object selected!", "Error", 'ERROR')
+            return {'CANCELLED'}
+            
+        if context.active_object.type != 'ARMATURE':
+            show_message("Selected object is not an armature!", "Error", 'ERROR')
+            return {'CANCELLED'}
+            
+        context.scene.bone_renamer.source_object = context.active_object.name
+        show_message(f"Selected armature: {context.active_object.name}", "Success", 'INFO')
+        return {'FINISHED'}
+
+class ARMATURE_OT_toggle_names(Operator):
+    bl_idname = "armature.toggle_names"
+    bl_label = "Toggle Names Display"
+    bl_description = "Toggle visibility of bone names in viewport"
+    
+    def execute(self, context):
+        show_names = None  # To track the first armature's state
+        toggled_count = 0
+        
+        for obj in context.scene.objects:
+            if obj.type == 'ARMATURE':
+                if show_names is None:
+                    # Use first armature's state to determine what to do
+                    show_names = not obj.data.show_names
+                
+                obj.data.show_names = show_names
+                toggled_count += 1
+        
+        if toggled_count > 0:
+            state = "on" if show_names else "off"
+            show_message(f"Turned bone names display {state} for {toggled_count} armatures", "Success", 'INFO')
+        else:
+            show_message("No armatures found in scene", "Info", 'INFO')
+            
+        return {'FINISHED'}
+
+class ARMATURE_OT_translate_jp_bones(Operator):
+    """
+    Translate Japanese bone names to English
+    
+    Run from the panel, the operator is modal: lookups run on a background
+    thread, renames are applied on the main thread a chunk at a time, and
+    Esc cancels and undoes the renames applied so far. Called from a
+    script it runs synchronously. With a scope of several armatures, the
+    names of all of them are translated in one batch, and then each
+    armature gets its own rename plan.
+    """
+    bl_idname = "armature.translate_jp_bones"
+    bl_label = "Translate Japanese Names"
+    bl_description = "Translate Japanese bone names to English"
+    
+    # Number of rename steps applied per timer tick in modal mode
+    chunk_size = 50
+    # Progress text of the running modal translation, shown in the panel
+    status = ""
+    
+    def get_armatures(self, context) -> List:
+        props = context.scene.bone_renamer
+        
+        # Get the armatures
+        armatures = scene_armatures(context, props.scope)
+        if not armatures:
+            self.report({'ERROR'}, "Please select a valid armature!" if props.scope == 'ACTIVE' else "No armatures to rename")
+            return []
+        
+        # Ensure we're in object mode
+        if context.active_object and context.active_object.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+        return armatures
+    
+    def start_run(self, props, armatures):
+        """Reset the counters and pick the bones to translate on every armature"""
+        self._service_stats = translation_service.stats()
+        self._metrics = TranslationMetrics()
+        self._label = armatures[0].name if len(armatures) == 1 else f"{len(armatures)} armatures"
+        self.skipped_count = 0
+        self.online_count = 0
+        self.cached_count = 0
+        self.fallback_count = 0
+        self.earlier_count = 0
+        self._targets = []
+        for armature in armatures:
+            bones = armature.data.bones
+            names = untranslated_bone_names(bones) if props.incremental else [bone.name for bone in bones]
+            self.earlier_count += len(bones) - len(names)
+            self._targets.append({'armature': armature.name, 'names': names, 'plan': None, 'sweep': None})
+    
+    def unique_names(self) -> List[str]:
+        """Bone names to translate, each only once however many armatures share it"""
+        return list(dict.fromkeys(name for target in self._targets for name in target['names']))
+    
+    def build_plan(self, props, bones, translations: Dict[str, str]) -> RenamePlan:
+        """Plan the renames of one armature and count how each bone was handled"""
+        sources = self._metrics.sources
+        
+        requested = {}
+        for bone in bones:
+            if bone.name not in translations:
+                continue  # Translated by an earlier incremental run
             try:
-                bone.name = new_name
-                translated_count += 1
+                new_name = translations[bone.name]
+                
+                if new_name != bone.name:
+                    requested[bone.name] = new_name
+                    source = sources.get(bone.name)
+                    if source in ('online', 'cache'):
+                        self.online_count += 1
+                        if source == 'cache':
+                            self.cached_count += 1
+                    elif source == 'dictionary':
+                        self.fallback_count += 1
+                else:
+                    self.skipped_count += 1
+                    
             except Exception as e:
-                self.report({'WARNING'}, f"Failed to rename {bone.name}: {str(e)}")
-                skipped_count += 1
+                self.report({'WARNING'}, f"Failed to process {bone.name}: {str(e)}")
+                self.skipped_count += 1
+        
+        return plan_renames([bone.name for bone in bones], requested)
+    
+    def plan_targets(self, props, translations: Dict[str, str]) -> bool:
+        """
+        Plan every armature's renames and, unless previewing, collect their references
+        
+        Returns:
+            bool: False when previewing, after the plans were written to text blocks
+        """
+        for target in self._targets:
+            armature = bpy.data.objects[target['armature']]
+            names = set(target['names'])
+            target['plan'] = self.build_plan(
+                props, armature.data.bones, {name: translations[name] for name in names}
+            )
+        if props.dry_run:
+            blocks = [show_plan_report(target['plan'], bpy.data.objects[target['armature']]) for target in self._targets]
+            renames = sum(len(target['plan'].renames) for target in self._targets)
+            self.report({'INFO'}, f"Planned {renames} renames, see text blocks: {', '.join(blocks)}")
+            return False
+        
+        # References are collected under the old names, before any armature is renamed
+        with self._metrics.stage('reference_update'):
+            for target in self._targets:
+                armature = bpy.data.objects[target['armature']]
+                target['sweep'] = BoneReferenceSweep(armature, target['plan'].renames if props.update_references else {})
+        return True
+    
+    def rollback(self, current: int, applied: int):
+        """Undo the renames of the armature being renamed and of all before it"""
+        for index in range(current, -1, -1):
+            target = self._targets[index]
+            armature = bpy.data.objects.get(target['armature'])
+            if armature is not None:
+                target['plan'].rollback(armature.data.bones, applied if index == current else len(target['plan'].steps))
+    
+    def finish_targets(self):
+        """
+        Update the references and mark the translated bones once every armature is renamed
+        
+        If updating the references fails, the references and the renames of
+        every armature are undone before the error is raised.
+        """
+        applied = []
+        try:
+            with self._metrics.stage('reference_update'):
+                for target in self._targets:
+                    # A failing apply() undoes its own writes
+                    target['sweep'].apply()
+                    applied.append(target['sweep'])
+        except Exception:
+            for sweep in reversed(applied):
+                sweep.undo()
+            last = len(self._targets) - 1
+            self.rollback(last, len(self._targets[last]['plan'].steps))
+            raise
+        for target in self._targets:
+            armature = bpy.data.objects[target['armature']]
+            record_translations(armature.data.bones, target['names'], target['plan'].renames)
+            remember_rename_map(armature, target['plan'].renames)
+    
+    def online_failures(self) -> str:
+        """Summary of the failed online lookups in this run, or an empty string"""
+        before = getattr(self, '_service_stats', None)
+        if before is None:
+            return ""
+        after = translation_service.stats()
+        failed = after["failed_calls"] - before["failed_calls"]
+        skipped = after["short_circuited"] - before["short_circuited"] + after["negative_hits"] - before["negative_hits"]
+        if not failed and not skipped:
+            return ""
+        seconds = after["failed_seconds"] - before["failed_seconds"]
+        return f"{failed} online lookups failed ({seconds:.1f}s), {skipped} skipped after earlier failures"
+    
+    def report_result(self, props):
+        plans = [target['plan'] for target in self._targets]
+        translated_count = sum(len(plan.renames) for plan in plans)
+        conflict_count = sum(len(plan.conflicts) for plan in plans)
+        skipped_count = self.skipped_count
+        
+        if conflict_count:
+            self.report({'WARNING'}, f"{conflict_count} translated names were already taken and got a numeric suffix")
         
         # Create detailed success message
         if translated_count > 0:
-            message = f"Successfully renamed {translated_count} bones:\n"
+            message = f"Successfully renamed {translated_count} bones"
+            if len(plans) > 1:
+                message += f" in {len(plans)} armatures"
+            message += ":\n"
             if props.use_online_translation and GOOGLE_TRANSLATE_AVAILABLE:
-                message += f"• {online_count} bones translated online\n"
-                message += f"• {fallback_count} bones translated using dictionary"
+                message += f"• {self.online_count} bones translated online"
+                if self.cached_count:
+                    message += f" ({self.cached_count} from the translation cache)"
+                message += "\n"
+                message += f"• {self.fallback_count} bones translated using dictionary"
             else:
-                message += f"• {fallback_count} bones translated using dictionary"
+                message += f"• {self.fallback_count} bones translated using dictionary"
             
             if skipped_count > 0:
                 message += f"\n• {skipped_count} bones skipped (non-Japanese or errors)"
+            if self.earlier_count > 0:
+                message += f"\n• {self.earlier_count} bones already translated by an earlier run"
+            
+            failures = self.online_failures()
+            if failures:
+                message += f"\n• {failures}"
                 
             self.report({'INFO'}, message)
             show_message(message, "Translation Complete", 'INFO')
@@ -638,11 +3668,353 @@ class ARMATURE_OT_translate_jp_bones(Operator):
             message = "No Japanese bone names found to translate"
             if skipped_count > 0:
                 message += f"\n{skipped_count} bones were analyzed but didn't need translation"
+            if self.earlier_count > 0:
+                message += f"\n{self.earlier_count} bones were already translated by an earlier run"
             self.report({'INFO'}, message)
             show_message(message, "Translation Complete", 'INFO')
-            
+        
+        # The renames are done by now, so a log that cannot be written is only worth a warning
+        try:
+            metrics_text = show_metrics_report(self._metrics, self._label, props)
+        except OSError as e:
+            self.report({'WARNING'}, f"Could not write the timing log: {str(e)}")
+            return
+        if metrics_text:
+            self.report({'INFO'}, f"Timings written to text block '{metrics_text}'")
+    
+    def execute(self, context):
+        props = context.scene.bone_renamer
+        armatures = self.get_armatures(context)
+        if not armatures:
+            return {'CANCELLED'}
+        self.start_run(props, armatures)
+        
+        # Translate every name in one batch, then plan the renames
+        translations = translate_bone_names(
+            self.unique_names(),
+            use_online=props.use_online_translation,
+            timeout=props.translation_timeout,
+            metrics=self._metrics,
+            side_suffixes=props.side_suffixes
+        )
+        if not self.plan_targets(props, translations):
+            return {'FINISHED'}
+        
+        # Perform the renaming as one transaction
+        for index, target in enumerate(self._targets):
+            bones = bpy.data.objects[target['armature']].data.bones
+            try:
+                with self._metrics.stage('rename_apply'):
+                    target['plan'].apply(bones)
+            except Exception as e:
+                # apply() already undid this armature's renames, undo the ones before it
+                self.rollback(index, 0)
+                self.report({'ERROR'}, f"Renaming failed, all changes were undone: {str(e)}")
+                return {'CANCELLED'}
+        try:
+            self.finish_targets()
+        except Exception as e:
+            self.report({'ERROR'}, f"Updating bone references failed, all changes were undone: {str(e)}")
+            return {'CANCELLED'}
+        
+        self.report_result(props)
+        return {'FINISHED'}
+    
+    def invoke(self, context, event):
+        props = context.scene.bone_renamer
+        if type(self).status:
+            self.report({'WARNING'}, "A translation is already running")
+            return {'CANCELLED'}
+        armatures = self.get_armatures(context)
+        if not armatures:
+            return {'CANCELLED'}
+        
+        self.start_run(props, armatures)
+        # Load the vocabulary here: finding its files uses the Blender API, which the thread must not
+        get_jp_matcher()
+        self._planned = False
+        self._current = 0
+        self._next_step = 0
+        self._lookups = (0, 0)
+        self._result = {}
+        self._cancel = threading.Event()
+        self._thread = threading.Thread(
+            target=self._translate_in_background,
+            args=(self.unique_names(), props.use_online_translation, props.translation_timeout,
+                  props.side_suffixes),
+            daemon=True
+        )
+        self._thread.start()
+        
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(0.1, window=context.window)
+        wm.modal_handler_add(self)
+        wm.progress_begin(0, 100)
+        self.set_status(context, 0.0, "Translating bone names")
+        return {'RUNNING_MODAL'}
+    
+    def _translate_in_background(self, names: List[str], use_online: bool, timeout: float, side_suffixes: bool):
+        try:
+            self._result['translations'] = translate_bone_names(
+                names, use_online, timeout, cancel=self._cancel, progress=self._set_lookups,
+                metrics=self._metrics, side_suffixes=side_suffixes
+            )
+        except Exception as e:
+            self._result['error'] = e
+    
+    def _set_lookups(self, done: int, total: int):
+        self._lookups = (done, total)
+    
+    def set_status(self, context, fraction: float, text: str):
+        type(self).status = f"{text}: {fraction * 100:.0f}% (Esc to cancel)"
+        context.window_manager.progress_update(fraction * 100)
+        if context.workspace:
+            context.workspace.status_text_set(type(self).status)
+        for area in context.screen.areas if context.screen else ():
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+    
+    def finish(self, context):
+        self._cancel.set()
+        wm = context.window_manager
+        wm.event_timer_remove(self._timer)
+        wm.progress_end()
+        if context.workspace:
+            context.workspace.status_text_set(None)
+        type(self).status = ""
+        for area in context.screen.areas if context.screen else ():
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+    
+    def cancel(self, context):
+        # Called by Blender when the modal operator is aborted, e.g. on file load
+        self.finish(context)
+    
+    def modal(self, context, event):
+        props = context.scene.bone_renamer
+        missing = any(bpy.data.objects.get(target['armature']) is None for target in self._targets)
+        
+        if event.type == 'ESC' or missing:
+            if self._planned:
+                self.rollback(self._current, self._next_step)
+            self.finish(context)
+            self.report({'WARNING'}, "Translation cancelled, no bones were renamed")
+            return {'CANCELLED'}
+        
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+        
+        # Phase 1: wait for the background lookups
+        if self._thread.is_alive():
+            done, total = self._lookups
+            self.set_status(context, 0.5 * done / total if total else 0.0, "Translating bone names")
+            return {'RUNNING_MODAL'}
+        
+        if 'error' in self._result:
+            self.finish(context)
+            self.report({'ERROR'}, f"Translation failed: {str(self._result['error'])}")
+            return {'CANCELLED'}
+        
+        if not self._planned:
+            # Nothing is renamed yet, but the status, timer and progress bar must still be cleared
+            try:
+                planned = self.plan_targets(props, self._result['translations'])
+            except Exception as e:
+                self.finish(context)
+                self.report({'ERROR'}, f"Planning the renames failed, no bones were renamed: {str(e)}")
+                return {'CANCELLED'}
+            if not planned:
+                self.finish(context)
+                return {'FINISHED'}
+            self._planned = True
+        
+        # Phase 2: apply the renames a chunk at a time, one armature after another
+        target = self._targets[self._current]
+        bones = bpy.data.objects[target['armature']].data.bones
+        try:
+            with self._metrics.stage('rename_apply'):
+                self._next_step = target['plan'].apply(bones, self._next_step, self._next_step + self.chunk_size)
+        except Exception as e:
+            self.rollback(self._current, self._next_step)
+            self.finish(context)
+            self.report({'ERROR'}, f"Renaming failed, all changes were undone: {str(e)}")
+            return {'CANCELLED'}
+        
+        if self._next_step >= len(target['plan'].steps) and self._current + 1 < len(self._targets):
+            self._current += 1
+            self._next_step = 0
+        total = sum(len(target['plan'].steps) for target in self._targets)
+        done = sum(len(target['plan'].steps) for target in self._targets[:self._current]) + self._next_step
+        if done < total:
+            self.set_status(context, 0.5 + 0.5 * done / total, "Renaming bones")
+            return {'RUNNING_MODAL'}
+        
+        try:
+            self.finish_targets()
+        except Exception as e:
+            self.finish(context)
+            self.report({'ERROR'}, f"Updating bone references failed, all changes were undone: {str(e)}")
+            return {'CANCELLED'}
+        self.finish(context)
+        self.report_result(props)
         return {'FINISHED'}
 
+class ImportTranslationQueue:
+    """
+    Translates the bones of newly imported armatures in the background
+    
+    The depsgraph handler only notes armatures that did not exist before.
+    A timer waits until none have appeared for `delay` seconds, so a bulk
+    import becomes a single job, translates the unique names of all queued
+    armatures in one background batch, and then applies the renames on the
+    main thread.
+    """
+    # Seconds without new armatures before a job starts
+    delay = 1.0
+    # Seconds between checks on a running job
+    poll_interval = 0.2
+    
+    def __init__(self):
+        self.known = None  # session_uid of every armature seen so far, None until the first update
+        self.pending = set()  # Names of new armature objects waiting for the next job
+        self.deadline = 0.0
+        self.job = None
+        self.status = ""
+    
+    def reset(self):
+        """Forget what was seen, e.g. after loading a file; existing armatures never count as imported"""
+        self.known = None
+        self.pending.clear()
+    
+    def note_updates(self, scene, depsgraph):
+        props = getattr(scene, 'bone_renamer', None)
+        if props is None or not props.auto_translate_imports:
+            return
+        if self.known is None:
+            self.known = {obj.session_uid for obj in bpy.data.objects if obj.type == 'ARMATURE'}
+            return
+        
+        found = False
+        for update in depsgraph.updates:
+            obj = update.id.original
+            if not isinstance(obj, bpy.types.Object) or obj.type != 'ARMATURE' or obj.session_uid in self.known:
+                continue
+            self.known.add(obj.session_uid)
+            self.pending.add(obj.name)
+            found = True
+        
+        if found:
+            # Every new import pushes the job back, so a bulk import is coalesced into one
+            self.deadline = time.monotonic() + self.delay
+            if not bpy.app.timers.is_registered(_process_import_queue):
+                bpy.app.timers.register(_process_import_queue, first_interval=self.delay)
+    
+    def tick(self):
+        """Timer callback: returns the seconds until the next call, or None when idle"""
+        if self.job is None:
+            wait = self.deadline - time.monotonic()
+            if wait > 0:
+                return wait
+            return self.poll_interval if self.start_job() else None
+        
+        if self.job['thread'].is_alive():
+            return self.poll_interval
+        job, self.job = self.job, None
+        self.set_status("")
+        self.apply_job(job)
+        # Models imported while the job was running get their own job
+        return self.delay if self.pending else None
+    
+    def start_job(self) -> bool:
+        """Translate the names of every queued armature that has Japanese bone names"""
+        props = bpy.context.scene.bone_renamer
+        armatures = {}
+        for name in sorted(self.pending):
+            obj = bpy.data.objects.get(name)
+            if obj is None or obj.type != 'ARMATURE':
+                continue
+            names = untranslated_bone_names(obj.data.bones)
+            if any(contains_japanese(bone_name) for bone_name in names):
+                armatures[name] = names
+        self.pending.clear()
+        if not armatures:
+            return False
+        
+        unique = list(dict.fromkeys(name for names in armatures.values() for name in names))
+        job = {'armatures': armatures, 'cancel': threading.Event()}
+        # Read the settings here: the scene may change or be freed while the thread runs
+        use_online, timeout, side_suffixes = props.use_online_translation, props.translation_timeout, props.side_suffixes
+        # Likewise the vocabulary: finding its files uses the Blender API
+        get_jp_matcher()
+        
+        def translate():
+            try:
+                job['translations'] = translate_bone_names(
+                    unique, use_online, timeout, cancel=job['cancel'], side_suffixes=side_suffixes
+                )
+            except Exception as e:
+                job['error'] = e
+        
+        job['thread'] = threading.Thread(target=translate, daemon=True)
+        job['thread'].start()
+        self.job = job
+        self.set_status(f"Translating {len(unique)} bone names of {len(armatures)} imported models")
+        return True
+    
+    def set_status(self, text: str):
+        self.status = text
+        for window in bpy.context.window_manager.windows:
+            for area in window.screen.areas:
+                if area.type == 'VIEW_3D':
+                    area.tag_redraw()
+    
+    def apply_job(self, job):
+        if 'error' in job:
+            print(f"Automatic translation of imported models failed: {str(job['error'])}")
+            return
+        props = bpy.context.scene.bone_renamer
+        translations = job['translations']
+        for name, names in job['armatures'].items():
+            obj = bpy.data.objects.get(name)
+            if obj is None:
+                continue
+            if obj.mode == 'EDIT':
+                # Bone names set now would be overwritten when leaving edit mode
+                self.pending.add(name)
+                continue
+            bones = obj.data.bones
+            requested = {bone_name: translations[bone_name] for bone_name in names
+                         if bone_name in translations and translations[bone_name] != bone_name}
+            plan = plan_renames([bone.name for bone in bones], requested)
+            try:
+                apply_rename_plan(obj, plan, props.update_references)
+            except Exception as e:
+                print(f"Renaming the bones of {name} failed, all changes were undone: {str(e)}")
+                continue
+            record_translations(bones, names, plan.renames)
+            print(f"Translated {len(plan.renames)} bone names of imported model {name}")
+    
+    def cancel(self):
+        """Stop waiting for a running job; its renames are never applied"""
+        if self.job is not None:
+            self.job['cancel'].set()
+        self.job = None
+        self.status = ""
+        self.reset()
+
+import_translation_queue = ImportTranslationQueue()
+
+def _process_import_queue():
+    return import_translation_queue.tick()
+
+@persistent
+def _note_imported_armatures(scene, depsgraph):
+    import_translation_queue.note_updates(scene, depsgraph)
+
+@persistent
+def _reset_import_queue(*args):
+    import_translation_queue.reset()
+
 class VIEW3D_PT_bone_renamer(Panel):
     bl_space_type = 'VIEW_3D'
     bl_region_type = 'UI'
@@ -656,9 +4028,11 @@ class VIEW3D_PT_bone_renamer(Panel):
         # Armature selection
         box = layout.box()
         box.label(text="Armature:")
-        row = box.row(align=True)
-        row.prop(props, "source_object", text="")
-        row.operator("armature.pick_source", text="", icon='EYEDROPPER')
+        box.prop(props, "scope", text="")
+        if props.scope == 'ACTIVE':
+            row = box.row(align=True)
+            row.prop(props, "source_object", text="")
+            row.operator("armature.pick_source", text="", icon='EYEDROPPER')
         
         # Translation options
         box = layout.box()
@@ -666,41 +4040,154 @@ class VIEW3D_PT_bone_renamer(Panel):
         box.prop(props, "use_online_translation")
         if props.use_online_translation:
             box.prop(props, "translation_timeout")
+        box.prop(props, "auto_translate_imports")
+        if import_translation_queue.status:
+            box.label(text=import_translation_queue.status, icon='TIME')
         
         # Format selection
         box = layout.box()
         box.label(text="Formats:")
-        box.prop(props, "source_format", text="From")
+        row = box.row(align=True)
+        row.prop(props, "source_format", text="From")
+        row.operator("armature.detect_format", text="", icon='VIEWZOOM')
         box.prop(props, "target_format", text="To")
         
         # Options
         box = layout.box()
         box.label(text="Options:")
         box.prop(props, "include_fingers")
+        box.prop(props, "fuzzy_matching")
+        if props.fuzzy_matching:
+            box.prop(props, "match_threshold")
+        box.prop(props, "update_references")
+        box.prop(props, "dry_run")
+        box.prop(props, "side_suffixes")
+        box.prop(props, "incremental")
+        box.prop(props, "write_metrics")
+        box.prop(props, "metrics_log")
         
         # Action buttons
         col = layout.column(align=True)
         col.operator("armature.rename_bones", icon='OUTLINER_OB_ARMATURE')
         col.operator("armature.translate_jp_bones", icon='FILE_REFRESH')
+        row = col.row(align=True)
+        row.operator("armature.export_rename_map", text="Export Map", icon='EXPORT')
+        row.operator("armature.apply_rename_map", text="Apply Map", icon='IMPORT')
+        
+        if ARMATURE_OT_translate_jp_bones.status:
+            layout.label(text=ARMATURE_OT_translate_jp_bones.status, icon='TIME')
 
 classes = (
     BoneRenamerProperties,
     ARMATURE_OT_rename_bones,
+    ARMATURE_OT_detect_format,
     PICK_OT_armature,
     ARMATURE_OT_toggle_names,
     ARMATURE_OT_translate_jp_bones,
+    ARMATURE_OT_export_rename_map,
+    ARMATURE_OT_apply_rename_map,
     VIEW3D_PT_bone_renamer
 )
 
 def register():
+    # Only registration happens here; the dictionary, the format indexes, the
+    # translation cache and googletrans are all loaded on first use
+    global translation_service, _pending_cache_path
+    translation_service = TranslationService()
     for cls in classes:
         bpy.utils.register_class(cls)
     bpy.types.Scene.bone_renamer = bpy.props.PointerProperty(type=BoneRenamerProperties)
+    
+    bpy.app.handlers.depsgraph_update_post.append(_note_imported_armatures)
+    bpy.app.handlers.load_post.append(_reset_import_queue)
+    
+    _pending_cache_path = get_cache_path()
 
 def unregister():
+    global translation_cache, _pending_cache_path, vocabulary, jp_matcher
+    if _note_imported_armatures in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_note_imported_armatures)
+    if _reset_import_queue in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_reset_import_queue)
+    if bpy.app.timers.is_registered(_process_import_queue):
+        bpy.app.timers.unregister(_process_import_queue)
+    import_translation_queue.cancel()
+    
     for cls in classes:
         bpy.utils.unregister_class(cls)
     del bpy.types.Scene.bone_renamer
+    
+    translation_service.close()
+    
+    translation_cache.close()
+    translation_cache = TranslationCache()
+    _pending_cache_path = None
+    # Rebuilt on next use, picking up changed overlay files
+    vocabulary = jp_matcher = None
+
+def run_blend_worker(argv: List[str]) -> int:
+    """
+    Rename every armature in the open file; run by run_batch in background Blender
+    
+    Writes the applied renames per armature as JSON to --result and saves
+    the file to --save-as.
+    """
+    import argparse
+    parser = argparse.ArgumentParser(prog="bone_renamer --blend-worker")
+    parser.add_argument('--blend-worker', action='store_true')
+    parser.add_argument('--mode', choices=('translate', 'convert'), default='translate')
+    parser.add_argument('--source-format', default='mmd_japanese')
+    parser.add_argument('--target-format', default='mmd_english')
+    parser.add_argument('--no-fingers', action='store_true')
+    parser.add_argument('--offline', action='store_true')
+    parser.add_argument('--lr-suffixes', action='store_true')
+    parser.add_argument('--timeout', type=float, default=2.0)
+    parser.add_argument('--cache', default=None, help="Translation cache to use instead of Blender's")
+    parser.add_argument('--no-cache', action='store_true')
+    parser.add_argument('--dictionary-dir', default=None, help="Dictionary overlays to use instead of Blender's")
+    parser.add_argument('--vocabulary', default=None)
+    parser.add_argument('--import', dest='import_path', default=None, help="PMX/PMD model to import first")
+    parser.add_argument('--save-as', required=True)
+    parser.add_argument('--result', required=True)
+    args = parser.parse_args(argv)
+    
+    global _pending_cache_path
+    if args.no_cache or args.cache:
+        with _cache_lock:
+            _pending_cache_path = args.cache
+    if args.dictionary_dir:
+        reload_dictionaries(args.dictionary_dir, args.vocabulary)
+    
+    if args.import_path:
+        bpy.ops.mmd_tools.import_model(filepath=args.import_path)
+    
+    armatures = {}
+    for obj in bpy.data.objects:
+        if obj.type == 'ARMATURE' and obj.data not in armatures:
+            armatures[obj.data] = obj
+    armatures = list(armatures.values())
+    
+    if args.mode == 'convert':
+        plans = ARMATURE_OT_rename_bones.rename_armatures(armatures, args.source_format, args.target_format, not args.no_fingers)
+    else:
+        # One translation batch for the names of every armature in the file
+        names = list(dict.fromkeys(bone.name for obj in armatures for bone in obj.data.bones))
+        translations = translate_bone_names(names, not args.offline, args.timeout, side_suffixes=args.lr_suffixes)
+        plans = {obj.name: plan_renames([bone.name for bone in obj.data.bones], translations) for obj in armatures}
+        apply_rename_plans(armatures, plans)
+    results = {name: plan.renames for name, plan in plans.items()}
+    
+    os.makedirs(os.path.dirname(os.path.abspath(args.save_as)), exist_ok=True)
+    bpy.ops.wm.save_as_mainfile(filepath=os.path.abspath(args.save_as))
+    with open(args.result, 'w', encoding='utf-8') as f:
+        json.dump({"armatures": results}, f, ensure_ascii=False)
+    return 0
 
 if __name__ == "__main__":
-    register()
\ No newline at end of file
+    if BPY_AVAILABLE:
+        register()
+        worker_args = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else []
+        if '--blend-worker' in worker_args:
+            sys.exit(run_blend_worker(worker_args))
+    else:
+        sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,82 @@
+"""
+Micro-benchmark: compiled DictionaryMatcher vs the old sorted replace loop
+
+Usage:
+    python benchmarks/bench_dictionary_matcher.py --bones 10000
+"""
+import argparse
+import importlib.util
+import os
+import random
+import sys
+import time
+
+ADDON_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "BoneRenamer_v1.2.py")
+
+
+def load_addon():
+    spec = importlib.util.spec_from_file_location("bone_renamer", ADDON_PATH)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["bone_renamer"] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def legacy_translate(text, mapping):
+    """The static fallback as it was before DictionaryMatcher"""
+    for jp, en in sorted(mapping.items(), key=lambda x: len(x[0]), reverse=True):
+        if jp in text:
+            text = text.replace(jp, en)
+    return text
+
+
+def synthetic_names(mapping, count, seed=0):
+    """Random bone names built from dictionary terms plus chain numbers"""
+    rng = random.Random(seed)
+    terms = list(mapping)
+    names = []
+    for _ in range(count):
+        name = "".join(rng.choice(terms) for _ in range(rng.randint(1, 3)))
+        if rng.random() < 0.6:
+            name += f"{rng.randint(1, 9)}_{rng.randint(1, 20)}"
+        names.append(name)
+    return names
+
+
+def time_call(func, names, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for name in names:
+            func(name)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--bones", type=int, default=10000, help="number of synthetic bone names")
+    parser.add_argument("--repeat", type=int, default=5, help="timing repetitions, best is reported")
+    args = parser.parse_args(argv)
+
+    addon = load_addon()
+    mapping = addon.JP_BONE_MAPPING
+    names = synthetic_names(mapping, args.bones)
+
+    start = time.perf_counter()
+    matcher = addon.DictionaryMatcher(mapping)
+    compile_time = time.perf_counter() - start
+
+    legacy = time_call(lambda name: legacy_translate(name, mapping), names, args.repeat)
+    compiled = time_call(matcher.translate, names, args.repeat)
+    differing = sum(legacy_translate(name, mapping) != matcher.translate(name) for name in names)
+
+    print(f"{len(names)} names, {len(mapping)} dictionary entries")
+    print(f"compile:       {compile_time * 1000:8.2f} ms")
+    print(f"legacy loop:   {legacy * 1000:8.2f} ms")
+    print(f"trie matcher:  {compiled * 1000:8.2f} ms  ({legacy / compiled:.1f}x)")
+    print(f"names translated differently: {differing}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else sys.argv[1:])
@@ -0,0 +1,90 @@
+"""
+Startup benchmark: time to import the addon and time to its first results
+
+Every sample runs in a fresh interpreter, so nothing is cached in memory,
+while the addon's bytecode is compiled once up front like Blender does.
+Timings are checked against the "startup" entry of thresholds.json, and
+the exit code is 1 when any of them is over its threshold.
+
+Usage:
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --samples 10 --update-thresholds
+"""
+import argparse
+import json
+import os
+import py_compile
+import subprocess
+import sys
+
+from bench_dictionary_matcher import ADDON_PATH
+from bench_translation import THRESHOLDS_PATH, THRESHOLD_HEADROOM
+
+# Sub-millisecond first calls vary more than that between runs, so no threshold goes below this
+MIN_THRESHOLD_MS = 5.0
+
+# Runs in the fresh interpreter and prints the timings in ms as JSON
+SAMPLE = """
+import importlib.util, json, sys, time
+started = time.perf_counter()
+spec = importlib.util.spec_from_file_location("bone_renamer", sys.argv[1])
+addon = importlib.util.module_from_spec(spec)
+sys.modules["bone_renamer"] = addon
+spec.loader.exec_module(addon)
+timings = {"import": time.perf_counter() - started}
+
+started = time.perf_counter()
+addon.translate_bone_names(["左腕", "髪1_1", "スカート前2.L"], use_online=False)
+timings["first_translation"] = time.perf_counter() - started
+
+started = time.perf_counter()
+addon.convert_bone_names(["左腕", "上半身"], "mmd_japanese", "mmd_english")
+timings["first_conversion"] = time.perf_counter() - started
+
+started = time.perf_counter()
+addon.detect_bone_format([("センター", None), ("上半身", "センター")])
+timings["first_detection"] = time.perf_counter() - started
+
+print(json.dumps({key: round(value * 1000, 3) for key, value in timings.items()}))
+"""
+
+
+def run_sample():
+    completed = subprocess.run([sys.executable, "-c", SAMPLE, ADDON_PATH], stdout=subprocess.PIPE,
+                               stderr=subprocess.DEVNULL, encoding="utf-8", check=True)
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--samples", type=int, default=5, help="fresh interpreters to run, best is reported")
+    parser.add_argument("--thresholds", default=THRESHOLDS_PATH, help="JSON file of maximum timings in ms")
+    parser.add_argument("--update-thresholds", action="store_true",
+                        help=f"rewrite the startup thresholds as {THRESHOLD_HEADROOM:g}x the measured timings")
+    args = parser.parse_args(argv)
+
+    py_compile.compile(ADDON_PATH, doraise=True)
+    samples = [run_sample() for _ in range(args.samples)]
+    results = {key: min(sample[key] for sample in samples) for key in samples[0]}
+
+    thresholds = {}
+    if os.path.exists(args.thresholds):
+        with open(args.thresholds, encoding="utf-8") as f:
+            thresholds = json.load(f)
+    if args.update_thresholds:
+        thresholds["startup"] = {key: round(max(value * THRESHOLD_HEADROOM, MIN_THRESHOLD_MS), 1) for key, value in results.items()}
+        with open(args.thresholds, "w", encoding="utf-8") as f:
+            json.dump(thresholds, f, indent=2, sort_keys=True)
+            f.write("\n")
+
+    limits = thresholds.get("startup", {})
+    failures = [f"{key}: {value:.1f} ms > {limits[key]:.1f} ms"
+                for key, value in results.items() if key in limits and value > limits[key]]
+    print(json.dumps({"samples": args.samples, "results_ms": results, "failures": failures}, indent=2))
+    for failure in failures:
+        print(f"REGRESSION {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else sys.argv[1:]))
@@ -0,0 +1,170 @@
+"""
+Translation benchmark suite on synthetic MMD armatures
+
+Runs without Blender and without network: online lookups go through
+StubTranslator. Each stage is timed on corpora of increasing size, results
+are written as JSON and compared against thresholds.json, and the exit
+code is 1 when any timing is over its threshold.
+
+Usage:
+    python benchmarks/bench_translation.py --output results.json
+    python benchmarks/bench_translation.py --sizes 100 1000 --update-thresholds
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+
+from bench_dictionary_matcher import load_addon
+
+DEFAULT_SIZES = (100, 1000, 10000, 100000)
+THRESHOLDS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "thresholds.json")
+THRESHOLD_HEADROOM = 3.0  # --update-thresholds allows this much slowdown over the measured time
+
+# Physics chain stems as they appear on typical MMD models
+CHAIN_STEMS = ("髪", "前髪", "後髪", "横髪", "アホ毛", "スカート前", "スカート後", "スカート横",
+               "袖", "リボン", "ネクタイ", "胸", "尻尾", "ケープ", "フリル")
+
+
+def synthetic_corpus(addon, count, seed=0):
+    """
+    Unique bone names like a large MMD armature
+
+    The standard skeleton and finger bones come first, then dictionary terms,
+    then numbered physics chains (some with full-width digits or .L/.R
+    suffixes) until count names exist.
+    """
+    rng = random.Random(seed)
+    column = addon.FORMAT_COLUMNS['mmd_japanese']
+    base = [row[column] for row in addon.BONE_NAMES + addon.FINGER_BONES if row[column]]
+    base += [jp for jp, _ in addon.JP_TO_EN_MAPPING]
+    names = list(dict.fromkeys(base))[:count]
+    seen = set(names)
+
+    stems = list(CHAIN_STEMS) + [jp for jp, _ in addon.JP_TO_EN_MAPPING]
+    chain = 0
+    while len(names) < count:
+        chain += 1
+        stem = rng.choice(stems)
+        suffix = rng.choice(("", "", ".L", ".R"))
+        for link in range(1, rng.randint(4, 16)):
+            name = f"{stem}{chain}_{link}"
+            if rng.random() < 0.1:
+                name = name.translate(str.maketrans("0123456789", "０１２３４５６７８９"))
+            name += suffix
+            if name not in seen:
+                seen.add(name)
+                names.append(name)
+                if len(names) == count:
+                    break
+    return names
+
+
+def best_time(func, repeat, setup=None):
+    """Fastest of repeat runs of func, calling setup untimed before each"""
+    best = float("inf")
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def clear_name_memos(addon):
+    """Forget memoized name normalizations, so every timed run pays for them as a new armature would"""
+    addon._clean.cache_clear()
+    addon._split.cache_clear()
+
+
+def run_benchmarks(addon, sizes, repeat):
+    """Time every stage on every corpus size, in milliseconds"""
+    results = {}
+    for size in sizes:
+        names = synthetic_corpus(addon, size)
+        stems = {addon.tokenize_bone_name(name)[0] for name in names}
+        stub = addon.StubTranslator({stem: addon.translate_static(stem) for stem in stems})
+        service = addon.TranslationService.for_backend(stub)
+        addon.translation_cache = addon.TranslationCache()
+        # Warm the cache so the timed runs measure the cached-online path
+        addon.translate_bone_names(names, translator=service)
+        translations = addon.translate_bone_names(names, use_online=False)
+
+        timings = {
+            "clean": lambda: [addon.clean_bone_name(name) for name in names],
+            "dictionary": lambda: addon.translate_bone_names(names, use_online=False),
+            "cached_online": lambda: addon.translate_bone_names(names, translator=service),
+            "rename_plan": lambda: addon.plan_renames(names, addon.translate_bone_names(names, use_online=False)),
+        }
+        for stage, func in timings.items():
+            elapsed = best_time(func, repeat, setup=lambda: clear_name_memos(addon))
+            results.setdefault(stage, {})[str(size)] = round(elapsed * 1000, 3)
+        service.close()
+
+        plan = addon.plan_renames(names, translations)
+        print(f"{size:>7} names: {len(stems)} stems, {len(plan.renames)} renames, "
+              f"{stub.calls} stub calls", file=sys.stderr)
+    return results
+
+
+def check_thresholds(results, thresholds):
+    """List every timing that is over its threshold"""
+    failures = []
+    for stage, by_size in results.items():
+        for size, elapsed in by_size.items():
+            limit = thresholds.get(stage, {}).get(size)
+            if limit is not None and elapsed > limit:
+                failures.append(f"{stage} @ {size}: {elapsed:.1f} ms > {limit:.1f} ms")
+    return failures
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="corpus sizes to run")
+    parser.add_argument("--repeat", type=int, default=3, help="timing repetitions, best is reported")
+    parser.add_argument("--output", help="write the JSON results to this file instead of stdout")
+    parser.add_argument("--thresholds", default=THRESHOLDS_PATH, help="JSON file of maximum timings in ms")
+    parser.add_argument("--update-thresholds", action="store_true",
+                        help=f"rewrite the thresholds as {THRESHOLD_HEADROOM:g}x the measured timings")
+    args = parser.parse_args(argv)
+
+    addon = load_addon()
+    results = run_benchmarks(addon, args.sizes, args.repeat)
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "results_ms": results,
+    }
+
+    thresholds = {}
+    if os.path.exists(args.thresholds):
+        with open(args.thresholds, encoding="utf-8") as f:
+            thresholds = json.load(f)
+    if args.update_thresholds:
+        for stage, by_size in results.items():
+            for size, elapsed in by_size.items():
+                thresholds.setdefault(stage, {})[size] = round(max(elapsed * THRESHOLD_HEADROOM, 1.0), 1)
+        with open(args.thresholds, "w", encoding="utf-8") as f:
+            json.dump(thresholds, f, indent=2, sort_keys=True)
+            f.write("\n")
+
+    report["failures"] = check_thresholds(results, thresholds)
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    for failure in report["failures"]:
+        print(f"REGRESSION {failure}", file=sys.stderr)
+    return 1 if report["failures"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else sys.argv[1:]))
@@ -0,0 +1,17 @@
+import importlib.util
+import os
+import sys
+
+import pytest
+
+ADDON_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "BoneRenamer_v1.2.py")
+
+
+@pytest.fixture(scope="session")
+def addon():
+    """The addon module, imported the way the benchmarks do (it runs without Blender)"""
+    spec = importlib.util.spec_from_file_location("bone_renamer", ADDON_PATH)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["bone_renamer"] = module
+    spec.loader.exec_module(module)
+    return module
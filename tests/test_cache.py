@@ -0,0 +1,88 @@
+import sqlite3
+import time
+
+import pytest
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "cache" / "translations.sqlite3")
+
+
+def backdate(path, text, days):
+    with sqlite3.connect(path) as db:
+        db.execute("UPDATE translations SET created=? WHERE text=?", (time.time() - days * 86400.0, text))
+
+
+def test_reopen_and_warm(addon, cache_path):
+    cache = addon.PersistentTranslationCache(cache_path)
+    cache.set(addon.translation_key("腕"), "arm")
+    cache.close()
+
+    cache = addon.PersistentTranslationCache(cache_path)
+    assert cache.load() == 1
+    assert cache._cache == {addon.translation_key("腕"): "arm"}
+    cache.close()
+
+
+def test_keys_include_backend_and_languages(addon, cache_path):
+    cache = addon.PersistentTranslationCache(cache_path)
+    cache.set(addon.translation_key("腕"), "arm")
+    cache.set(addon.translation_key("腕", dest="de"), "Arm")
+    cache.set(addon.translation_key("腕", translator="stub"), "stub arm")
+    cache.close()
+
+    cache = addon.PersistentTranslationCache(cache_path)
+    assert cache.get(addon.translation_key("腕")) == "arm"
+    assert cache.get(addon.translation_key("腕", dest="de")) == "Arm"
+    assert cache.get(addon.translation_key("腕", translator="stub")) == "stub arm"
+    assert cache.get(addon.translation_key("腕", src="zh")) is None
+    cache.close()
+
+
+def test_old_entries_expire(addon, cache_path):
+    cache = addon.PersistentTranslationCache(cache_path, max_age_days=30)
+    cache.set(addon.translation_key("腕"), "arm")
+    cache.set(addon.translation_key("脚"), "leg")
+    cache.close()
+    backdate(cache_path, "腕", 31)
+
+    cache = addon.PersistentTranslationCache(cache_path, max_age_days=30)
+    assert cache.get(addon.translation_key("腕")) is None
+    assert cache.load() == 1
+    cache.close()
+    with sqlite3.connect(cache_path) as db:
+        assert db.execute("SELECT text FROM translations").fetchall() == [("脚",)]
+
+
+def test_oldest_entries_are_evicted_over_max_entries(addon, cache_path):
+    cache = addon.PersistentTranslationCache(cache_path)
+    for days, text in enumerate(("頭", "首", "腕")):
+        cache.set(addon.translation_key(text), text)
+        backdate(cache_path, text, 3 - days)
+    cache.close()
+
+    cache = addon.PersistentTranslationCache(cache_path, max_entries=2)
+    assert cache.load() == 2
+    assert set(key[-1] for key in cache._cache) == {"首", "腕"}
+    cache.close()
+
+
+def test_two_connections_share_the_file(addon, cache_path):
+    first = addon.PersistentTranslationCache(cache_path)
+    second = addon.PersistentTranslationCache(cache_path)
+    assert second.get(addon.translation_key("腕")) is None
+    first.set(addon.translation_key("腕"), "arm")
+    assert second.get(addon.translation_key("腕")) == "arm"
+    with sqlite3.connect(cache_path) as db:
+        assert db.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    first.close()
+    second.close()
+
+
+def test_bare_file_name(addon, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    cache = addon.PersistentTranslationCache("translations.sqlite3")
+    cache.set(addon.translation_key("腕"), "arm")
+    cache.close()
+    assert (tmp_path / "translations.sqlite3").exists()
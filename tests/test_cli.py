@@ -0,0 +1,128 @@
+import io
+import json
+
+import pytest
+
+
+class CountingInput(io.StringIO):
+    """stdin that counts the lines read so far"""
+    def __init__(self, text):
+        super().__init__(text)
+        self.lines_read = 0
+
+    def __iter__(self):
+        for line in iter(self.readline, ""):
+            self.lines_read += 1
+            yield line
+
+
+class RecordingOutput(io.StringIO):
+    """stdout that records how much input had been read at its first write"""
+    def __init__(self, source):
+        super().__init__()
+        self.source = source
+        self.read_at_first_write = None
+
+    def write(self, text):
+        if self.read_at_first_write is None:
+            self.read_at_first_write = self.source.lines_read
+        return super().write(text)
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_output_streams_before_the_input_is_read(addon, monkeypatch, tmp_path, jobs):
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    count = addon.CLI_CHUNK_SIZE * 8
+    names = [f"髪{index}_1" for index in range(count)]
+    stdin = CountingInput("\n".join(names) + "\n")
+    stdout = RecordingOutput(stdin)
+    monkeypatch.setattr("sys.stdin", stdin)
+    monkeypatch.setattr("sys.stdout", stdout)
+
+    assert addon.main(["--offline", "--no-cache", "--jobs", jobs, "--output-format", "jsonl"]) == 0
+
+    rows = [json.loads(line) for line in stdout.getvalue().splitlines()]
+    assert [row["name"] for row in rows] == names
+    assert rows[0]["translation"] == "hair0_1"
+    assert stdout.read_at_first_write < count
+
+
+def test_vocabulary_messages_stay_off_stdout(addon, monkeypatch, tmp_path, capsys):
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    monkeypatch.setattr(addon, "vocabulary", None)
+    monkeypatch.setattr(addon, "jp_matcher", None)
+
+    def read_only_save(self, path):
+        raise PermissionError("read-only config folder")
+    monkeypatch.setattr(addon.Vocabulary, "save", read_only_save)
+    opened = []
+    open_vocabulary = addon.open_vocabulary
+    monkeypatch.setattr(addon, "open_vocabulary", lambda *args: opened.append(args) or open_vocabulary(*args))
+    monkeypatch.setattr("sys.stdin", io.StringIO("左腕\n"))
+
+    assert addon.main(["--offline", "--no-cache", "--jobs", "1"]) == 0
+    captured = capsys.readouterr()
+    assert captured.out == "左腕\tleftarm\n"
+    assert "Could not save vocabulary" in captured.err
+    assert len(opened) == 1
+
+
+def test_batch_walk_skips_the_output_dir(addon, tmp_path):
+    (tmp_path / "model.json").write_text('["左腕"]', encoding="utf-8")
+    output = tmp_path / "out"
+    output.mkdir()
+    (output / "batch_report.json").write_text("{}", encoding="utf-8")
+    (output / "model.result.json").write_text("{}", encoding="utf-8")
+    files = addon.collect_batch_files([str(tmp_path)], str(output))
+    assert files == [str(tmp_path / "model.json")]
+
+
+def test_batch_inputs_by_type(addon, tmp_path):
+    for name in ("model.pmx", "bones.csv", "rig.blend", "names.txt"):
+        (tmp_path / name).write_bytes(b"\xff\xfe binary")
+    (tmp_path / "list.txt").write_text("names.txt\n# comment\nrig.blend\n", encoding="utf-8")
+    (tmp_path / "list.json").write_text('["model.pmx"]', encoding="utf-8")
+    files = addon.collect_batch_files([str(tmp_path / name) for name in ("model.pmx", "bones.csv", "list.txt", "list.json")])
+    assert files == [str(tmp_path / name) for name in ("model.pmx", "bones.csv", "names.txt", "rig.blend")]
+
+
+@pytest.mark.parametrize("manifest, content", [(None, None), ("list.txt", "model.fbx\n"), ("list.json", '{"a": 1}')])
+def test_unsupported_batch_inputs_are_rejected(addon, tmp_path, manifest, content):
+    (tmp_path / "model.fbx").write_bytes(b"\0")
+    source = tmp_path / "model.fbx"
+    if manifest:
+        source = tmp_path / manifest
+        source.write_text(content, encoding="utf-8")
+    with pytest.raises(ValueError):
+        addon.collect_batch_files([str(source)])
+
+
+def test_batch_outputs_keep_the_source_extension(addon, tmp_path):
+    paths = [str(tmp_path / "a.pmx"), str(tmp_path / "a.blend"), str(tmp_path / "sub" / "a.pmd")]
+    outputs = [addon.batch_output_path(path, str(tmp_path), "out") for path in paths]
+    assert len(set(outputs)) == 3
+    assert outputs[0] == addon.os.path.join("out", "a.pmx.blend")
+
+
+@pytest.mark.parametrize("cache_path, expected", [("cache.sqlite3", ["--cache", "cache.sqlite3"]), (None, ["--no-cache"])])
+def test_blender_workers_get_the_run_settings(addon, tmp_path, monkeypatch, cache_path, expected):
+    commands = []
+
+    def run(command, **kwargs):
+        commands.append(command)
+        result = command[command.index("--result") + 1]
+        with open(result, "w", encoding="utf-8") as f:
+            json.dump({"armatures": {"rig": {"左腕": "arm_L"}}}, f)
+        return addon.subprocess.CompletedProcess(command, 0, stdout="")
+
+    monkeypatch.setattr(addon.subprocess, "run", run)
+    options = {"mode": "translate", "source_format": "mmd_japanese", "target_format": "mmd_english",
+               "include_fingers": True, "use_online": False, "timeout": 1.0, "side_suffixes": False,
+               "blender": "blender", "cache_path": cache_path, "overlay_dir": "overlays",
+               "vocabulary_path": "vocabulary.bin"}
+    report = addon._process_batch_file(str(tmp_path / "model.pmx"), str(tmp_path / "out" / "model.pmx.blend"), options)
+    assert report["status"] == "ok" and report["renamed"] == 1
+    command = commands[0]
+    assert " ".join(expected) in " ".join(command)
+    assert command[command.index("--dictionary-dir") + 1] == "overlays"
+    assert command[command.index("--vocabulary") + 1] == "vocabulary.bin"
@@ -0,0 +1,52 @@
+import pytest
+
+FORMATS = ["mmd_english", "xna_lara", "daz_poser", "blender_rigify", "sims_2", "motion_builder",
+           "3ds_max", "type_x", "bepu", "mmd_japanese", "mmd_japaneseLR"]
+
+
+def skeleton(addon, format_key, hierarchy=True):
+    """(name, parent) pairs of every bone the tables list for a format"""
+    column = addon.FORMAT_COLUMNS[format_key]
+    names = {row[0]: row[column] for row in addon.BONE_NAMES + addon.FINGER_BONES if row[column]}
+    return [(name, names.get(addon.BONE_PARENTS.get(english)) if hierarchy else None)
+            for english, name in names.items()]
+
+
+def test_every_format_is_listed(addon):
+    assert sorted(FORMATS) == sorted(addon.FORMAT_COLUMNS)
+
+
+@pytest.mark.parametrize("format_key", FORMATS)
+@pytest.mark.parametrize("hierarchy", [True, False], ids=["hierarchy", "names"])
+def test_each_format_is_detected(addon, format_key, hierarchy):
+    detection = addon.detect_bone_format(skeleton(addon, format_key, hierarchy))
+    assert detection.format == format_key
+    assert detection.confidence
+
+
+@pytest.mark.parametrize("format_key", [key for key in FORMATS if key != "xna_lara"])
+def test_hierarchy_check_keeps_the_right_format(addon, format_key):
+    # A margin of 0 sends every matching format to the hierarchy check
+    detection = addon.detect_bone_format(skeleton(addon, format_key), margin=0.0)
+    assert detection.used_topology
+    assert detection.format == format_key
+
+
+def test_parents_raise_confidence(addon):
+    with_parents = addon.detect_bone_format(skeleton(addon, "mmd_english"), margin=0.0)
+    without = addon.detect_bone_format(skeleton(addon, "mmd_english", hierarchy=False), margin=0.0)
+    assert with_parents.confidence["arm_L"] == 1.0
+    assert without.confidence["arm_L"] < 1.0
+
+
+@pytest.mark.parametrize("bones", [[], [("foo", None), ("bar", "foo")]], ids=["empty", "unknown names"])
+def test_unknown_names(addon, bones):
+    detection = addon.detect_bone_format(bones)
+    assert detection.format == "unknown" and detection.score == 0.0
+
+
+def test_names_shared_by_many_formats_are_ambiguous(addon):
+    detection = addon.detect_bone_format([("head", "neck"), ("neck", None)])
+    assert detection.used_topology
+    assert len(set(detection.scores.values())) == 1 and len(detection.scores) > 1
+    assert detection.confidence["neck"] == pytest.approx(1 / len(detection.scores))
@@ -0,0 +1,153 @@
+import json
+
+import pytest
+
+# Standard MMD helper bones next to the main bones they resemble
+HELPER_RIG = ["shoulderP_L", "shoulder_L", "shoulderC_L", "leg D_L", "knee D_L", "ankle D_L",
+              "leg_L", "upper body3", "upper body"]
+
+
+def test_normalized_variants(addon):
+    matches = addon.match_bone_names(["Left_Shoulder", "ＬｅｆｔＵｐＡｒｍ", "LeftUpArm.001"],
+                                     "motion_builder", "mmd_english")
+    assert matches.renames == {"Left_Shoulder": "shoulder_L", "ＬｅｆｔＵｐＡｒｍ": "arm_L", "LeftUpArm.001": "arm_L"}
+    assert {method for _, method, _ in matches.matches.values()} == {"normalized"}
+
+
+def test_fuzzy_is_off_without_threshold(addon):
+    matches = addon.match_bone_names(["LeftShouldr"], "motion_builder", "mmd_english")
+    assert matches.unmatched == ["LeftShouldr"]
+
+
+def test_fuzzy_matches_misspellings(addon):
+    matches = addon.match_bone_names(["RightShouldr", "LeftUpArn"], "motion_builder", "mmd_english",
+                                     fuzzy_threshold=0.8)
+    assert matches.renames == {"RightShouldr": "shoulder_R", "LeftUpArn": "arm_L"}
+    assert matches.count("fuzzy") == 2
+
+
+@pytest.mark.parametrize("rig", [HELPER_RIG, list(reversed(HELPER_RIG))])
+def test_helper_bones_keep_their_names(addon, rig):
+    matches = addon.match_bone_names(rig, "mmd_english", "mmd_japanese", fuzzy_threshold=0.8)
+    assert matches.renames == {"shoulder_L": "左肩", "leg_L": "左足", "upper body": "上半身"}
+    assert matches.count("fuzzy") == 0
+
+    plan = addon.plan_renames(rig, matches.renames)
+    assert plan.renames["shoulder_L"] == "左肩"
+    assert not plan.conflicts
+
+
+@pytest.mark.parametrize("name", ["shoulderP_L", "leg D_L", "upper body3", "左足ＩＫ2"])
+def test_whole_word_differences_are_not_misspellings(addon, name):
+    source = "mmd_japanese" if name.startswith("左") else "mmd_english"
+    matches = addon.match_bone_names([name], source, "motion_builder", fuzzy_threshold=0.5)
+    assert matches.count("fuzzy") == 0
+
+
+def test_exact_match_wins_over_fuzzy(addon):
+    matches = addon.match_bone_names(["LeftShouldr", "LeftShoulder"], "motion_builder", "mmd_english",
+                                     fuzzy_threshold=0.8)
+    assert matches.renames == {"LeftShoulder": "shoulder_L"}
+
+
+def test_row_claimed_by_two_fuzzy_matches_is_left_alone(addon):
+    matches = addon.match_bone_names(["RightShouldr", "RightShoulderr"], "motion_builder", "mmd_english",
+                                     fuzzy_threshold=0.8)
+    assert matches.renames == {}
+
+
+def test_sides_and_numbers_are_never_crossed(addon):
+    matches = addon.match_bone_names(["finger3-3.L", "Finger3-1.l"], "bepu", "mmd_english", fuzzy_threshold=0.5)
+    assert matches.renames["Finger3-1.l"] == addon.convert_bone_names(["finger3-1.L"], "bepu", "mmd_english")["finger3-1.L"]
+    matches = addon.match_bone_names(["RighUpArm"], "motion_builder", "mmd_english", fuzzy_threshold=0.5)
+    assert matches.unmatched == ["RighUpArm"]
+
+
+@pytest.fixture
+def matcher(addon):
+    return addon.BoneNameMatcher({"LeftArm": 0, "RightArm": 1, "LeftHand": 2, "LeftFinger1": 3})
+
+
+def test_matcher_stages(matcher):
+    assert matcher.match("LeftArm", 4) == (0, "exact", 1.0)
+    assert matcher.match("left_arm", 4) == (0, "normalized", 1.0)
+    assert matcher.match("LeftArn", 4) == (-1, "", 0.0)
+    row, method, score = matcher.match("LeftArn", 4, threshold=0.8)
+    assert (row, method) == (0, "fuzzy") and 0.8 <= score < 1.0
+
+
+def test_matcher_limits(matcher):
+    assert matcher.match("LeftFinger1", 3)[0] == -1
+    assert matcher.match("LeftArn", 4, threshold=0.8, taken_rows={0})[0] == -1
+    assert matcher.match("LeftArn", 4, threshold=0.99)[0] == -1
+
+
+def test_dictionary_matcher_is_leftmost_longest(addon):
+    matcher = addon.DictionaryMatcher({"親": "parent", "親指": "thumb", "指": "finger"})
+    assert matcher.translate("親指親") == "thumbparent"
+    assert matcher.translate("左親指先") == "左thumb先"
+    assert matcher.translate("") == ""
+
+
+def test_dictionary_matcher_does_not_rescan_replacements(addon):
+    matcher = addon.DictionaryMatcher({"腕": "親", "親": "parent"})
+    assert matcher.translate("腕親") == "親parent"
+
+
+def write_overlay(directory, name, entries):
+    (directory / name).write_text(json.dumps(entries, ensure_ascii=False), encoding="utf-8")
+
+
+def test_later_overlay_files_win(addon, tmp_path):
+    write_overlay(tmp_path, "10_base.json", {"ネクタイ": "tie", "腕": "upper_arm"})
+    write_overlay(tmp_path, "20_team.json", {"ネクタイ": "necktie"})
+    (tmp_path / "notes.txt").write_text("{}", encoding="utf-8")
+    overlays = addon.load_dictionary_overlays(str(tmp_path))
+    assert overlays == [{"ネクタイ": "necktie"}, {"ネクタイ": "tie", "腕": "upper_arm"}]
+
+    dictionary = addon.build_jp_dictionary(overlays)
+    assert dictionary["ネクタイ"] == "necktie"
+    # Overlays win over the built-in terms
+    assert dictionary["腕"] == "upper_arm"
+    assert addon.build_jp_dictionary()["腕"] == "arm"
+
+
+def test_broken_overlay_is_skipped(addon, tmp_path):
+    write_overlay(tmp_path, "a.json", {"ネクタイ": "tie"})
+    (tmp_path / "b.json").write_text("[1, 2", encoding="utf-8")
+    assert addon.load_dictionary_overlays(str(tmp_path)) == [{"ネクタイ": "tie"}]
+    assert addon.load_dictionary_overlays(str(tmp_path / "missing")) == []
+
+
+def test_width_variants_share_one_key(addon):
+    dictionary = addon.build_jp_dictionary()
+    assert "ｾﾝﾀｰ" not in dictionary
+    assert dictionary["センター"] == "center"
+    # A half-width overlay key overrides the full-width built-in entry
+    assert addon.build_jp_dictionary([{"ｾﾝﾀｰ": "middle"}])["センター"] == "middle"
+    assert addon.translate_static("ｾﾝﾀｰ") == "center"
+
+
+@pytest.mark.parametrize("name, tokens", [
+    ("髪1_12", ("髪", "1_12", "")),
+    ("髪1_1", ("髪", "1_1", "")),
+    ("左髪先２.L", ("左髪先", "2", ".L")),
+    ("スカート前３_１２", ("スカート前", "3_12", "")),
+    ("腕_R", ("腕", "", "_R")),
+    ("123", ("123", "", "")),
+])
+def test_tokenize_bone_names(addon, name, tokens):
+    assert addon.tokenize_bone_names([name])[name] == tokens
+    assert addon.tokenize_bone_name(name) == tokens
+
+
+def test_chain_bones_share_one_online_lookup(addon):
+    stub = addon.StubTranslator({"スカート前": "skirt front"})
+    addon.translation_cache = addon.TranslationCache()
+    service = addon.TranslationService.for_backend(stub)
+    chain = ["スカート前%d_%d" % (row, bone) for row in (1, 2, 3) for bone in range(1, 13)] + ["スカート前３_１２"]
+    translations = addon.translate_bone_names(chain, translator=service)
+    service.close()
+    assert stub.calls == 1
+    assert translations["スカート前1_1"] == "skirtfront1_1"
+    assert translations["スカート前３_１２"] == "skirtfront3_12"
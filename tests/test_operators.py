@@ -0,0 +1,29 @@
+from types import SimpleNamespace
+
+
+class FinishedThread:
+    def is_alive(self):
+        return False
+
+
+def test_modal_planning_error_releases_the_run(addon, monkeypatch):
+    operator_class = addon.ARMATURE_OT_translate_jp_bones
+    operator = operator_class()
+    reports, finished = [], []
+    operator.report = lambda level, message: reports.append((level, message))
+    operator.finish = lambda context: finished.append(context)
+
+    def plan_targets(props, translations):
+        raise RuntimeError("bone vanished")
+
+    operator.plan_targets = plan_targets
+    operator._targets = []
+    operator._thread = FinishedThread()
+    operator._result = {'translations': {}}
+    operator._planned = False
+    monkeypatch.setattr(addon, "bpy", SimpleNamespace(data=SimpleNamespace(objects={})))
+
+    context = SimpleNamespace(scene=SimpleNamespace(bone_renamer=SimpleNamespace()))
+    assert operator.modal(context, SimpleNamespace(type='TIMER')) == {'CANCELLED'}
+    assert finished == [context]
+    assert reports[0][0] == {'ERROR'} and "bone vanished" in reports[0][1]
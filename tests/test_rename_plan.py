@@ -0,0 +1,216 @@
+from types import SimpleNamespace
+
+import pytest
+
+
+class FakeBone:
+    """Bone whose name setter behaves like Blender's: truncates to 63 bytes and suffixes duplicates"""
+    def __init__(self, bones, name):
+        self._bones = bones
+        self._name = name
+
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        if value in self._bones.refuse:
+            raise RuntimeError(f"refusing {value}")
+        value = value.encode("utf-8")[:63].decode("utf-8", errors="ignore")
+        if any(bone is not self and bone.name == value for bone in self._bones.bones):
+            value += ".001"
+        self._name = value
+
+
+class FakeBones:
+    """Bone collection indexable by name, like armature.data.bones"""
+    def __init__(self, names, refuse=()):
+        self.refuse = set(refuse)
+        self.bones = [FakeBone(self, name) for name in names]
+
+    def __getitem__(self, name):
+        for bone in self.bones:
+            if bone.name == name:
+                return bone
+        raise KeyError(name)
+
+    def __iter__(self):
+        return iter(self.bones)
+
+    def get(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            return None
+
+    def names(self):
+        return [bone.name for bone in self.bones]
+
+
+def test_long_targets_are_truncated_at_a_character_boundary(addon):
+    long_name = "腕" * 30  # 90 bytes
+    plan = addon.plan_renames(["a", "b"], {"a": long_name, "b": long_name})
+    first, second = plan.renames["a"], plan.renames["b"]
+    assert len(first.encode("utf-8")) <= 63 and long_name.startswith(first)
+    assert second.endswith(".001") and len(second.encode("utf-8")) <= 63
+
+    bones = FakeBones(["a", "b"])
+    plan.apply(bones)
+    assert bones.names() == [first, second]
+
+
+@pytest.mark.parametrize("names, requested, result", [
+    (["a", "b"], {"a": "b", "b": "a"}, ["b", "a"]),
+    (["a", "b", "c"], {"a": "b", "b": "c", "c": "a"}, ["b", "c", "a"]),
+    (["a", "b", "c"], {"a": "b", "b": "c"}, ["b", "c.001", "c"]),
+    (["a", "b", "c", "d"], {"a": "b", "b": "a", "c": "d", "d": "c"}, ["b", "a", "d", "c"]),
+])
+def test_swaps_chains_and_cycles(addon, names, requested, result):
+    plan = addon.plan_renames(names, requested)
+    bones = FakeBones(names)
+    assert plan.apply(bones) == len(plan.steps)
+    assert bones.names() == result
+    assert not any(name.startswith("__bone_renamer_tmp_") for name in bones.names())
+
+
+def test_cycles_pass_through_a_temporary_name(addon):
+    plan = addon.plan_renames(["a", "b"], {"a": "b", "b": "a"})
+    assert len(plan.steps) == 3
+    assert any(new.startswith("__bone_renamer_tmp_") for _, new in plan.steps)
+
+
+def test_taken_targets_get_a_suffix(addon):
+    plan = addon.plan_renames(["a", "b", "arm"], {"a": "arm", "b": "arm"})
+    assert plan.renames == {"a": "arm.001", "b": "arm.002"}
+    assert [wanted for _, wanted, _ in plan.conflicts] == ["arm", "arm"]
+
+
+def test_failed_step_rolls_back_the_plan(addon):
+    plan = addon.plan_renames(["a", "b", "c"], {"a": "p", "b": "q", "c": "r"})
+    bones = FakeBones(["a", "b", "c"], refuse={"r"})
+    with pytest.raises(RuntimeError):
+        plan.apply(bones)
+    assert bones.names() == ["a", "b", "c"]
+
+
+def test_name_changed_by_blender_is_an_error(addon):
+    plan = addon.RenamePlan({"a": "b"}, [("a", "b")], [])
+    bones = FakeBones(["a", "b"])  # A plan that ignores a taken name makes Blender add a suffix
+    with pytest.raises(RuntimeError, match="Blender used"):
+        plan.apply(bones)
+    assert bones.names() == ["a", "b"]
+
+
+def test_chunked_apply_and_rollback_of_a_cycle(addon):
+    plan = addon.plan_renames(["a", "b", "c"], {"a": "b", "b": "c", "c": "a"})
+    bones = FakeBones(["a", "b", "c"])
+    assert plan.apply(bones, 0, 2) == 2
+    assert plan.apply(bones, 2) == len(plan.steps)
+    plan.rollback(bones, len(plan.steps))
+    assert bones.names() == ["a", "b", "c"]
+
+
+def test_compose_renames(addon):
+    assert addon.compose_renames({"a": "b"}, {"b": "c"}) == {"a": "c"}
+    assert addon.compose_renames({"a": "b"}, {"b": "a"}) == {}
+    assert addon.compose_renames({"a": "b", "b": "a"}, {"a": "x"}) == {"a": "b", "b": "x"}
+    assert addon.compose_renames({"a": "b"}, {"c": "d"}) == {"a": "b", "c": "d"}
+
+
+class FakeArmatureData(dict):
+    __hash__ = object.__hash__  # Blender IDs are hashable
+
+    def __init__(self, bones):
+        super().__init__()
+        self.bones = bones
+
+
+class FakeArmature:
+    type = "ARMATURE"
+    animation_data = None
+    pose = None
+
+    def __init__(self, name, bones):
+        self.name = name
+        self.data = FakeArmatureData(bones)
+        self.constraints = []
+
+
+def test_failed_armature_undoes_every_armature(addon):
+    first = FakeArmature("first", FakeBones(["a", "b"]))
+    second = FakeArmature("second", FakeBones(["a", "b"], refuse={"B"}))
+    plans = {armature.name: addon.plan_renames(["a", "b"], {"a": "A", "b": "B"}) for armature in (first, second)}
+
+    try:
+        addon.apply_rename_plans([first, second], plans, update_references=False)
+    except RuntimeError:
+        pass
+    else:
+        raise AssertionError("the refused name should fail the transaction")
+    assert first.data.bones.names() == ["a", "b"]
+    assert second.data.bones.names() == ["a", "b"]
+    assert addon.RENAME_MAP_PROP not in first.data
+
+
+def test_applied_plans_are_remembered(addon):
+    armature = FakeArmature("rig", FakeBones(["a", "b"]))
+    addon.apply_rename_plans([armature], {"rig": addon.plan_renames(["a", "b"], {"a": "b", "b": "a"})}, False)
+    assert armature.data.bones.names() == ["b", "a"]
+    assert addon.stored_rename_map(armature) == {"a": "b", "b": "a"}
+
+
+class FakeAction:
+    id_root = "OBJECT"
+
+    def __init__(self, *paths):
+        self.fcurves = [SimpleNamespace(data_path=path) for path in paths]
+        self.groups = []
+
+
+def test_sweep_skips_actions_of_other_rigs(addon, monkeypatch):
+    rig = FakeArmature("rig", FakeBones(["a", "b"]))
+    own = FakeAction('pose.bones["a"].location', 'pose.bones["b"].rotation_euler')
+    other = FakeAction('pose.bones["a"].location', 'pose.bones["tail"].location')
+    data = SimpleNamespace(objects=[rig], actions=[own, other], armatures=[], meshes=[], shape_keys=[])
+    monkeypatch.setattr(addon, "bpy", SimpleNamespace(data=data))
+
+    sweep = addon.BoneReferenceSweep(rig, {"a": "b", "b": "a"})
+    sweep.apply()
+    assert [fcurve.data_path for fcurve in own.fcurves] == ['pose.bones["b"].location', 'pose.bones["a"].rotation_euler']
+    assert other.fcurves[0].data_path == 'pose.bones["a"].location'
+
+    sweep.undo()
+    assert own.fcurves[0].data_path == 'pose.bones["a"].location'
+
+
+@pytest.mark.parametrize("extension", [".json", ".csv"])
+def test_rename_map_round_trip(addon, tmp_path, extension):
+    path = str(tmp_path / f"map{extension}")
+    renames = {"左腕": "arm_L", "a,\"b\"": "c\nd", "頭": "head"}
+    addon.write_rename_map(path, renames, armature="rig")
+    assert addon.read_rename_map(path) == renames
+
+
+@pytest.mark.parametrize("content", [
+    '{"format": "bone_renamer_map", "version": 1, "renames": ["a", "b"]}',
+    '{"format": "bone_renamer_map", "version": 1, "renames": {"a": null}}',
+    '{"format": "bone_renamer_map", "version": 99, "renames": {}}',
+    '{"format": "bone_renamer_map", "version": "x", "renames": {}}',
+    '{"format": "other", "renames": {}}',
+    '[]',
+], ids=["list", "null name", "newer", "bad version", "other format", "not an object"])
+def test_malformed_rename_maps_raise_value_error(addon, tmp_path, content):
+    path = tmp_path / "map.json"
+    path.write_text(content, encoding="utf-8")
+    with pytest.raises(ValueError):
+        addon.read_rename_map(str(path))
+
+
+def test_malformed_map_is_reported_by_the_cli(addon, tmp_path, capsys):
+    path = tmp_path / "map.json"
+    path.write_text('{"format": "bone_renamer_map", "version": 1, "renames": []}', encoding="utf-8")
+    names = tmp_path / "names.txt"
+    names.write_text("左腕\n", encoding="utf-8")
+    assert addon.main([str(names), "--apply-map", str(path)]) == 1
+    assert "Could not read rename map" in capsys.readouterr().err
@@ -0,0 +1,237 @@
+import threading
+import time
+
+import pytest
+
+
+def test_mirror_pairs(addon):
+    stems = ["左腕", "右腕", "右だけ", "左スカート前", "右スカート前", "頭"]
+    assert addon.mirror_pairs(stems) == {"右腕": "左腕", "右スカート前": "左スカート前"}
+
+
+@pytest.mark.parametrize("text, mirrored", [
+    ("Left eye", "Right eye"),
+    ("leftarm", "rightarm"),
+    ("Left eye bright", "Right eye bright"),
+    ("arm_L", "arm_R"),
+    ("LEFT LEG", "RIGHT LEG"),
+    ("左スカート", "右スカート"),
+    ("bright eye", ""),
+    ("eye leftover", ""),
+])
+def test_mirror_translation(addon, text, mirrored):
+    assert addon.mirror_translation(text) == mirrored
+
+
+def offline_service(addon, answers):
+    stub = addon.StubTranslator(answers)
+    addon.translation_cache = addon.TranslationCache()
+    return stub, addon.TranslationService.for_backend(stub)
+
+
+def test_right_side_is_derived_from_the_left(addon):
+    stub, service = offline_service(addon, {"左目光": "Left eye bright", "右目光": "should not be asked"})
+    translations = addon.translate_bone_names(["左目光", "右目光"], translator=service)
+    service.close()
+    assert translations == {"左目光": "lefteyebright", "右目光": "righteyebright"}
+    assert stub.calls == 1
+
+
+def test_unsafe_side_markers_fall_back_to_translating_the_right_side(addon):
+    stub, service = offline_service(addon, {"左目光": "eye bright", "右目光": "eye light"})
+    translations = addon.translate_bone_names(["左目光", "右目光"], translator=service)
+    service.close()
+    assert translations == {"左目光": "eyebright", "右目光": "eyelight"}
+    assert stub.calls == 2
+
+
+def test_side_suffixes(addon):
+    translations = addon.translate_bone_names(["左腕", "右腕", "腕_l", "髪1_1"], use_online=False, side_suffixes=True)
+    assert translations == {"左腕": "arm.L", "右腕": "arm.R", "腕_l": "arm.L", "髪1_1": "hair1_1"}
+
+
+def test_cache_hits_are_reported_apart_from_online_translations(addon):
+    stub, service = offline_service(addon, {"髪": "hair"})
+    first, second = addon.TranslationMetrics(), addon.TranslationMetrics()
+    addon.translate_bone_names(["髪1_1"], translator=service, metrics=first)
+    addon.translate_bone_names(["髪1_1"], translator=service, metrics=second)
+    service.close()
+    assert first.sources == {"髪1_1": "online"}
+    assert second.sources == {"髪1_1": "cache"}
+    assert first.report()["network"]["text_bytes"] == len("髪".encode("utf-8"))
+    assert stub.calls == 1
+
+
+def test_vocabulary_loads_once_across_threads(addon, monkeypatch):
+    calls = []
+    real_open = addon.open_vocabulary
+
+    def slow_open(*args):
+        calls.append(args)
+        release.wait(1)
+        return real_open(*args)
+
+    monkeypatch.setattr(addon, "open_vocabulary", slow_open)
+    monkeypatch.setattr(addon, "vocabulary", None)
+    monkeypatch.setattr(addon, "jp_matcher", None)
+    release = threading.Event()
+    threads = [threading.Thread(target=addon.get_jp_matcher) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1
+    assert addon.get_vocabulary() is not None
+
+
+def test_failed_texts_are_remembered_within_maxsize(addon):
+    stub = addon.StubTranslator()
+    service = addon.TranslationService(lambda timeout: stub, name="stub", maxsize=2)
+    for text in ("一", "二", "三"):
+        assert service.translate_text(text) is None
+    assert len(service._failed) == 2
+    calls = stub.calls
+    service.translate_text("三")
+    assert stub.calls == calls and service.negative_hits == 1
+    service.translate_text("一")
+    assert stub.calls == calls + 1
+
+
+class FailingTranslator:
+    name = "failing"
+
+    def translate(self, text, src="ja", dest="en"):
+        raise ConnectionError("offline")
+
+    def close(self):
+        pass
+
+
+def test_failed_seconds_exclude_backoff(addon, monkeypatch):
+    slept = []
+    monotonic = addon.time.monotonic
+    # Sleeping only moves the clock on
+    monkeypatch.setattr(addon.time, "sleep", slept.append)
+    monkeypatch.setattr(addon.time, "monotonic", lambda: monotonic() + sum(slept))
+    monkeypatch.setattr(addon.random, "uniform", lambda low, high: high)
+    service = addon.TranslationService(lambda timeout: FailingTranslator(), max_retries=2, backoff=10.0)
+    assert service.translate_text("腕") is None
+    assert service.failed_calls == 3 and slept == [10.0, 20.0]
+    assert service.failed_seconds < 10.0
+
+
+class TimedTranslator:
+    name = "timed"
+
+    def __init__(self, timeout, on_translate=None):
+        self.timeout = timeout
+        self.on_translate = on_translate
+        self.closed = False
+
+    def translate(self, text, src="ja", dest="en"):
+        if self.on_translate:
+            self.on_translate()
+        return "arm"
+
+    def close(self):
+        self.closed = True
+
+
+def test_clients_in_use_are_dropped_after_a_timeout_change(addon):
+    created = []
+
+    def factory(timeout):
+        created.append(TimedTranslator(timeout, lambda: service.set_timeout(5.0) if len(created) == 1 else None))
+        return created[-1]
+
+    service = addon.TranslationService(factory, name="timed")
+    service.translate_text("腕")
+    assert created[0].closed and service.stats()["clients"] == 0
+    service.translate_text("脚")
+    assert [client.timeout for client in created] == [2.0, 5.0]
+    assert service._idle == [(created[1], 5.0)]
+
+
+class BlockingTranslator:
+    """Answers texts at once, except those in `slow`, which wait until released"""
+    name = "blocking"
+
+    def __init__(self, slow=(), fail=()):
+        self.slow = set(slow)
+        self.fail = set(fail)
+        self.release = threading.Event()
+        self.timeouts = []
+
+    def translate(self, text, src="ja", dest="en"):
+        if text in self.fail:
+            raise ConnectionError("offline")
+        if text in self.slow:
+            self.release.wait(5)
+        return f"en {text}"
+
+    def close(self):
+        pass
+
+
+def blocking_service(addon, backend, **options):
+    def factory(timeout):
+        backend.timeouts.append(timeout)
+        return backend
+    return addon.TranslationService(factory, name=backend.name, max_retries=0, **options)
+
+
+def test_requests_use_the_given_timeout(addon):
+    backend = BlockingTranslator()
+    service = blocking_service(addon, backend)
+    results = addon.fetch_online_translations(["腕", "脚"], service, timeout=0.5, cache=addon.TranslationCache())
+    assert results == {"腕": "en 腕", "脚": "en 脚"}
+    assert backend.timeouts and set(backend.timeouts) == {0.5}
+
+
+def test_slow_requests_are_abandoned_at_the_deadline(addon):
+    backend = BlockingTranslator(slow={"髪"})
+    service = blocking_service(addon, backend)
+    metrics = addon.TranslationMetrics()
+    started = time.monotonic()
+    try:
+        results = addon.fetch_online_translations(["腕", "髪", "脚"], service, timeout=0.2, max_workers=4,
+                                                  cache=addon.TranslationCache(), metrics=metrics)
+    finally:
+        backend.release.set()
+    assert time.monotonic() - started < 1.0
+    assert results == {"腕": "en 腕", "脚": "en 脚"}
+    assert metrics.counters["abandoned"] == 1
+
+
+def test_deadline_allows_one_timeout_per_wave(addon):
+    backend = addon.StubTranslator({text: text for text in "一二三四五六"}, delay=0.05)
+    results = addon.fetch_online_translations(list("一二三四五六"), backend, timeout=0.2, max_workers=2,
+                                              cache=addon.TranslationCache())
+    assert len(results) == 6  # 0.15s of requests per worker, within three waves of 0.2s
+
+
+def test_cancel_abandons_outstanding_requests(addon):
+    backend = BlockingTranslator(slow={"腕", "脚"})
+    service = blocking_service(addon, backend)
+    cancel = threading.Event()
+    threading.Timer(0.1, cancel.set).start()
+    started = time.monotonic()
+    try:
+        results = addon.fetch_online_translations(["腕", "脚"], service, timeout=5.0,
+                                                  cache=addon.TranslationCache(), cancel=cancel)
+    finally:
+        backend.release.set()
+    assert results == {}
+    assert time.monotonic() - started < 1.0
+
+
+def test_failed_requests_are_left_out_and_results_cached(addon):
+    backend = BlockingTranslator(fail={"脚"})
+    cache = addon.TranslationCache()
+    cached = set()
+    results = addon.fetch_online_translations(["腕", "脚"], blocking_service(addon, backend), cache=cache)
+    assert results == {"腕": "en 腕"}
+    again = addon.fetch_online_translations(["腕"], blocking_service(addon, BlockingTranslator(fail={"腕"})),
+                                            cache=cache, cached=cached)
+    assert again == {"腕": "en 腕"} and cached == {"腕"}
@@ -0,0 +1,74 @@
+import pytest
+
+
+@pytest.fixture
+def built(addon):
+    return addon.open_vocabulary()
+
+
+def test_round_trip(addon, built, tmp_path):
+    path = str(tmp_path / "vocabulary.bin")
+    built.save(path)
+    loaded = addon.Vocabulary.load(path)
+    assert loaded.formats == built.formats
+    assert loaded.digest == built.digest
+    assert list(loaded.dictionary_items()) == list(built.dictionary_items())
+    for key in built.formats:
+        assert loaded.rows(key) == built.rows(key)
+    assert loaded.convert(["左腕", "右足"], "mmd_japanese", "mmd_english") == \
+        built.convert(["左腕", "右足"], "mmd_japanese", "mmd_english")
+
+
+def test_lookups_read_the_mapped_file(addon, built, tmp_path):
+    path = str(tmp_path / "vocabulary.bin")
+    built.save(path)
+    loaded = addon.Vocabulary.load(path)
+    assert isinstance(loaded.orders["mmd_english"], memoryview) and isinstance(loaded.trie[0], memoryview)
+    for key in built.formats:
+        for name, row in built.rows(key).items():
+            assert loaded.find(key, name) == row
+        assert loaded.find(key, "no such bone") == -1
+    assert loaded.lookup("左腕", "mmd_japanese", "mmd_english") == "arm_L"
+    assert loaded.lookup("左親指１", "mmd_japanese", "mmd_english") == "thumb1_L"
+    assert loaded.lookup("左親指１", "mmd_japanese", "mmd_english", include_fingers=False) == ""
+
+    reference = addon.DictionaryMatcher(dict(built.dictionary_items()))
+    matcher = loaded.dictionary_matcher()
+    for text in ["左腕", "前髪1", "スカート前", "右ひじ捩", "未知の骨", ""]:
+        assert matcher.translate(text) == reference.translate(text)
+
+
+def test_open_reuses_a_current_file(addon, tmp_path, monkeypatch):
+    path = str(tmp_path / "vocabulary.bin")
+    addon.open_vocabulary(path=path)
+    monkeypatch.setattr(addon.Vocabulary, "build", None)  # Building again would fail
+    assert len(addon.open_vocabulary(path=path)) > 0
+
+
+@pytest.mark.parametrize("damage", [
+    lambda data: b"",
+    lambda data: data[:20],
+    lambda data: data[:-1],
+    lambda data: b"NOTVOCAB" + data[8:],
+    lambda data: data[:8] + (99).to_bytes(4, "little") + data[12:],
+    lambda data: data[:-1] + b"\0\0",
+], ids=["empty", "header", "truncated", "magic", "version", "trailing"])
+def test_damaged_file_is_rejected_and_rebuilt(addon, built, tmp_path, damage, capsys):
+    path = tmp_path / "vocabulary.bin"
+    built.save(str(path))
+    path.write_bytes(damage(path.read_bytes()))
+    with pytest.raises(ValueError):
+        addon.Vocabulary.load(str(path))
+
+    rebuilt = addon.open_vocabulary(path=str(path))
+    assert "Rebuilding vocabulary" in capsys.readouterr().out
+    assert list(rebuilt.dictionary_items()) == list(built.dictionary_items())
+    assert addon.Vocabulary.load(str(path)).digest == built.digest
+
+
+def test_stale_digest_is_rebuilt(addon, built, tmp_path):
+    path = str(tmp_path / "vocabulary.bin")
+    tables = {"body": addon.BONE_NAMES, "fingers": addon.FINGER_BONES}
+    addon.Vocabulary.build(tables, dict(built.dictionary_items()), b"old").save(path)
+    assert addon.open_vocabulary(path=path).digest == built.digest
+    assert addon.Vocabulary.load(path).digest == built.digest